@@ -118,3 +118,26 @@ USE_TZ = True
 # https://docs.djangoproject.com/en/2.0/howto/static-files/
 
 STATIC_URL = '/static/'
+
+
+# Analysis of submitted algorithms
+
+# Number of pre-built virtual environments per process
+SANDBOX_POOL_SIZE = 2
+
+# Build the environments when the application is loaded instead of on the first run. Leave it
+# off for servers loading the application before forking the workers (e.g. gunicorn --preload)
+SANDBOX_WARM_UP = False
+
+# Number of analysis results kept in memory per process
+RESULT_CACHE_SIZE = 1024
+
+# Number of new training sets before the model is retrained
+RETRAIN_THRESHOLD = 10
+
+# Number of worker processes and maximum number of programs for the batch analysis
+BATCH_WORKERS = 2
+BATCH_MAX_SIZE = 500
+
+# Number of sessions per process whose parsed blocks are kept for parsing while typing
+LIVE_PARSE_SESSIONS = 100
@@ -14,3 +14,13 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "AlgoBooster.settings")
 
 application = get_wsgi_application()
+
+# Build the sandbox environments once, before the first request arrives, if configured
+from django.conf import settings
+from ab_ui.ab_main import sandbox_pool
+if getattr(settings, 'SANDBOX_WARM_UP', False):
+    sandbox_pool.warmUpPool()
+
+# Process training jobs in the background, including jobs queued before a restart
+from ab_ui.ab_main import training_queue
+training_queue.getWorker()
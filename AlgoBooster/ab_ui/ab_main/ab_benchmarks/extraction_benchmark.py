@@ -0,0 +1,83 @@
+""" Benchmark of the static attribute extraction on generated programs of growing size.
+The time per node should stay about the same, as the tree is only traversed once.
+
+Run from the project directory: python -m ab_ui.ab_main.ab_benchmarks.extraction_benchmark
+"""
+
+import ast
+import os
+import time
+
+import django
+
+
+BLOCK = """
+def f_{0}(n, values):
+    if n <= 1:
+        return n
+    found_{0} = [1, 2, 3]
+    k = 0
+    while True:
+        k = k + 1
+        if k >= len(values):
+            break
+    for i in range(n):
+        for j in range(i):
+            found_{0} = found_{0} + [j]
+    return f_{0}(n / 2, values) + f_{0}(n / 2, values)
+
+i_{0} = 100
+while True:
+    i_{0} = i_{0} / 2
+    if i_{0} < 1:
+        break
+"""
+SIZES = [8, 16, 32, 64, 128, 256] # number of blocks per program
+REPEAT = 3 # runs per program, the fastest one is taken
+
+def generateProgram(blocks):
+    """ Returns a program consisting of the given number of blocks with functions and loops.
+
+    Keyword arguments:
+    blocks -- the number of blocks
+    """
+    return "".join(BLOCK.format(i) for i in range(blocks))
+
+def extractStaticAttributes(root):
+    """ Extracts all attributes that do not need the execution of the program,
+    and the complexity as if the program terminated normally.
+
+    Keyword arguments:
+    root -- the root node of the abstract syntax tree
+    """
+    from ab_ui.ab_main import ast_extraction
+
+    extraction = ast_extraction.AttributeFinder(True)
+    extraction.results = {'ProgTerminate': 0}
+    for attr_class in extraction.attr_classes.values():
+        if isinstance(attr_class, ast_extraction.StaticAttribute):
+            extraction.results[attr_class.__class__.__name__] = attr_class.getAttribute(root)
+    extraction.results['Complexity'] = extraction.getComplexity(root)
+    return extraction.results
+
+def main():
+    """ Runs the benchmark and prints the time per program size. """
+
+    print("%8s %8s %12s %12s" % ("blocks", "nodes", "time [ms]", "us per node"))
+    for blocks in SIZES:
+        root = ast.parse(generateProgram(blocks))
+        nodes = sum(1 for _ in ast.walk(root))
+        best = None
+        for _ in range(REPEAT):
+            start = time.perf_counter()
+            extractStaticAttributes(root)
+            duration = time.perf_counter() - start
+            if best is None or duration < best:
+                best = duration
+        print("%8d %8d %12.2f %12.2f" % (blocks, nodes, best * 1000, best * 1000000 / nodes))
+
+
+if __name__ == "__main__":
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "AlgoBooster.settings")
+    django.setup()
+    main()
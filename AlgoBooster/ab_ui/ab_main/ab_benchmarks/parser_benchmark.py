@@ -0,0 +1,56 @@
+""" Benchmark of the translation of pseudo code to Python on generated programs of growing size.
+The time per statement should stay about the same, as the Python code is joined only once.
+
+Run from the project directory: python -m ab_ui.ab_main.ab_benchmarks.parser_benchmark
+"""
+
+import time
+
+from ab_ui.ab_main.ps2py_parser import ps2py_yacc
+
+
+BLOCK = """
+values_{0} <- [1, 2, 3]
+k_{0} <- 0
+repeat
+    k_{0} <- k_{0} + 1
+until k_{0} >= len(values_{0})
+for i in 1 to k_{0} by 1 do
+    values_{0} <- values_{0} + [i]
+endfor
+total_{0} <- k_{0} * 2 + 1
+"""
+STATEMENTS = 8 # number of statements per block
+SIZES = [625, 1250, 2500, 5000] # number of blocks per program
+REPEAT = 3 # runs per program, the fastest one is taken
+
+def generateProgram(blocks):
+    """ Returns a pseudo code consisting of the given number of blocks with assignments and loops.
+
+    Keyword arguments:
+    blocks -- the number of blocks
+    """
+    return "".join(BLOCK.format(i) for i in range(blocks))
+
+def main():
+    """ Runs the benchmark and prints the time per program size. """
+
+    print("%8s %10s %12s %16s" % ("blocks", "statements", "time [ms]", "us per statement"))
+    for blocks in SIZES:
+        program = generateProgram(blocks)
+        statements = blocks * STATEMENTS
+        best = None
+        for _ in range(REPEAT):
+            start = time.perf_counter()
+            result = ps2py_yacc.parse_ps2py(program)
+            duration = time.perf_counter() - start
+            if best is None or duration < best:
+                best = duration
+        if result['result'] is None:
+            print(result['errors'])
+            return
+        print("%8d %10d %12.2f %16.2f" % (blocks, statements, best * 1000, best * 1000000 / statements))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+""" Benchmark of the import of the pseudo code parser, as done by every new worker process.
+The libraries are imported before the time is taken, so only the loading of the parser
+modules and their tables is measured.
+
+Run from the project directory: python -m ab_ui.ab_main.ab_benchmarks.startup_benchmark
+"""
+
+import statistics
+import subprocess
+import sys
+
+
+PROCESSES = 20 # new processes importing the parser
+MEASURE = """
+import ast, inspect, pickle, threading, typing
+import ply.lex, ply.yacc
+import time
+start = time.perf_counter()
+import ab_ui.ab_main.ps2py_parser.ps2py_yacc
+print(time.perf_counter() - start)
+"""
+
+def measureImport():
+    """ Returns the seconds a new process needs to import the parser. """
+
+    output = subprocess.run([sys.executable, "-c", MEASURE], capture_output=True, text=True, check=True).stdout
+    return float(output.strip().splitlines()[-1])
+
+def main():
+    """ Runs the benchmark and prints the import times. """
+
+    times = [measureImport() for _ in range(PROCESSES)]
+    print("%10s %12s %12s %12s" % ("processes", "median [ms]", "min [ms]", "max [ms]"))
+    print("%10d %12.2f %12.2f %12.2f" % (PROCESSES, statistics.median(times) * 1000, min(times) * 1000, max(times) * 1000))
+
+
+if __name__ == "__main__":
+    main()
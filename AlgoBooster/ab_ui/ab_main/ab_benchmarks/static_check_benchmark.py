@@ -0,0 +1,79 @@
+""" Benchmark of the static analysis of the generated code, native checks against pylint, on
+generated programs of growing size. Both report the same messages, see test_static_check.
+
+Run from the project directory: python -m ab_ui.ab_main.ab_benchmarks.static_check_benchmark
+"""
+
+import time
+
+from ab_ui.ab_main import pylint_engine
+from ab_ui.ab_main import static_check
+from ab_ui.ab_main.ps2py_parser import ps2py_ast
+from ab_ui.ab_main.ps2py_parser import ps2py_yacc
+
+
+BLOCK = """
+procedure add_{0}(values, k)
+    if k > len(values) then
+        return values
+    endif
+    unused_{0} <- k
+    return values + [k]
+endproc
+values_{0} <- [1, 2, 3]
+for i in 1 to 10 by 1 do
+    values_{0} <- add_{0}(values_{0}, i)
+endfor
+total_{0} <- values_{0}[i] + missing_{0}
+"""
+STATEMENTS = 10 # number of statements per block
+SIZES = [10, 50, 250] # number of blocks per program
+REPEAT = 3 # runs per program, the fastest one is taken
+MSG_IDS = ['E0102', 'E0108', 'E0601', 'E0602', 'E1111', 'E1120', 'E1121', 'E1126', 'E1128',
+    'E1133', 'R1705', 'W0101', 'W0122', 'W0125', 'W0612', 'W0631'] # the messages of the code checker
+
+def generateProgram(blocks):
+    """ Returns the Python code of a pseudo code consisting of the given number of blocks with
+    procedures, loops and undefined names, in a main function like the code checker gets it.
+
+    Keyword arguments:
+    blocks -- the number of blocks
+    """
+    root = ps2py_yacc.parse_ps2py("".join(BLOCK.format(i) for i in range(blocks)), True).get('result')
+    lines = ps2py_ast.toPython(root).split("\n")
+    return "def main_1():\n" + "\n".join("\t" + line for line in lines) + "\n"
+
+def measure(checker, py_code):
+    """ Returns the fastest time of the check of the code and the number of found messages.
+
+    Keyword arguments:
+    checker -- the StaticChecker or PylintEngine
+    py_code -- the Python code to check
+    """
+    best = None
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        messages = checker.check(py_code, "output_codebefore.py")
+        duration = time.perf_counter() - start
+        if best is None or duration < best:
+            best = duration
+    return (best, len(messages))
+
+def main():
+    """ Runs the benchmark and prints the times per program size. """
+
+    engine = pylint_engine.getEngine(MSG_IDS)
+    checker = static_check.StaticChecker(MSG_IDS)
+    print("%8s %10s %10s %13s %13s %9s" % ("blocks", "statements", "messages", "pylint [ms]", "native [ms]", "speedup"))
+    for blocks in SIZES:
+        py_code = generateProgram(blocks)
+        (pylint_time, pylint_count) = measure(engine, py_code)
+        (native_time, native_count) = measure(checker, py_code)
+        if pylint_count != native_count:
+            print("Different messages: pylint %d, native %d" % (pylint_count, native_count))
+        print("%8d %10d %10d %13.2f %13.2f %8.1fx" % (blocks, blocks * STATEMENTS, native_count,
+            pylint_time * 1000, native_time * 1000, pylint_time / native_time))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,20 +1,24 @@
 from ab_ui.ab_main.ps2py_parser import ps2py_yacc as parser
+from ab_ui.ab_main.ps2py_parser import ps2py_ast
 from ab_ui.ab_main import pylint_check as statcheck
 from ab_ui.ab_main import ast_extraction as extract
 from ab_ui.ab_main import ab_ml as mlagent
 from ab_ui.ab_main import tip_chooser as tch
+from ab_ui.ab_main import result_cache
 
-import os
+import ast
 import random
-import shutil
+import time
 
 
 # Top level directory
 DATA_DIR = "ab_ui/ab_main/"
-# Temporary directory to delete content from
-TEMP_DIR = DATA_DIR + "temp/" 
+# Directory of the machine learning model
+ML_DIR = DATA_DIR + "ml/"
+# Status message of a training set that was saved without retraining
+TRAIN_SAVED = "Training data was saved."
 
-def trainAB(code, classification):
+def trainAB(code, classification, retrain=True):
     """ Trains the Algobooster machine learning system and
     returns a status message whether training was successful 
     or not, including tips from the static analysis if present.
@@ -22,47 +26,36 @@ def trainAB(code, classification):
     Keyword arguments:
     code -- the input pseudo code to train
     classification -- the class of the code 
+    retrain -- if set to False, the training set is only saved and the model is retrained later by updateAB() (default True)
     """
 
-    # Create temporary directory
-    if not os.path.exists(TEMP_DIR):
-        os.makedirs(TEMP_DIR)
-
     # Default response
     result = "Training was not successful."
 
     if code is None or code == "":
         return result
 
-    # Parse the input
-    parse_result = parser.parse_ps2py(code)
+    # Parse the input to an abstract syntax tree
+    parse_result = parser.parse_ps2py(code, True)
 
     # Set errors as response if there are any
     if parse_result.get('result') is None:
         result = parse_result.get('errors')
         return result
+    root = parse_result.get('result')
 
-
-    # Static code analysis with a few corrections
-    checker = statcheck.CodeChecker(TEMP_DIR)
-    pylint_results = checker.executeCheck(addMain(parse_result.get('result')), "output_codebefore.py", "error_codebefore.log")
-    pylint_results['corrected_code'] = removeMain(pylint_results['corrected_code'])
+    # Static code analysis with a few corrections of the tree
+    checker = statcheck.CodeChecker()
+    pylint_results = checker.executeCheck(addMain(root))
 
     # Set errors as response if there are any
     if pylint_results.get('errors') != "":
         result = "ERROR: " + pylint_results.get('errors') + "\n" + pylint_results.get('tips')
         return result
 
-    # Get code changed by static analysis        
-    res_code = pylint_results.get('corrected_code')
-
-    # Extract attributes for machine learning
-    extraction = extract.AttributeFinder(TEMP_DIR, True) 
-    root = extraction.parseCodeToAST(res_code)
+    # Extract attributes for machine learning from the corrected tree
+    extraction = extract.AttributeFinder(True) 
     attr_list = extraction.extractAttributes(root) 
-    
-    # Delete temporary directory
-    shutil.rmtree(TEMP_DIR, ignore_errors=True)
 
     # Check if attributes were extracted
     if attr_list == "":
@@ -71,15 +64,26 @@ def trainAB(code, classification):
     
     # Start machine learning agent in training mode
     agent = mlagent.Agent(DATA_DIR)
-    result = agent.train(attr_list, classification)  
+    if retrain:
+        result = agent.train(attr_list, classification)  
+    else:
+        agent.addTrainData(attr_list, classification)
+        result = TRAIN_SAVED
 
     result += "\n" + pylint_results.get('tips')
 
     return result
 
+def updateAB():
+    """ Retrains the Algobooster machine learning system if enough training
+    sets were saved since the last training and returns a status message.
+    """
+
+    agent = mlagent.Agent(DATA_DIR)
+    return agent.update()
 
 
-def startAB(code, parse_only=False):
+def startAB(code, parse_only=False, timings=None):
     """ Starts the Algobooster. Returns the parsed code, complexity,
     predicted classification with probability and further tips if all steps
     were successful.
@@ -87,44 +91,63 @@ def startAB(code, parse_only=False):
     Keyword arguments:
     code -- the input pseudo code from the user
     parse_only -- checks if the code should only be parsed to Python (default False)
+    timings -- a dictionary the seconds spent per stage ('parse', 'cache', 'lint', 'extraction', 'prediction') are added to (default None, nothing is measured)
     """
 
-    # Create temporary directory
-    if not os.path.exists(TEMP_DIR):
-        os.makedirs(TEMP_DIR)
-
     # Default response
     result = {'code': 'Could not be parsed.','complexity': "Not calculated yet.",  'classification': 'Not classified yet.', 'probability': '0 %', 'tips' : ""}
 
     if code is None or code == "":
         return result
 
-    # Parse the input and return errors if present
-    parse_result = parser.parse_ps2py(code)
+    # Parse the input to an abstract syntax tree and return errors if present
+    stage_start = time.perf_counter()
+    parse_result = parser.parse_ps2py(code, True)
     if parse_result.get('result') is None:
+        addTiming(timings, 'parse', stage_start)
         result['code'] = parse_result.get('errors')
         return result
 
+    # The tree is passed between the stages; its Python code is only generated for the user and the cache
+    root = parse_result.get('result')
+    py_code = ps2py_ast.toPython(root)
+    stage_start = addTiming(timings, 'parse', stage_start)
+
     if parse_only:
-        result['code'] = parse_result.get('result')
+        result['code'] = py_code
         return result
 
+    # Return the saved result if the same code was already analysed with the current model
+    model_version = mlagent.getRegistry(ML_DIR).readVersion()
+    cache = result_cache.getCache()
+    cache.checkModelVersion(model_version)
+    cache_key = cache.makeKey(py_code, model_version)
+    cached_result = cache.get(cache_key)
+    stage_start = addTiming(timings, 'cache', stage_start)
+    if cached_result is not None:
+        return cached_result
+
     # Static code analysis with a few corrections and creation of first tips
-    checker = statcheck.CodeChecker(TEMP_DIR)
-    pylint_results = checker.executeCheck(addMain(parse_result.get('result')), "output_codebefore.py", "error_codebefore.log")
-    pylint_results['corrected_code'] = removeMain(pylint_results['corrected_code'])
+    checker = statcheck.CodeChecker()
+    pylint_results = checker.executeCheck(addMain(root))
+    stage_start = addTiming(timings, 'lint', stage_start)
 
     # Set errors as response if there are any
     if pylint_results.get('errors') != "":
         result['code'] = "ERROR: " + pylint_results.get('errors') + "\n" + pylint_results.get('tips')
+        cache.put(cache_key, result)
         return result
     
-    result['code'] = pylint_results.get('corrected_code')
+    # Statements were removed from the tree by the static analysis
+    if pylint_results.get('removed') > 0:
+        ps2py_ast.setLines(root)
+        py_code = ps2py_ast.toPython(root)
+
+    result['code'] = py_code
     result['tips'] += pylint_results.get('tips')
 
-    # Extract attributes for machine learning
-    extraction = extract.AttributeFinder(TEMP_DIR) 
-    root = extraction.parseCodeToAST(result['code'])
+    # Extract attributes for machine learning from the corrected tree
+    extraction = extract.AttributeFinder() 
     complex_classes = {
         "4": "O(c^n)", # exponential / faculty
         "3": "O(n^c)", # polynomial
@@ -133,21 +156,19 @@ def startAB(code, parse_only=False):
         "0": "O(c)", # constant
     }
 
-    predObj = extraction.extractAttributes(root)
-
-    # Delete temporary directory
-    shutil.rmtree(TEMP_DIR, ignore_errors=True)
+    features = extraction.extractAttributes(root)
+    stage_start = addTiming(timings, 'extraction', stage_start)
 
-    # Check if attribute extraction was successful
-    if predObj is None:
-        result['code'] + "\nError while extracting attributes."
+    # Check if attribute extraction was successful; a failure is not cached, the next request tries again
+    if features is None:
+        result['code'] += "\nError while extracting attributes."
         return result
 
     result['complexity'] = complex_classes.get(extraction.getComplexity(root))
 
     # Start machine learning agent in prediction mode
     agent = mlagent.Agent(DATA_DIR)
-    classificProb = agent.predict(predObj) 
+    classificProb = agent.predict(features) 
 
     if classificProb is not None:
         # Get right tip for the given class prediction
@@ -155,38 +176,41 @@ def startAB(code, parse_only=False):
         result['classification'] = tipChooser.getClassification()
         result['probability'] = str(classificProb.get('probability')) + " %"
         result['tips'] += tipChooser.getTip()
+    addTiming(timings, 'prediction', stage_start)
 
+    # Results of runs stopped by the timeout or failed in the sandbox may differ next time
+    if extraction.isReproducible(root):
+        cache.put(cache_key, result)
     return result
 
-def addMain(py_code):
-    """ Adds a main function with a random number
-    around the input code so that the static code analysis 
-    can do more checks.
+def addTiming(timings, stage, stage_start):
+    """ Adds the seconds since the start of the stage to the timings, if given,
+    and returns the current time as start of the next stage.
 
     Keyword arguments:
-    py_code -- the parsed Python code to add a main function to
+    timings -- the dictionary of seconds per stage or None
+    stage -- the name of the stage
+    stage_start -- the time the stage started, from time.perf_counter()
     """
 
-    result = "def main_" + randomMainNumber() + "():\n"
-    for line in py_code.splitlines():
-        # adds tabs for valid Python code
-        result += "\t" + line + "\n"
-    return result
+    now = time.perf_counter()
+    if timings is not None:
+        timings[stage] = timings.get(stage, 0) + now - stage_start
+    return now
 
-def removeMain(py_code):
-    """ Deletes the main function that was generated before.
+def addMain(root):
+    """ Returns a tree with a main function with a random number
+    around the statements of the input tree so that the static code analysis
+    can do more checks. Both trees share the list of statements, so
+    statements removed from the new tree are also removed from the input tree.
 
     Keyword arguments:
-    py_code -- the Python code containing a main function
+    root -- the root node of the abstract syntax tree of the parsed code
     """
 
-    result = ""
-    first_line = py_code.splitlines()[0]
-    py_code = py_code.replace(first_line + "\n", "")
-    for line in py_code.splitlines():
-        # removes the tabs inserted before
-        result += line.replace("\t", "", 1) + "\n"
-    return result
+    main = ast.FunctionDef(name="main_" + randomMainNumber(), args=ast.arguments(posonlyargs=[], args=[], vararg=None, kwonlyargs=[], kw_defaults=[], kwarg=None, defaults=[]),
+                        body=root.body, decorator_list=[], returns=None, type_comment=None)
+    return ast.Module(body=[main], type_ignores=[])
 
 def randomMainNumber():
     """ Generates a random number combination with a 
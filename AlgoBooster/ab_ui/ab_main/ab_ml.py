@@ -12,9 +12,191 @@ from sklearn.discriminant_analysis import LinearDiscriminantAnalysis
 from sklearn.naive_bayes import GaussianNB
 from sklearn.svm import SVC
 from sklearn.preprocessing import StandardScaler
+import os
 import pickle
+import tempfile
+import time
+from threading import Lock
+from django.conf import settings
+from django.db import transaction
 from ab_ui.models import TrainData
 
+RETRAIN_THRESHOLD = 10 # default number of new samples before retraining, overridden by settings.RETRAIN_THRESHOLD
+# Columns of the training data, in the order the model is trained with
+TRAIN_COLUMNS = ['rec_count', 'loop_n_depend', 'loop_nested', 'loop_type', 'prog_terminate',
+	'using_non_scalar', 'repeat_values', 'reuse_values', 'complexity', 'classification']
+
+# Registries of the process, one per directory containing model and scaler
+_registries = {}
+_registries_lock = Lock()
+
+class ModelRegistry():
+	""" Class holding the model and standard scaler of a directory in memory. Both are loaded
+	once per process and reloaded only if a training wrote a new version. """
+
+	def __init__(self, prefix):
+		""" Initializes the model registry. Nothing is loaded yet.
+
+		Keyword arguments:
+		self -- the ModelRegistry instance
+		prefix -- the directory containing the model, scaler and version files
+		"""
+		self.__modelFile = prefix + "model.obj"
+		self.__stdscFile = prefix + "stdsc.obj"
+		self.__versionFile = prefix + "version" # written after model and scaler, marks a complete new version
+		self.__loaded = None # tuple of version, model and scaler, swapped as a whole
+		self.__lock = Lock()
+
+	def get(self):
+		""" Returns a tuple of version, model and scaler. The files are only read if
+		their version changed since the last call; model and scaler are None if they
+		could not be loaded.
+
+		Keyword arguments:
+		self -- the ModelRegistry instance
+		"""
+		version = self.readVersion()
+		loaded = self.__loaded
+		if loaded is not None and loaded[0] == version:
+			return loaded
+
+		with self.__lock:
+			# another thread may have loaded this version in the meantime
+			if self.__loaded is not None and self.__loaded[0] == version:
+				return self.__loaded
+			try:
+				with open(self.modelFile, "rb") as opModFile:
+					readModel = pickle.load(opModFile)
+				with open(self.stdscFile, "rb") as opStdscFile:
+					readStdsc = pickle.load(opStdscFile)
+			except IOError as ioe:
+				print("Model or scaler could not be loaded:", ioe)
+				return (version, None, None)
+			self.__loaded = (version, readModel, readStdsc)
+			return self.__loaded
+
+	def publish(self, model, stdsc, train_size=0):
+		""" Saves a new model and scaler and makes them the current version of
+		this and every other process. Returns None if successful, an error message otherwise.
+
+		Keyword arguments:
+		self -- the ModelRegistry instance
+		model -- the trained model
+		stdsc -- the trained standard scaler
+		train_size -- the number of samples in the database the model was trained with (default 0)
+		"""
+		with self.__lock:
+			# Save model and scaler; Note: protocol 4 is latest and most efficient pickle protocol, python>=3.4
+			if not self.writeAtomic(self.modelFile, pickle.dumps(model, protocol=4)):
+				return "Model could not be saved"
+			if not self.writeAtomic(self.stdscFile, pickle.dumps(stdsc, protocol=4)):
+				return "Scaler could not be saved"
+			if not self.writeAtomic(self.versionFile, (str(time.time_ns()) + "\n" + str(train_size)).encode()):
+				return "Model version could not be saved"
+			self.__loaded = (self.readVersion(), model, stdsc)
+		return None
+
+	def readVersion(self):
+		""" Returns the version stamp of the saved model, which changes with every saved
+		version. If no version was saved yet, the stamp of the model file is used.
+
+		Keyword arguments:
+		self -- the ModelRegistry instance
+		"""
+		for filename in (self.versionFile, self.modelFile):
+			try:
+				stat = os.stat(filename)
+			except OSError:
+				continue
+			# replacing a file gives it a new inode, so this is unique even for writes at the same time
+			return str(stat.st_ino) + "-" + str(stat.st_mtime_ns)
+		return None
+
+	def readTrainSize(self):
+		""" Returns the number of samples the saved model was trained with, 0 if unknown.
+
+		Keyword arguments:
+		self -- the ModelRegistry instance
+		"""
+		try:
+			with open(self.versionFile, "r") as opVersionFile:
+				lines = opVersionFile.read().splitlines()
+			return int(lines[1])
+		except (IOError, IndexError, ValueError):
+			return 0
+
+	def writeAtomic(self, filename, content):
+		""" Writes the content to a temporary file and replaces the given file with it,
+		so other processes never read a half-written file. Returns True if successful.
+
+		Keyword arguments:
+		self -- the ModelRegistry instance
+		filename -- the name and path of the file to replace
+		content -- the bytes to write
+		"""
+		try:
+			fd, tmp_name = tempfile.mkstemp(dir=os.path.dirname(filename) or ".")
+			with os.fdopen(fd, "wb") as opFile:
+				opFile.write(content)
+			os.replace(tmp_name, filename)
+		except IOError as ioe:
+			print(filename, "could not be saved:", ioe)
+			return False
+		return True
+
+	# Class helper methods
+
+	def getModelFile(self):
+		""" Returns the model file name and path.
+
+		Keyword arguments:
+		self -- the ModelRegistry instance
+		"""
+		return self.__modelFile
+
+	def getStdscFile(self):
+		""" Returns the standard scaler file name and path.
+
+		Keyword arguments:
+		self -- the ModelRegistry instance
+		"""
+		return self.__stdscFile
+
+	def getVersionFile(self):
+		""" Returns the version file name and path.
+
+		Keyword arguments:
+		self -- the ModelRegistry instance
+		"""
+		return self.__versionFile
+
+	def getVersion(self):
+		""" Returns the version of the model in memory, None if nothing was loaded.
+
+		Keyword arguments:
+		self -- the ModelRegistry instance
+		"""
+		loaded = self.__loaded
+		return None if loaded is None else loaded[0]
+
+	modelFile = property(getModelFile)
+	stdscFile = property(getStdscFile)
+	versionFile = property(getVersionFile)
+	version = property(getVersion)
+
+
+def getRegistry(prefix):
+	""" Returns the model registry of the process for the given directory.
+
+	Keyword arguments:
+	prefix -- the directory containing the model and scaler files
+	"""
+	with _registries_lock:
+		if prefix not in _registries:
+			_registries[prefix] = ModelRegistry(prefix)
+		return _registries[prefix]
+
+
 class Agent():
 	""" Class for the machine learning agent. """
     
@@ -36,25 +218,14 @@ class Agent():
 		self.__stdscFile = self.prefix + "stdsc.obj"
 		self.__stdsc = None
 
-		# load model and standard scaler if possible; if not, do initializing training
-		try:
-			opModFile = open(self.modelFile, "rb")
-			readModel = pickle.load(opModFile)
-			opStdscFile = open(self.stdscFile, "rb")
-			readStdsc = pickle.load(opStdscFile)
-		except IOError as ioe:
-			print("Model or scaler could not be loaded:", ioe)
+		# take model and standard scaler from the registry if possible; if not, do initializing training
+		self.__registry = getRegistry(self.prefix)
+		(self.__version, readModel, readStdsc) = self.registry.get()
+		if readModel is None or readStdsc is None:
 			self.init_train()
 		else:
-			if not(readModel is None):
-				self.model = readModel
-			if not(readStdsc is None):
-				self.stdsc = readStdsc
-			try:
-				opModFile.close()
-				opStdscFile.close()
-			except IOError as ioe:
-				print("Model or scaler file could not be closed:", ioe)
+			self.model = readModel
+			self.stdsc = readStdsc
 	
 
 	def init_train(self):
@@ -75,6 +246,7 @@ class Agent():
 		train_data = dataset.values
 
 		attr_list = {} 
+		new_objs = []
 		for row in train_data:
 			attr_list['RecCount'] = row[0]
 			attr_list['LoopNDepend'] = row[1]
@@ -86,19 +258,51 @@ class Agent():
 			attr_list['ReuseValues'] = row[7]
 			attr_list['Complexity'] = row[8]
 
-			# Save new train data			
+			# Collect new train data			
 			newObj = TrainData()
 			newObj.initAttr(attr_list, row[9])
-			newObj.save()
+			new_objs.append(newObj)
+
+		# Save all train data in one transaction; bulk_create is not possible for the multi-table inherited TrainData
+		with transaction.atomic():
+			for newObj in new_objs:
+				newObj.save()
 		
 		# Do training
 		self.train()
 
 
+	def addTrainData(self, attr_list, classification):
+		""" Adds a new training set to the existing ones without training.
+
+		Keyword arguments:
+		self -- the Agent instance
+		attr_list -- list of extracted attributes of the training data
+		classification -- given classification of the data to train with
+		"""
+		newObj = TrainData()
+		newObj.initAttr(attr_list, classification)
+		newObj.save()
+
+	def update(self, show_outputs=False):
+		""" Trains the machine learning agent if RETRAIN_THRESHOLD new training sets
+		were added since the last training. Returns a status message.
+
+		Keyword arguments:
+		self -- the Agent instance
+		show_outputs -- if set to True, the training will show the output of different steps in the ml training process (default False)
+		"""
+		pending = TrainData.objects.count() - self.registry.readTrainSize()
+		threshold = getattr(settings, 'RETRAIN_THRESHOLD', RETRAIN_THRESHOLD)
+		if pending < threshold:
+			return "Training data was saved. The model will be retrained after " + str(threshold - pending) + " more training sets."
+		return self.train(show_outputs=show_outputs)
+
 	def train(self, attr_list=None, classification=None, show_outputs=False):
 		""" Trains the machine learning agent. If applicable, 
-		adds new training set to existing, chooses the best
-		(new) ml classifier and trains this one.
+		adds new training set to existing and only trains if enough
+		new training sets were collected (see update()). Training chooses
+		the best (new) ml classifier and trains this one.
 
 		Keyword arguments:
 		self -- the Agent instance
@@ -107,16 +311,13 @@ class Agent():
 		show_outputs -- if set to True, the training will show the output of different steps in the ml training process (default False)
 		"""
 			
-		# Add newest training data if existent
+		# Add newest training data if existent; only retrain when enough new training data was collected
 		if classification != None and attr_list != None:
-			newObj = TrainData()
-			newObj.initAttr(attr_list, classification)
-			newObj.save()
+			self.addTrainData(attr_list, classification)
+			return self.update(show_outputs)
 
-		# Get all training data
-		allObjVals = []
-		for obj in TrainData.objects.all():
-			allObjVals.append(obj.getValues().values())
+		# Get all training data, without creating model instances
+		allObjVals = list(TrainData.objects.values_list(*TRAIN_COLUMNS))
 
 		dataset = pandas.DataFrame(allObjVals)
 
@@ -176,25 +377,11 @@ class Agent():
 			prediction = self.model.predict(X_test)
 			self.showTest(y_test, prediction)
 
-		# Save model; Note: protocol 4 is latest and most efficient pickle protocol, python>=3.4
-		try:
-			opFile = open(self.modelFile, "wb")
-			pickle.dump(self.model, opFile, protocol=4)
-			opFile.close()
-		except IOError as ioe:
-			error_msg = "Model could not be saved"
-			print(error_msg, ":", ioe)
-			return error_msg
-
-		# Save standard scaler; also using pickle protocol 4
-		try:
-			opFile = open(self.stdscFile, "wb")
-			pickle.dump(self.stdsc, opFile, protocol=4)
-			opFile.close()
-		except IOError as ioe:
-			error_msg = "Scaler could not be saved"
-			print(error_msg, ":", ioe)
+		# Save model and standard scaler and use them in all processes
+		error_msg = self.registry.publish(self.model, self.stdsc, len(allObjVals))
+		if error_msg is not None:
 			return error_msg
+		self.__version = self.registry.version
 
 		# Show visualization
 		if show_outputs:
@@ -237,17 +424,16 @@ class Agent():
 		# Show visualization
 		plt.show()
 
-	def predict(self, predObj):
-		""" Prediction method for a new object.
+	def predict(self, features):
+		""" Prediction method for a new algorithm.
 
 		Keyword arguments:
 		self -- the Agent instance
-		predObj -- the AlgorithmData object instance to predict the class for
+		features -- the FeatureVector of the extracted attributes to predict the class for
 		"""
 
-		# Get the extracted attributes of the object
-		vals = list(predObj.getValues().values())
-		X_pre = [vals[0:9]]
+		# Get the extracted attributes in the order of the training data
+		X_pre = [list(features)]
 		
 		# Use trained StandardScaler to standardize data
 		X = self.stdsc.transform(X_pre)
@@ -256,9 +442,6 @@ class Agent():
 		prediction = self.model.predict(X)[0]
 		probability = self.model.predict_proba(X)[0][int(prediction)] * 100
 
-		# Delete prediction object from database
-		predObj.delete()
-		
 		return {'classification': prediction, 'probability': probability }
 
 	# Class helper methods
@@ -311,6 +494,22 @@ class Agent():
 		"""
 		return self.__stdsc
 
+	def getRegistry(self):
+		""" Returns the model registry.
+
+		Keyword arguments:
+		self -- the Agent instance
+		"""
+		return self.__registry
+
+	def getVersion(self):
+		""" Returns the version of the used model.
+
+		Keyword arguments:
+		self -- the Agent instance
+		"""
+		return self.__version
+
 	def setModel(self, other):
 		""" Sets the model.
 
@@ -335,4 +534,6 @@ class Agent():
 	model = property(getModel, setModel)
 	stdscFile = property(getStdscFile)
 	stdsc = property(getStdsc, setStdsc)
+	registry = property(getRegistry)
+	version = property(getVersion)
 
@@ -1,5 +1,14 @@
+import ast
+import io
+import os
+import tempfile
 import unittest
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stdout
 from ..ps2py_parser import ps2py_yacc as ycc
+from ..ps2py_parser import ps2py_ast
+from ..ps2py_parser import ps2py_lex
+from ..ps2py_parser import ps2py_tables
 
 
 class TestAssignment(unittest.TestCase):
@@ -208,6 +217,134 @@ class TestProcs(unittest.TestCase):
         self.assertEqual(ycc.parse_ps2py(statement).get('result'), 'def func (param1,param2):\n\twhile True:\n\t\ta = 3 + {1,2,3}\n\t\tif a == 100:\n\t\t\tbreak\n\treturn param2')
 
 
+class TestAstMode(unittest.TestCase):
+    """ Class for testing the parser building an abstract syntax tree. """
+
+    statements = [
+        "a <- 9^3 * (9%3) - b[3] // func(b, c)",
+        "a <- -2 ^ 2 + 2 ^ -3 ^ 2 * (-5)",
+        "if a < 3 and not b == 2 or c then a <- 3 else a <- 4 endif",
+        "for i in menge do if a < 3 then a <- 3 endif endfor",
+        "for i in 1 to 10 by 1 do a <- 10+i endfor",
+        "procedure func (param1, param2) repeat a <- 3 + {1,2,3} until a == 100 return param2 endproc",
+    ]
+
+    def test_sameTree(self):
+        """ Tests that the tree equals the one Python builds from the parsed code, including the line numbers.
+
+        Keyword arguments:
+        self -- the TestAstMode instance
+        """
+        for statement in self.statements:
+            root = ycc.parse_ps2py(statement, True).get('result')
+            expected = ast.parse(ycc.parse_ps2py(statement).get('result'))
+            self.assertEqual(ast.dump(root), ast.dump(expected))
+            self.assertEqual([node.lineno for node in ast.walk(root) if isinstance(node, ast.stmt)],
+                             [node.lineno for node in ast.walk(expected) if isinstance(node, ast.stmt)])
+
+    def test_errors(self):
+        """ Tests that syntax errors are reported like without the tree.
+
+        Keyword arguments:
+        self -- the TestAstMode instance
+        """
+        statement = "if a < 3 then a <- endif"
+        self.assertIsNone(ycc.parse_ps2py(statement, True).get('result'))
+        self.assertEqual(ycc.parse_ps2py(statement, True).get('errors'), ycc.parse_ps2py(statement).get('errors'))
+
+    def test_toPython(self):
+        """ Tests the generation of the Python code with one line per statement.
+
+        Keyword arguments:
+        self -- the TestAstMode instance
+        """
+        statement = "procedure func (param1, param2) if param1 > param2 then return param2 else return param1 endif endproc"
+        root = ycc.parse_ps2py(statement, True).get('result')
+        self.assertEqual(ps2py_ast.toPython(root), 'def func(param1, param2):\n\tif param1 > param2:\n\t\treturn param2\n\telse:\n\t\treturn param1')
+
+    def test_removeStatements(self):
+        """ Tests the removal of statements and the update of the line numbers.
+
+        Keyword arguments:
+        self -- the TestAstMode instance
+        """
+        statement = "a <- 1 for i in menge do b <- open(i) a <- b endfor c <- a"
+        root = ycc.parse_ps2py(statement, True).get('result')
+        self.assertIs(ps2py_ast.getStatementAt(root, 3), root.body[1].body[0])
+        self.assertEqual(ps2py_ast.removeStatements(root, lambda node: "open" in ps2py_ast.getHeader(node)), 1)
+        ps2py_ast.setLines(root)
+        self.assertEqual(ps2py_ast.toPython(root), 'a = 1\nfor i in menge:\n\ta = b\nc = a')
+        self.assertEqual([node.lineno for node in ast.walk(root) if isinstance(node, ast.stmt)], [1, 2, 4, 3])
+
+
+class TestParserInstances(unittest.TestCase):
+    """ Class for testing parsers with their own state. """
+
+    def test_errorLines(self):
+        """ Tests that the syntax errors contain the line of the token.
+
+        Keyword arguments:
+        self -- the TestParserInstances instance
+        """
+        parser = ycc.Ps2PyParser()
+        statement = "a <- 3\nif a < 3 then\n  a <- endif"
+        self.assertEqual(parser.parse(statement).get('errors'), "Syntax error in input at: LexToken(ENDIF,'endif',3,28)\n")
+        # the lines are counted from the start for every code
+        self.assertEqual(parser.parse(statement).get('errors'), "Syntax error in input at: LexToken(ENDIF,'endif',3,28)\n")
+        self.assertEqual(parser.parse("a <- 3").get('errors'), "")
+
+    def test_threads(self):
+        """ Tests that codes parsed in several threads at the same time get their own results and errors.
+
+        Keyword arguments:
+        self -- the TestParserInstances instance
+        """
+        statements = [
+            "procedure func (param1, param2) repeat a <- 3 + {1,2,3} until a == 100 return param2 endproc",
+            "a <- 3\nif a < 3 then\n  a <- endif",
+            "for i in 1 to 10 by 1 do a <- 10+i endfor",
+            "for i in menge do\n\n a <- ( endfor",
+        ] * 50
+        expected = [(ycc.parse_ps2py(statement), ycc.parse_ps2py(statement, True).get('errors')) for statement in statements]
+
+        def parseBoth(statement):
+            return (ycc.parse_ps2py(statement), ycc.parse_ps2py(statement, True).get('errors'))
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            self.assertEqual(list(executor.map(parseBoth, statements)), expected)
+
+
+class TestTables(unittest.TestCase):
+    """ Class for testing the precompiled parsing and lexing tables. """
+
+    def test_upToDate(self):
+        """ Tests that the table files were built from the current rules; else, run python manage.py build_parser_tables.
+
+        Keyword arguments:
+        self -- the TestTables instance
+        """
+        self.assertEqual(ps2py_tables.readTables(ps2py_tables.LEXTAB_FILE).get('signature'), ps2py_tables.getLexerSignature(ps2py_lex))
+        self.assertEqual(ps2py_tables.readTables(ps2py_tables.PARSETAB_FILE).get('signature'), ps2py_tables.getParserSignature(ycc))
+
+    def test_missingTables(self):
+        """ Tests that missing tables are built in memory, without writing them.
+
+        Keyword arguments:
+        self -- the TestTables instance
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            lextab_file = os.path.join(directory, "lextab.obj")
+            parsetab_file = os.path.join(directory, "parsetab.obj")
+            with redirect_stdout(io.StringIO()) as output:
+                lexer = ps2py_tables.loadLexer(ps2py_lex, lextab_file)
+                lr_tables = ps2py_tables.loadParser(ycc, parsetab_file)
+            self.assertIn("build_parser_tables", output.getvalue())
+            self.assertEqual(os.listdir(directory), [])
+
+        self.assertEqual(lexer.lextokens, ps2py_lex.lexer.lextokens)
+        self.assertEqual([str(production) for production in lr_tables.lr_productions], [str(production) for production in ycc._tables.lr_productions])
+
+
 # called by
 # python -m ab_ui.ab_main.ab_unittests.parser_unittests
 if __name__ == '__main__':
@@ -0,0 +1,73 @@
+import json
+import unittest
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+from django.test import RequestFactory
+from ab_ui import views
+from .. import batch_runner
+
+class BrokenExecutor():
+    """ Process pool whose worker process died. """
+
+    def submit(self, fn, code):
+        """ Fails like a broken 'ProcessPoolExecutor'.
+
+        Keyword arguments:
+        self -- the BrokenExecutor instance
+        fn -- the function to run
+        code -- the pseudo code
+        """
+        raise BrokenProcessPool("A process in the process pool was terminated abruptly.")
+
+    def shutdown(self, wait=True):
+        """ Does nothing, there are no worker processes.
+
+        Keyword arguments:
+        self -- the BrokenExecutor instance
+        wait -- whether to wait for the worker processes
+        """
+
+class EchoExecutor(BrokenExecutor):
+    """ Process pool returning the pseudo code as the result right away. """
+
+    def submit(self, fn, code):
+        """ Returns a finished future of the pseudo code.
+
+        Keyword arguments:
+        self -- the EchoExecutor instance
+        fn -- the function to run
+        code -- the pseudo code
+        """
+        future = Future()
+        future.set_result(({'code': code}, {}))
+        return future
+
+class TestBatchApi(unittest.TestCase):
+    """ Test class for the batch analysis view """
+
+    def test_invalidRequest(self):
+        """ Tests that requests without a list of pseudo codes are rejected.
+
+        Keyword arguments:
+        self -- the TestBatchApi instance
+        """
+        factory = RequestFactory()
+        self.assertEqual(views.batch(factory.get('/api/batch/')).status_code, 405)
+        for body in ['no json', '["a <- 1"]', '{"programs": "a <- 1"}', '{"programs": [1, 2]}']:
+            response = views.batch(factory.post('/api/batch/', body, content_type="application/json"))
+            self.assertEqual(response.status_code, 400)
+            self.assertIn('error', json.loads(response.content))
+
+class TestRunAll(unittest.TestCase):
+    """ Test class for running the analysis in a process pool """
+
+    def test_brokenExecutor(self):
+        """ Tests that a broken process pool is replaced by a new one for the remaining codes.
+
+        Keyword arguments:
+        self -- the TestRunAll instance
+        """
+        executors = [EchoExecutor(), BrokenExecutor()]
+        results = batch_runner.runAll(executors.pop, enumerate(["a <- 1", "b <- 2"]), 1)
+        self.assertEqual(sorted(results), [(0, {'code': "a <- 1"}, {}), (1, {'code': "b <- 2"}, {})])
+        self.assertEqual(executors, [])
@@ -0,0 +1,65 @@
+import os
+import shutil
+import tempfile
+import unittest
+from ab_ui.management.commands import classify
+
+class TestClassifyCommand(unittest.TestCase):
+    """ Test class for reading the submissions and results of the classify command """
+
+    def setUp(self):
+        """ Creates a temporary directory for input and output files.
+
+        Keyword arguments:
+        self -- the TestClassifyCommand instance
+        """
+        self.tmp_dir = tempfile.mkdtemp()
+        self.command = classify.Command()
+
+    def tearDown(self):
+        """ Deletes the temporary directory.
+
+        Keyword arguments:
+        self -- the TestClassifyCommand instance
+        """
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_readSubmissions(self):
+        """ Tests that ids are taken from the JSONL lines, or the line numbers if missing.
+
+        Keyword arguments:
+        self -- the TestClassifyCommand instance
+        """
+        input_path = os.path.join(self.tmp_dir, "input.jsonl")
+        with open(input_path, "w") as input_file:
+            input_file.write('{"id": "s1", "code": "a <- 1"}\n\n{"code": "b <- 2"}\n')
+        self.assertEqual(list(self.command.readSubmissions(input_path)), [("s1", "a <- 1"), ("3", "b <- 2")])
+
+    def test_readDone(self):
+        """ Tests that an incomplete last line of an interrupted run is not taken as done.
+
+        Keyword arguments:
+        self -- the TestClassifyCommand instance
+        """
+        output_path = os.path.join(self.tmp_dir, "output.jsonl")
+        with open(output_path, "w") as output_file:
+            output_file.write('{"id": "s1", "result": {}}\n{"id": "s2", "res')
+        self.assertEqual(self.command.readDone(output_path, False), {"s1"})
+        self.assertFalse(self.command.endsWithNewline(output_path))
+
+    def test_readDoneFailed(self):
+        """ Tests that submissions whose analysis failed are analysed again.
+
+        Keyword arguments:
+        self -- the TestClassifyCommand instance
+        """
+        output_path = os.path.join(self.tmp_dir, "output.jsonl")
+        with open(output_path, "w") as output_file:
+            output_file.write('{"id": "s1", "result": {}}\n{"id": "s2", "result": {"error": "Analysis failed: "}}\n')
+        self.assertEqual(self.command.readDone(output_path, False), {"s1"})
+
+        output_path = os.path.join(self.tmp_dir, "output.csv")
+        with open(output_path, "w") as output_file:
+            output_file.write('id,code,complexity,classification,probability,tips,error\n')
+            output_file.write('s1,a <- 1,,,,,\ns2,b <- 2,,,,,Analysis failed: \n')
+        self.assertEqual(self.command.readDone(output_path, True), {"s1"})
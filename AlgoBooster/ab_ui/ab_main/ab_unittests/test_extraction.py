@@ -1,4 +1,5 @@
 
+import time
 import unittest
 from .. import ast_extraction 
 
@@ -15,7 +16,7 @@ class TestAttrClasses():
         attr_name -- the name of the attribute to test
         """
 
-        extraction = ast_extraction.AttributeFinder("", True)
+        extraction = ast_extraction.AttributeFinder(True)
         root = extraction.parseCodeToAST(code)
         attrs = extraction.extractAttributes(root)
         if root is None or attrs == "":
@@ -549,6 +550,91 @@ while True:
         attr = self.prepare(code, self.attr_name)
         self.assertEqual(attr, 1)
 
+class TestRunCodeEnv(unittest.TestCase):
+    """ Test class for the limits of RunCodeEnv """
+
+    def run_code(self, code):
+        """ Runs the code in the sandbox and returns the termination and the limit that stopped it.
+
+        Keyword arguments:
+        self -- the TestRunCodeEnv instance
+        code -- the Python code to run
+        """
+        venv = ast_extraction.RunCodeEnv(code)
+        return (venv.Run(), venv.limit)
+
+    def test_limits(self):
+        """ Tests that the limit stopping a program is reported.
+
+        Keyword arguments:
+        self -- the TestRunCodeEnv instance
+        """
+        self.assertEqual(self.run_code("a = [i for i in range(100)]"), (ast_extraction.TERMINATED_NORMALLY, None))
+        self.assertEqual(self.run_code("a = b"), (ast_extraction.TERMINATION_RAISED, None))
+        self.assertEqual(self.run_code("while True:\n    a = 3"), (ast_extraction.TERMINATION_KILLED, ast_extraction.LIMIT_STEPS))
+        self.assertEqual(self.run_code("a = [0] * 10 ** 10"), (ast_extraction.TERMINATION_KILLED, ast_extraction.LIMIT_MEMORY))
+        self.assertEqual(self.run_code("a = sum(range(10 ** 12))"), (ast_extraction.TERMINATION_KILLED, ast_extraction.LIMIT_CPU))
+
+    def test_report(self):
+        """ Tests that the results sent by the sandbox runner and the program are reported.
+
+        Keyword arguments:
+        self -- the TestRunCodeEnv instance
+        """
+        venv = ast_extraction.RunCodeEnv("sendResult('found', [1, 2])\nfor i in range(3):\n    a = i\na = b")
+        self.assertEqual(venv.Run(), ast_extraction.TERMINATION_RAISED)
+        self.assertEqual(venv.report, {'found': [1, 2], 'status': 'raised', 'exception': 'NameError', 'steps': 9})
+
+    def test_concurrentRuns(self):
+        """ Tests that more runs than environments can be submitted at once.
+
+        Keyword arguments:
+        self -- the TestRunCodeEnv instance
+        """
+        venvs = [ast_extraction.RunCodeEnv("a = %d\nsendResult('a', a)" % i) for i in range(20)]
+        futures = [venv.submit() for venv in venvs]
+        for (i, (venv, future)) in enumerate(zip(venvs, futures)):
+            self.assertEqual(venv.evaluate(future.result()), ast_extraction.TERMINATED_NORMALLY)
+            self.assertEqual(venv.report.get('a'), i)
+
+    def test_timeout(self):
+        """ Tests that a waiting program is killed at the timeout, together with the processes it started.
+
+        Keyword arguments:
+        self -- the TestRunCodeEnv instance
+        """
+        code = "import os, time\nif os.fork() == 0:\n    sendResult('forked', 1)\ntime.sleep(60)"
+        start = time.monotonic()
+        self.assertEqual(self.run_code(code), (ast_extraction.TERMINATION_KILLED, ast_extraction.LIMIT_TIMEOUT))
+        self.assertLess(time.monotonic() - start, 2 * ast_extraction.TIMEOUT_TIME) # the forked process kept no pipe open
+
+class TestReproducible(unittest.TestCase):
+    """ Test class for checking whether the attributes only depend on the code """
+
+    def reproducible(self, code):
+        """ Extracts the attributes of the code and returns whether they are reproducible.
+
+        Keyword arguments:
+        self -- the TestReproducible instance
+        code -- the code for the attribute extraction in Python
+        """
+        extraction = ast_extraction.AttributeFinder(True)
+        root = extraction.parseCodeToAST(code)
+        extraction.extractAttributes(root)
+        return extraction.isReproducible(root)
+
+    def test_reproducible(self):
+        """ Tests that runs stopped by the program or a limit of the sandbox runner are reproducible,
+        but not runs the sandbox runner could not finish.
+
+        Keyword arguments:
+        self -- the TestReproducible instance
+        """
+        self.assertTrue(self.reproducible("a = 1"))
+        self.assertTrue(self.reproducible("a = b"))
+        self.assertTrue(self.reproducible("while True:\n    a = 3"))
+        self.assertFalse(self.reproducible("import os, signal\nos.kill(os.getpid(), signal.SIGKILL)"))
+
 class TestUsingNonScalar(unittest.TestCase, TestAttrClasses):
     """ Test class for UsingNonScalar """
 
@@ -667,7 +753,38 @@ func(10, 7)
         """
         attr = self.prepare(code, self.attr_name)
         self.assertEqual(attr, 1)
-    
+
+    def test_growingList(self):
+        """ Tests that a list growing in a long loop is neither stopped nor reported as repeated.
+
+        Keyword arguments:
+        self -- the TestRepeatValues instance
+        """
+        code = """
+a = [1, 2, 3]
+for i in range(0, 100, 1):
+    for j in range(0, 100, 1):
+        a = a + [i]
+        """
+        attr = self.prepare(code, self.attr_name)
+        self.assertEqual(attr, 0)
+        self.assertEqual(self.prepare(code, "ProgTerminate"), 0)
+
+    def test_equalHashes(self):
+        """ Tests that different values with the same hash are not reported as repeated.
+
+        Keyword arguments:
+        self -- the TestRepeatValues instance
+        """
+        code = """
+a = [-1]
+a = [-2]
+b = [[-1]]
+b = [[-2]]
+        """
+        attr = self.prepare(code, self.attr_name)
+        self.assertEqual(attr, 0)
+
 class TestReuseValues(unittest.TestCase, TestAttrClasses):
     """ Test class for Reuse Values """
 
@@ -939,6 +1056,22 @@ while True:
         self.assertEqual(attr, "4")
 
 
+class TestFeatureVector(unittest.TestCase):
+    """ Test class for FeatureVector """
+
+    def test_fromAttributes(self):
+        """ Tests that the attributes are taken in the order of the training data and as numbers.
+
+        Keyword arguments:
+        self -- the TestFeatureVector instance
+        """
+        attrs = {'RecCount': 2, 'LoopNDepend': 0, 'LoopNested': 1, 'LoopType': 2, 'ProgTerminate': 0,
+                 'UsingNonScalar': 1, 'RepeatValues': 0, 'ReuseValues': 1, 'Complexity': "4"}
+        features = ast_extraction.FeatureVector.fromAttributes(attrs)
+        self.assertEqual(list(features), [2, 0, 1, 2, 0, 1, 0, 1, 4])
+        self.assertEqual(features.complexity, 4)
+
+
 # called by
 # python -m ab_ui.ab_main.ab_unittests.test_extraction
 if __name__ == '__main__':
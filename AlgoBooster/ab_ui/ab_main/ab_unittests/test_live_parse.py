@@ -0,0 +1,112 @@
+import json
+import unittest
+from django.contrib.sessions.backends.cache import SessionStore
+from django.test import RequestFactory
+from ab_ui import views
+from ab_ui.ab_main import incremental_parser
+from ab_ui.ab_main.ps2py_parser import ps2py_yacc
+from ab_ui.ab_main.ps2py_parser import ps2py_ast
+
+CODE = """a <- 3
+procedure func (param1, param2)
+    repeat
+        a <- 3 + {1,2,3}
+    until a == 100
+    return param2
+endproc
+
+for i in 1 to 10 by 1 do
+    a <- 10 + i
+endfor
+b <- func(a,
+    2)
+if a < 3 then
+    a <- 1
+else
+    a <- 2
+endif"""
+
+class TestIncrementalParser(unittest.TestCase):
+    """ Test class for parsing only the changed blocks of a code """
+
+    def test_sameResult(self):
+        """ Tests that the blocks result in the Python code of the whole code.
+
+        Keyword arguments:
+        self -- the TestIncrementalParser instance
+        """
+        result = incremental_parser.IncrementalParser().parse(CODE)
+        self.assertEqual(result.get('code'), ps2py_ast.toPython(ps2py_yacc.parse_ps2py(CODE, True).get('result')))
+        self.assertEqual(result.get('errors'), "")
+        self.assertEqual(result.get('blocks'), 5)
+        self.assertEqual(result.get('parsed'), 5)
+
+    def test_changedBlocks(self):
+        """ Tests that only the changed blocks are parsed again, and that their errors
+        have the positions in the whole code.
+
+        Keyword arguments:
+        self -- the TestIncrementalParser instance
+        """
+        parser = incremental_parser.IncrementalParser()
+        parser.parse(CODE)
+
+        changed = CODE.replace("a <- 10 + i", "a <- 10 + ")
+        result = parser.parse(changed)
+        self.assertEqual(result.get('parsed'), 1)
+        self.assertEqual(result.get('errors'), ps2py_yacc.parse_ps2py(changed).get('errors'))
+        self.assertIn("LexToken(ENDFOR,'endfor',11,", result.get('errors'))
+
+        # an inserted statement moves the following blocks, which are not parsed again
+        result = parser.parse("c <- 1\n" + changed)
+        self.assertEqual(result.get('parsed'), 1)
+        self.assertIn("LexToken(ENDFOR,'endfor',12,", result.get('errors'))
+
+        result = parser.parse(CODE)
+        self.assertEqual(result.get('parsed'), 1)
+        self.assertEqual(result.get('errors'), "")
+
+    def test_splitBlocks(self):
+        """ Tests that lines only start a block after a complete statement.
+
+        Keyword arguments:
+        self -- the TestIncrementalParser instance
+        """
+        parser = incremental_parser.IncrementalParser()
+        # 'return a' is a single statement in the whole code, so the lines are not split
+        self.assertEqual(parser.parse("return\na <- 3").get('blocks'), 1)
+        self.assertEqual(parser.parse("a <- 1\nb[1] <- 2\n\nif a then\nb <- 1\nendif").get('blocks'), 3)
+        self.assertEqual(parser.parse("if a then\nb <- 1\nc <- 2").get('blocks'), 1)
+
+
+class TestLiveParseView(unittest.TestCase):
+    """ Test class for the view parsing the code while it is typed """
+
+    def test_invalidRequest(self):
+        """ Tests that requests without a pseudo code are rejected.
+
+        Keyword arguments:
+        self -- the TestLiveParseView instance
+        """
+        factory = RequestFactory()
+        self.assertEqual(views.live_parse(factory.get('/algobooster/parse/')).status_code, 405)
+        for body in ['no json', '["a <- 1"]', '{"code": 1}']:
+            response = views.live_parse(factory.post('/algobooster/parse/', body, content_type="application/json"))
+            self.assertEqual(response.status_code, 400)
+            self.assertIn('error', json.loads(response.content))
+
+    def test_session(self):
+        """ Tests that the blocks are kept between the requests of a session.
+
+        Keyword arguments:
+        self -- the TestLiveParseView instance
+        """
+        factory = RequestFactory()
+        session = SessionStore()
+        for (code, parsed) in [(CODE, 5), (CODE + "\nc <- 1", 1), (CODE, 0)]:
+            request = factory.post('/algobooster/parse/', json.dumps({'code': code}), content_type="application/json")
+            request.session = session
+            result = json.loads(views.live_parse(request).content)
+            self.assertEqual(result.get('parsed'), parsed)
+            self.assertEqual(result.get('errors'), "")
+        self.assertIsNotNone(session.session_key)
@@ -0,0 +1,107 @@
+import os
+import shutil
+import tempfile
+import unittest
+import pandas
+from ab_ui.models import TrainData
+from .. import ab_ml
+
+class TestModelRegistry(unittest.TestCase):
+    """ Test class for the ModelRegistry """
+
+    def setUp(self):
+        """ Creates a temporary directory for model and scaler.
+
+        Keyword arguments:
+        self -- the TestModelRegistry instance
+        """
+        self.prefix = tempfile.mkdtemp() + "/"
+
+    def tearDown(self):
+        """ Deletes the temporary directory.
+
+        Keyword arguments:
+        self -- the TestModelRegistry instance
+        """
+        shutil.rmtree(self.prefix, ignore_errors=True)
+
+    def test_cached(self):
+        """ Tests that model and scaler are kept in memory between calls.
+
+        Keyword arguments:
+        self -- the TestModelRegistry instance
+        """
+        registry = ab_ml.ModelRegistry(self.prefix)
+        self.assertEqual(registry.get()[1:], (None, None))
+
+        registry.publish({'model': 1}, {'stdsc': 1})
+        (version, model, stdsc) = registry.get()
+        self.assertEqual(model, {'model': 1})
+        self.assertIs(registry.get()[1], model)
+        self.assertEqual(registry.version, version)
+
+    def test_reload(self):
+        """ Tests that a new version saved by another registry (e.g. of another process) is loaded.
+
+        Keyword arguments:
+        self -- the TestModelRegistry instance
+        """
+        reader = ab_ml.ModelRegistry(self.prefix)
+        writer = ab_ml.ModelRegistry(self.prefix)
+
+        writer.publish({'model': 1}, {'stdsc': 1})
+        (old_version, model, _) = reader.get()
+        self.assertEqual(model, {'model': 1})
+
+        writer.publish({'model': 2}, {'stdsc': 2})
+        (new_version, model, stdsc) = reader.get()
+        self.assertNotEqual(new_version, old_version)
+        self.assertEqual(model, {'model': 2})
+        self.assertEqual(stdsc, {'stdsc': 2})
+
+    def test_trainSize(self):
+        """ Tests that the number of training samples is saved with each version.
+
+        Keyword arguments:
+        self -- the TestModelRegistry instance
+        """
+        registry = ab_ml.ModelRegistry(self.prefix)
+        self.assertEqual(registry.readTrainSize(), 0)
+
+        registry.publish({'model': 1}, {'stdsc': 1}, 42)
+        self.assertEqual(ab_ml.ModelRegistry(self.prefix).readTrainSize(), 42)
+
+
+class TestInitTrain(unittest.TestCase):
+    """ Test class for the initializing training of the Agent """
+
+    def setUp(self):
+        """ Creates a temporary directory containing only the default training data.
+
+        Keyword arguments:
+        self -- the TestInitTrain instance
+        """
+        self.base_dir = tempfile.mkdtemp() + "/"
+        os.mkdir(self.base_dir + "ml")
+        shutil.copy(os.path.join(os.path.dirname(ab_ml.__file__), "ml", "train.data"), self.base_dir + "ml/train.data")
+
+    def tearDown(self):
+        """ Deletes the temporary directory.
+
+        Keyword arguments:
+        self -- the TestInitTrain instance
+        """
+        shutil.rmtree(self.base_dir, ignore_errors=True)
+
+    def test_initTrain(self):
+        """ Tests that an agent without a saved model saves the default training data and trains.
+
+        Keyword arguments:
+        self -- the TestInitTrain instance
+        """
+        rows = len(pandas.read_csv(self.base_dir + "ml/train.data"))
+        agent = ab_ml.Agent(self.base_dir)
+        self.assertEqual(TrainData.objects.count(), rows)
+        self.assertIsNotNone(agent.model)
+        self.assertIsNotNone(agent.stdsc)
+        self.assertTrue(os.path.exists(self.base_dir + "ml/model.obj"))
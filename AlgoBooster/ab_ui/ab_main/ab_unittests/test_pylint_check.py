@@ -0,0 +1,61 @@
+import unittest
+from ab_ui.ab_main import ab_controller
+from ab_ui.ab_main import pylint_check
+from ab_ui.ab_main.ps2py_parser import ps2py_yacc
+from ab_ui.ab_main.ps2py_parser import ps2py_ast
+
+class TestCodeChecker(unittest.TestCase):
+    """ Test class for the static code analysis """
+
+    def setUp(self):
+        """ Creates the checker.
+
+        Keyword arguments:
+        self -- the TestCodeChecker instance
+        """
+        self.checker = pylint_check.CodeChecker()
+
+    def check(self, code):
+        """ Parses the pseudo code and returns the result of the check and the checked tree.
+
+        Keyword arguments:
+        self -- the TestCodeChecker instance
+        code -- the pseudo code to check
+        """
+        root = ps2py_yacc.parse_ps2py(code, True).get('result')
+        return (self.checker.executeCheck(ab_controller.addMain(root)), root)
+
+    def test_allOccurrences(self):
+        """ Tests that every occurrence of a message is reported, with the line of the pseudo code.
+
+        Keyword arguments:
+        self -- the TestCodeChecker instance
+        """
+        (result, root) = self.check("a <- b\nc <- 1\nd <- b + a")
+        self.assertEqual(result.get('errors'), "line 1: Undefined variable 'b'\nline 3: Undefined variable 'b'\n")
+        self.assertEqual(result.get('removed'), 0)
+
+    def test_fixAllOccurrences(self):
+        """ Tests that the statements of every occurrence of a message to fix are removed.
+
+        Keyword arguments:
+        self -- the TestCodeChecker instance
+        """
+        (result, root) = self.check("procedure f(x)\na <- exec(x)\nb <- 2\nc <- exec(b)\nreturn b\nendproc\nd <- f(1)")
+        self.assertEqual(result.get('removed'), 2)
+        self.assertEqual(result.get('errors'), "")
+        self.assertEqual(ps2py_ast.toPython(root), "def f(x):\n\tb = 2\n\treturn b\nd = f(1)")
+
+    def test_forbiddenNames(self):
+        """ Tests that only the statements using a forbidden name are removed, and that every
+        use is reported with its position.
+
+        Keyword arguments:
+        self -- the TestCodeChecker instance
+        """
+        (result, root) = self.check("opened <- 1\nclosest <- opened\nf <- open(closest)\nprocedure g(x)\nreturn eval(x) + input(x)\nreturn x\nendproc")
+        self.assertEqual(result.get('removed'), 2)
+        self.assertIn("line 3, column 4: Use of 'open' forbidden. Line was removed.\n"
+            + "line 5, column 8: Use of 'eval' forbidden. Line was removed.\n"
+            + "line 5, column 18: Use of 'input' forbidden. Line was removed.\n", result.get('tips'))
+        self.assertEqual(ps2py_ast.toPython(root), "opened = 1\nclosest = opened\ndef g(x):\n\treturn x")
@@ -0,0 +1,57 @@
+import unittest
+from .. import result_cache
+
+class TestResultCache(unittest.TestCase):
+    """ Test class for the ResultCache """
+
+    def test_normalizedKey(self):
+        """ Tests that codes only differing in whitespace share a key, but not different model versions.
+
+        Keyword arguments:
+        self -- the TestResultCache instance
+        """
+        cache = result_cache.ResultCache(2)
+        key = cache.makeKey("a = 3\nb = a\n", "1")
+        self.assertEqual(key, cache.makeKey("\na = 3  \nb = a", "1"))
+        self.assertNotEqual(key, cache.makeKey("a = 3\nb = a\n", "2"))
+        self.assertNotEqual(key, cache.makeKey("a = 4\nb = a\n", "1"))
+
+    def test_lru(self):
+        """ Tests that the least recently used result is evicted.
+
+        Keyword arguments:
+        self -- the TestResultCache instance
+        """
+        cache = result_cache.ResultCache(2)
+        cache.put("a", {'code': "a"})
+        cache.put("b", {'code': "b"})
+        self.assertEqual(cache.get("a"), {'code': "a"})
+        cache.put("c", {'code': "c"})
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), {'code': "a"})
+        self.assertEqual(len(cache), 2)
+
+    def test_copies(self):
+        """ Tests that changing a returned result does not change the cache.
+
+        Keyword arguments:
+        self -- the TestResultCache instance
+        """
+        cache = result_cache.ResultCache(2)
+        cache.put("a", {'code': "a"})
+        cache.get("a")['code'] = "b"
+        self.assertEqual(cache.get("a"), {'code': "a"})
+
+    def test_modelVersion(self):
+        """ Tests that the cache is emptied when the model changes.
+
+        Keyword arguments:
+        self -- the TestResultCache instance
+        """
+        cache = result_cache.ResultCache(2)
+        cache.checkModelVersion("1")
+        cache.put("a", {'code': "a"})
+        cache.checkModelVersion("1")
+        self.assertEqual(len(cache), 1)
+        cache.checkModelVersion("2")
+        self.assertEqual(len(cache), 0)
@@ -0,0 +1,138 @@
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from .. import sandbox_pool
+
+class FailingPool(sandbox_pool.SandboxPool):
+    """ Sandbox pool whose environments can not be created, like a failing virtualenv. """
+
+    def createEnv(self, venv_path):
+        """ Exits like 'virtualenv.create_environment' does on errors.
+
+        Keyword arguments:
+        self -- the FailingPool instance
+        venv_path -- the path of the environment to create
+        """
+        raise SystemExit(100)
+
+class TestSandboxPool(unittest.TestCase):
+    """ Test class for the SandboxPool """
+
+    def setUp(self):
+        """ Creates a pool with a single environment in a temporary directory.
+
+        Keyword arguments:
+        self -- the TestSandboxPool instance
+        """
+        self.pool_dir = tempfile.mkdtemp() + "/"
+        self.pool = sandbox_pool.SandboxPool(self.pool_dir, 1)
+
+    def tearDown(self):
+        """ Deletes the pool.
+
+        Keyword arguments:
+        self -- the TestSandboxPool instance
+        """
+        self.pool.shutdown()
+        shutil.rmtree(self.pool_dir, ignore_errors=True)
+
+    def test_recycle(self):
+        """ Tests that an environment is reused and reset after a run.
+
+        Keyword arguments:
+        self -- the TestSandboxPool instance
+        """
+        venv_path = self.pool.acquire()
+        self.assertTrue(self.pool.checkHealth(venv_path, True))
+        open(venv_path + "errors.log", "w").close()
+        self.pool.release(venv_path)
+
+        self.assertEqual(self.pool.acquire(), venv_path)
+        self.assertFalse(os.path.exists(venv_path + "errors.log"))
+        self.pool.release(venv_path)
+
+    def test_rebuildUnhealthy(self):
+        """ Tests that a broken environment is rebuilt before it is handed out.
+
+        Keyword arguments:
+        self -- the TestSandboxPool instance
+        """
+        venv_path = self.pool.acquire()
+        shutil.rmtree(venv_path + "bin")
+        self.assertFalse(self.pool.checkHealth(venv_path))
+        self.pool.release(venv_path)
+
+        self.assertEqual(self.pool.acquire(), venv_path)
+        self.assertTrue(self.pool.checkHealth(venv_path))
+        self.pool.release(venv_path)
+
+    def test_restartZygote(self):
+        """ Tests that a stopped zygote is started again before the environment is handed out.
+
+        Keyword arguments:
+        self -- the TestSandboxPool instance
+        """
+        venv_path = self.pool.acquire()
+        zygote = self.pool.getZygote(venv_path)
+        self.assertTrue(zygote.isAlive())
+        zygote.stop()
+        self.assertFalse(zygote.isAlive())
+        self.pool.release(venv_path)
+
+        self.assertEqual(self.pool.acquire(), venv_path)
+        self.assertIsNot(self.pool.getZygote(venv_path), zygote)
+        self.assertTrue(self.pool.getZygote(venv_path).isAlive())
+        self.pool.release(venv_path)
+
+    def test_removeStalePools(self):
+        """ Tests that only the directories of processes that stopped are deleted.
+
+        Keyword arguments:
+        self -- the TestSandboxPool instance
+        """
+        process = subprocess.Popen([sys.executable, "-c", "pass"])
+        process.wait()
+        for name in [str(process.pid), str(os.getpid()), "other"]:
+            os.mkdir(self.pool_dir + name)
+
+        sandbox_pool.removeStalePools(self.pool_dir)
+        self.assertFalse(os.path.exists(self.pool_dir + str(process.pid)))
+        self.assertTrue(os.path.exists(self.pool_dir + str(os.getpid())))
+        self.assertTrue(os.path.exists(self.pool_dir + "other"))
+
+    def test_failedWarmUp(self):
+        """ Tests that a failed warm-up is logged instead of exiting, and acquire() tries again.
+
+        Keyword arguments:
+        self -- the TestSandboxPool instance
+        """
+        (pool, pool_pid) = (sandbox_pool._pool, sandbox_pool._pool_pid)
+        sandbox_pool._pool = FailingPool(self.pool_dir, 1)
+        sandbox_pool._pool_pid = os.getpid()
+        try:
+            with self.assertLogs(sandbox_pool.logger, "ERROR"):
+                sandbox_pool.warmUpPool()
+            self.assertRaises(SystemExit, sandbox_pool._pool.acquire)
+        finally:
+            (sandbox_pool._pool, sandbox_pool._pool_pid) = (pool, pool_pid)
+
+    def test_shutdownInChild(self):
+        """ Tests that a forked child shutting down the inherited pool leaves it intact.
+
+        Keyword arguments:
+        self -- the TestSandboxPool instance
+        """
+        venv_path = self.pool.acquire()
+        pid = os.fork()
+        if pid == 0:
+            try:
+                self.pool.shutdown()
+            finally:
+                os._exit(0)
+        os.waitpid(pid, 0)
+        self.assertTrue(self.pool.checkHealth(venv_path))
+        self.assertTrue(self.pool.getZygote(venv_path).isAlive())
+        self.pool.release(venv_path)
@@ -0,0 +1,84 @@
+import shutil
+import tempfile
+import unittest
+from threading import Event
+from .. import sandbox_pool
+from .. import sandbox_supervisor
+
+class FailingPool():
+    """ Sandbox pool whose environments can not be created, like a failing virtualenv. """
+
+    size = 1
+
+    def acquire(self):
+        """ Exits like 'virtualenv.create_environment' does on errors.
+
+        Keyword arguments:
+        self -- the FailingPool instance
+        """
+        raise SystemExit(100)
+
+class SlowPool(sandbox_pool.SandboxPool):
+    """ Sandbox pool whose first environment takes until 'ready' is set, like one being rebuilt. """
+
+    def __init__(self, pool_dir, size):
+        """ Initializes the SlowPool instance.
+
+        Keyword arguments:
+        self -- the SlowPool instance
+        pool_dir -- the directory to create the environments in
+        size -- the number of environments in the pool
+        """
+        sandbox_pool.SandboxPool.__init__(self, pool_dir, size)
+        self.ready = Event()
+        self.slow = True
+
+    def acquire(self):
+        """ Waits for 'ready' on the first call, then takes a free environment.
+
+        Keyword arguments:
+        self -- the SlowPool instance
+        """
+        if self.slow:
+            self.slow = False
+            self.ready.wait(10)
+        return sandbox_pool.SandboxPool.acquire(self)
+
+class TestSupervisor(unittest.TestCase):
+    """ Test class for the Supervisor """
+
+    def test_failedAcquire(self):
+        """ Tests that a SystemExit while taking an environment fails the job and the supervisor keeps running.
+
+        Keyword arguments:
+        self -- the TestSupervisor instance
+        """
+        supervisor = sandbox_supervisor.Supervisor(FailingPool())
+        supervisor.start()
+        for _ in range(2):
+            future = supervisor.submit("a = 1", {}, 1)
+            self.assertIsInstance(future.exception(timeout=5), SystemExit)
+        self.assertTrue(supervisor.is_alive())
+
+    def test_slowAcquire(self):
+        """ Tests that jobs keep running while an environment is taken from the pool.
+
+        Keyword arguments:
+        self -- the TestSupervisor instance
+        """
+        pool_dir = tempfile.mkdtemp() + "/"
+        pool = SlowPool(pool_dir, 2)
+        try:
+            supervisor = sandbox_supervisor.Supervisor(pool)
+            supervisor.start()
+            limits = dict(pool.getUserIds(), steps=1000, cpu_time=2, memory=2 ** 29)
+            slow = supervisor.submit("sendResult('a', 1)", limits, 5)
+            fast = supervisor.submit("sendResult('a', 2)", limits, 5)
+            self.assertEqual(fast.result(timeout=30).get('report').get('a'), 2)
+            self.assertFalse(slow.done())
+            pool.ready.set()
+            self.assertEqual(slow.result(timeout=30).get('report').get('a'), 1)
+        finally:
+            pool.ready.set()
+            pool.shutdown()
+            shutil.rmtree(pool_dir, ignore_errors=True)
@@ -0,0 +1,111 @@
+import time
+import unittest
+from ab_ui.ab_main import ab_controller
+from ab_ui.ab_main import pylint_check
+from ab_ui.ab_main import pylint_engine
+from ab_ui.ab_main import static_check
+from ab_ui.ab_main.ps2py_parser import ps2py_yacc
+from ab_ui.ab_main.ps2py_parser import ps2py_ast
+
+# Pseudo codes reporting every message the generated code can have
+CODES = [
+    # names used before or without assignment, unused variables
+    "a <- b\nc <- 1\nd <- b + a",
+    "procedure f(x)\ny <- x\nreturn z\nendproc\nr <- f(1)",
+    "procedure f(x)\nreturn g(x)\nendproc\nprocedure g(x)\nreturn x\nendproc\nr <- f(1)",
+    "if 0 then\na <- 1\nendif\nb <- a",
+    # loops
+    "for i in {1,2} do\na <- i\nendfor\nb <- i",
+    "procedure g(a)\nreturn a\nendproc\nfor i in g do\na <- i\nendfor\nb <- i + a",
+    "for i in 1 to 10 by 1 do\na <- i\nendfor\nb <- i + a",
+    "n <- 3\nfor i in n do\na <- i\nendfor",
+    "repeat\na <- 1\nuntil a > 0\nb <- a",
+    # functions
+    "procedure f(a,a)\nreturn a\nendproc\nprocedure f(b)\nreturn b\nendproc\nx <- f(1,2,3)",
+    "procedure f(a,b)\nreturn a\nendproc\nx <- f(1)\ny <- f(1,2,3)",
+    "procedure f(a)\nb <- a\nendproc\nx <- f(1)\nprocedure g(a)\nreturn\nendproc\ny <- g(1)",
+    "procedure f(a)\nif a > 1 then\nreturn a\nb <- a\nelse\nreturn 1\nendif\nendproc\nx <- f(1)",
+    # conditions and indices
+    "procedure f(a)\nreturn a\nendproc\nif f then\nx <- 1\nendif\nif [1] then\ny <- {1}\nendif",
+    "l <- [1,2]\nx <- l[l]\ni <- 1 / 2\ny <- l[i]\nj <- 1\nz <- l[j]",
+    "x <- exec(1)\nprocedure f(a)\nreturn exec(a)\nendproc\ny <- f(x)",
+]
+
+class TestStaticChecker(unittest.TestCase):
+    """ Test class for the native static checks """
+
+    def setUp(self):
+        """ Creates the checker and the pylint engine for the messages of the code checker.
+
+        Keyword arguments:
+        self -- the TestStaticChecker instance
+        """
+        self.msg_ids = sum(pylint_check.CodeChecker().relevant_msgs.values(), [])
+        self.checker = static_check.StaticChecker(self.msg_ids)
+
+    def toPython(self, code):
+        """ Returns the Python code checked for the pseudo code, with the added main function.
+
+        Keyword arguments:
+        self -- the TestStaticChecker instance
+        code -- the pseudo code
+        """
+        root = ps2py_yacc.parse_ps2py(code, True).get('result')
+        return ps2py_ast.toPython(ab_controller.addMain(root)) + "\n"
+
+    def messages(self, checker, py_code):
+        """ Returns the sorted messages of a checker as tuples.
+
+        Keyword arguments:
+        self -- the TestStaticChecker instance
+        checker -- the StaticChecker or PylintEngine
+        py_code -- the Python code to check
+        """
+        return sorted((msg.get('msg_id'), msg.get('line'), msg.get('column'), msg.get('msg'))
+            for msg in checker.check(py_code, pylint_check.CODE_FILE))
+
+    def test_sameAsPylint(self):
+        """ Tests that the messages are the ones of pylint, with the same texts and positions.
+
+        Keyword arguments:
+        self -- the TestStaticChecker instance
+        """
+        engine = pylint_engine.getEngine(self.msg_ids)
+        found = set()
+        for code in CODES:
+            py_code = self.toPython(code)
+            messages = self.messages(self.checker, py_code)
+            self.assertEqual(messages, self.messages(engine, py_code), py_code)
+            found.update(msg[0] for msg in messages)
+        self.assertEqual(found, set(static_check.MESSAGES) - {'E0001'})
+
+    def test_syntaxError(self):
+        """ Tests that a syntax error is the only message.
+
+        Keyword arguments:
+        self -- the TestStaticChecker instance
+        """
+        messages = self.messages(self.checker, "def main_1():\n\ta = (b\n")
+        self.assertEqual(messages, [('E0001', 2, 6, "Parsing failed: ''(' was never closed (<unknown>, line 2)'")])
+
+    def test_enabledMessages(self):
+        """ Tests that only the given messages are reported.
+
+        Keyword arguments:
+        self -- the TestStaticChecker instance
+        """
+        py_code = self.toPython("a <- b\nc <- 1")
+        self.assertEqual(self.messages(static_check.StaticChecker(['E0602']), py_code), [('E0602', 2, 5, "Undefined variable 'b'")])
+        self.assertEqual(self.messages(static_check.StaticChecker([]), py_code), [])
+
+    def test_largeNumbers(self):
+        """ Tests that calculations with results too large to compute are not done.
+
+        Keyword arguments:
+        self -- the TestStaticChecker instance
+        """
+        py_code = "a0 = 99999 ** 99999\n" + "".join("a%d = a%d * a%d\n" % (i + 1, i, i) for i in range(8))
+        py_code += "b = 1 << a8\nc = 'x' * 1000000 * 1000000\nd = [1, 2]\ne = d[a8] + d[b]\n"
+        start = time.perf_counter()
+        self.messages(self.checker, py_code)
+        self.assertLess(time.perf_counter() - start, 1)
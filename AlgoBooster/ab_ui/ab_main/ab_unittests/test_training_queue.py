@@ -0,0 +1,60 @@
+import socket
+import subprocess
+import sys
+from django.test import TestCase
+from ab_ui.models import TrainingJob
+from .. import training_queue
+
+class TestTrainingWorker(TestCase):
+    """ Test class for the TrainingWorker """
+
+    def test_claimOnce(self):
+        """ Tests that queued jobs are only handed out once.
+
+        Keyword arguments:
+        self -- the TestTrainingWorker instance
+        """
+        first = TrainingJob.objects.create(code="a <- 1", classification=1)
+        second = TrainingJob.objects.create(code="b <- 2", classification=2)
+        worker = training_queue.TrainingWorker()
+
+        claimed = worker.claimJobs()
+        self.assertEqual([job.id for job in claimed], [first.id, second.id])
+        self.assertEqual(TrainingJob.objects.get(id=first.id).status, TrainingJob.RUNNING)
+        self.assertEqual(worker.claimJobs(), [])
+
+    def test_requeueOrphaned(self):
+        """ Tests that only the running jobs of stopped processes of this host are queued again.
+
+        Keyword arguments:
+        self -- the TestTrainingWorker instance
+        """
+        orphaned = TrainingJob.objects.create(code="a <- 1", classification=1)
+        running = TrainingJob.objects.create(code="b <- 2", classification=2)
+        other_host = TrainingJob.objects.create(code="c <- 3", classification=3)
+        worker = training_queue.TrainingWorker()
+        worker.claimJobs()
+        process = subprocess.Popen([sys.executable, "-c", "pass"])
+        process.wait()
+        TrainingJob.objects.filter(id=orphaned.id).update(owner=socket.gethostname() + ":" + str(process.pid))
+        TrainingJob.objects.filter(id=other_host.id).update(owner="other-host:" + str(process.pid))
+
+        self.assertEqual(worker.requeueOrphaned(), 1)
+        self.assertEqual(TrainingJob.objects.get(id=orphaned.id).status, TrainingJob.QUEUED)
+        self.assertEqual(TrainingJob.objects.get(id=running.id).status, TrainingJob.RUNNING)
+        self.assertEqual(TrainingJob.objects.get(id=other_host.id).status, TrainingJob.RUNNING)
+        self.assertEqual([job.id for job in worker.claimJobs()], [orphaned.id])
+
+    def test_failedJob(self):
+        """ Tests that a job without code is marked as failed.
+
+        Keyword arguments:
+        self -- the TestTrainingWorker instance
+        """
+        job = TrainingJob.objects.create(code="", classification=1)
+        worker = training_queue.TrainingWorker()
+
+        self.assertEqual(worker.processBatch(), 1)
+        job = TrainingJob.objects.get(id=job.id)
+        self.assertEqual(job.status, TrainingJob.FAILED)
+        self.assertEqual(job.getValues()['result'], "Training was not successful.")
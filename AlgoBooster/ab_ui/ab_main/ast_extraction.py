@@ -1,18 +1,38 @@
 import ast
 import astor
-import shutil
-import subprocess
-from threading import Thread
-import virtualenv
-
-from ab_ui.models import AlgorithmData
-
-
-TIMEOUT_TIME = 5 # seconds
-TEMP_DIR = "" # default: current directory
-
-class RunCodeEnv(Thread):
-    """ Class for creating a virtual environment to run the submitted algorithm in. """
+import concurrent.futures
+import copy
+import os
+import signal
+from typing import NamedTuple
+
+from ab_ui.ab_main import sandbox_pool
+from ab_ui.ab_main import sandbox_runner
+from ab_ui.ab_main import sandbox_supervisor
+
+
+STEP_LIMIT = 1000000 # executed lines of the submitted code per run
+CPU_LIMIT = 2 # seconds of CPU time per run
+MEMORY_LIMIT = 512 * 1024 * 1024 # bytes of address space per run
+TIMEOUT_TIME = 5 # seconds, only reached by programs waiting without using the CPU
+WAIT_TIME = 60 # seconds a run may wait for its result, including the wait for a free environment
+MAX_FINGERPRINTS = 10000 # values per variable remembered to find repeated assignments
+MAX_FINGERPRINT_ITEMS = 1000000 # items of all remembered values of a variable, bounds the memory
+
+# Possible results of a run in the virtual environment
+TERMINATED_NORMALLY = "normal"
+TERMINATION_KILLED = "killed"
+TERMINATION_RAISED = "raised"
+
+# Limits that can stop a run
+LIMIT_STEPS = "steps"
+LIMIT_CPU = "cpu"
+LIMIT_MEMORY = "memory"
+LIMIT_TIMEOUT = "timeout"
+
+class RunCodeEnv():
+    """ Class for running the submitted algorithm in a virtual environment taken from the sandbox pool.
+    The runs of all instances are handled by the sandbox supervisor of the process. """
 
     def __init__(self, py_code):
         """ Initializes the RunCodeEnv instance.
@@ -21,183 +41,633 @@ class RunCodeEnv(Thread):
         self -- the RunCodeEnv instance
         py_code -- the Python code to execute in the virtual environment
         """
-        
-        Thread.__init__(self)
+        self.__py_code = py_code
         self.__timeout = TIMEOUT_TIME
-        self.__subdir = TEMP_DIR
-        self.__venv_path = self.__subdir + "virtualenvs/" # virtual environment path
-        self.__python_path = self.venv_path + "bin/python" # path to the Python resources
-        self.__script_file = self.__subdir + "sandbox_code.py" # file for the Python code
-        self.__cmd = [self.python_path, self.script_file]
-        self.__errfile = None
-        self.__pathErrFile = self.venv_path + "/errors.log"
-
-        # Write the Python code to the script file
-        try:
-            code_file = open(self.script_file, "w")
-            code_file.write(py_code)
-            code_file.close()
-        except IOError as ioe:
-            print("Error while writing code to file:", ioe)
-            return None
-
-        # Create 'safe' environment without wheel, pip, setuptools or site packages
-        virtualenv.create_environment(self.venv_path,site_packages=False, no_wheel=True, no_pip=True, no_setuptools=True, clear=True)
-
-        # Open stream to error file
-        try:
-            self.__errfile = open(self.pathErrFile, "w")
-        except IOError as ioe:
-            print("Error while opening errorfile:", ioe)
-            return None
+        self.__limit = None
+        self.__report = {} # status, exception and steps of the run and the results sent by the program
+        self.__returncode = None
 
-
-    def run(self):
-        """ Inherited from 'Thread'. This method is called on RunCodeEnv.start().
+    def submit(self):
+        """ Queues the run at the sandbox supervisor and returns the 'concurrent.futures.Future'
+        of its result, which is passed to evaluate(). Takes an environment of the sandbox pool
+        once one is free and gives it back after the run.
 
         Keyword arguments:
         self -- the RunCodeEnv instance
         """
-        self.__prg = subprocess.Popen(self.cmd, stderr=self.errfile) # Starts the execution of the python script in a subprocess
-        self.prg.communicate() # Waits for child process to terminate
+        limits = dict(sandbox_pool.getPool().getUserIds(), steps=STEP_LIMIT, cpu_time=CPU_LIMIT, memory=MEMORY_LIMIT)
+        return sandbox_supervisor.getSupervisor().submit(self.__py_code, limits, self.timeout)
+
+    def Run(self):
+        """ Actually called run method from outside. Runs the code and checks if the
+        program terminates. Additionally, checks if an error was raised (like Maximum
+        Recursion Depth). Returns TERMINATED_NORMALLY if the program exited normally,
+        TERMINATION_KILLED if it was stopped by a limit and TERMINATION_RAISED if it raised an error.
+        The program is stopped once it executed STEP_LIMIT lines, used CPU_LIMIT seconds of
+        CPU time or MEMORY_LIMIT bytes of memory, the limit is available as 'limit' afterwards.
+        The details of the run are available as 'report'. If there is no result within WAIT_TIME
+        seconds, the run counts as killed at its timeout, if the sandbox failed as raised.
 
-    def Run(self, check_type):
-        """ Actually called run method from outside. Starts its own thread and checks if the
-        program terminates. Additionally, checks if an error was output (like Maximum
-        Recursion Depth). Returns 0 if the program exited normally, 0 otherwise.
+        Keyword arguments:
+        self -- the RunCodeEnv instance
+        """
+        future = self.submit()
+        try:
+            result = future.result(timeout=WAIT_TIME)
+        except concurrent.futures.TimeoutError:
+            future.cancel() # only possible while the run is still queued
+            result = {'report': {}, 'returncode': None, 'timeout': True}
+        except BaseException as exc: # e.g. the SystemExit of a failed environment creation
+            result = {'report': {'status': None, 'exception': type(exc).__name__}, 'returncode': None, 'timeout': False}
+        return self.evaluate(result)
+
+    def evaluate(self, result):
+        """ Takes over the result of a run from the sandbox supervisor and returns how the
+        program terminated, see Run().
 
         Keyword arguments:
         self -- the RunCodeEnv instance
-        check_type -- the Class instance of which the attribute should be checked
+        result -- the dictionary with the 'report', 'returncode' and 'timeout' of the run
         """
+        self.__report = result.get('report')
+        self.__returncode = result.get('returncode')
 
-        # Start the Thread, run() is called
-        self.start()
-        # Wait for the thread termination for the length of the given timeout
-        self.join(self.timeout)
+        # The sandbox runner stops the program at its limits, the timeout only ends programs that wait
+        if result.get('timeout'):
+            self.__limit = LIMIT_TIMEOUT
+            return TERMINATION_KILLED # Program was killed because it waited too long
 
-        # If the time of timeout is over and the thread is still alive, kill it
-        if self.is_alive():
-            self.prg.terminate()
-            self.prg.kill() # Ensures the termination of the program; most of the time, self.prg.terminate() should be enough
-            if isinstance(check_type, ProgTerminate):
-                return 1 # Program was killed because it takes very long or can not terminate
-            #self.join()
-        else:
-            if isinstance(check_type, ProgTerminate):
-                err_result = ""
-                try:
-                    readErr = open(self.pathErrFile, "r")
-                    err_result = readErr.read()
-                    readErr.close()
-                except IOError as ioe:
-                    print("Could not read error file:", ioe)
-                    print("Possibly not existing.")
-                    return 0
-                if err_result != "":
-                    return 1 # Problems were detected, like RecursionErrors
-        
-        return 0 # Program exited normally
+        self.__limit = self.limitOf(self.report.get('status'), self.returncode)
+        if self.limit is not None:
+            return TERMINATION_KILLED # Program was stopped because it takes very long or can not terminate
+        if self.report.get('status') != sandbox_runner.STATUS_NORMAL:
+            return TERMINATION_RAISED # Problems were detected, like RecursionErrors, or the runner crashed
+
+        return TERMINATED_NORMALLY # Program exited normally
 
-    def cleanUp(self):
-        """ Removes the virtual environment path.
+    def limitOf(self, status, returncode):
+        """ Returns the limit that stopped the program, or None if it was not stopped by a limit.
 
         Keyword arguments:
         self -- the RunCodeEnv instance
+        status -- the status the sandbox runner sent last, None if it sent none
+        returncode -- the exit code of the program
         """
-        shutil.rmtree(self.venv_path, ignore_errors=True)
+        if status == sandbox_runner.STATUS_STEPS:
+            return LIMIT_STEPS
+        if status == sandbox_runner.STATUS_MEMORY:
+            return LIMIT_MEMORY
+        if status is None and returncode in (-signal.SIGXCPU, -signal.SIGKILL):
+            return LIMIT_CPU # SIGKILL follows one second after SIGXCPU if it is ignored
+        return None
 
     # Class helper methods
 
-    def getPrg(self):
-        """ Gets the program that runs in the subprocess.
+    def getReturncode(self):
+        """ Gets the exit code of the last run, negative if it was killed by a signal.
 
         Keyword arguments:
         self -- the RunCodeEnv instance
         """
-        return self.__prg
+        return self.__returncode
 
-    def getCmd(self):
-        """ Gets the command executed in the virtual environment.
+    def getTimeout(self):
+        """ Gets the timeout time in seconds.
 
         Keyword arguments:
         self -- the RunCodeEnv instance
         """
-        return self.__cmd
+        return self.__timeout
 
-    def getTimeout(self):
-        """ Gets the timeout time in seconds.
+    def getLimit(self):
+        """ Gets the limit that stopped the last run, None if it was not stopped.
 
         Keyword arguments:
         self -- the RunCodeEnv instance
         """
-        return self.__timeout
+        return self.__limit
 
-    def getVenvPath(self):
-        """ Gets the path to the virtual environment.
+    def getReport(self):
+        """ Gets the report of the last run, containing the 'status', 'exception' and 'steps'
+        sent by the sandbox runner and the results sent by the program.
 
         Keyword arguments:
         self -- the RunCodeEnv instance
         """
-        return self.__venv_path
+        return self.__report
+
+    returncode = property(getReturncode)
+    timeout = property(getTimeout)
+    limit = property(getLimit)
+    report = property(getReport)
+
+
+
+class DynamicAnalysis():
+    """ Class for running the algorithm once for all attributes that need its execution. """
 
-    def getPythonPath(self):
-        """ Gets the path to the Python resources.
+    def __init__(self):
+        """ Initializes the DynamicAnalysis instance.
 
         Keyword arguments:
-        self -- the RunCodeEnv instance
+        self -- the DynamicAnalysis instance
         """
-        return self.__python_path
+        self.__root = None
+        self.__result = None
 
-    def getScriptFile(self):
-        """ Gets the script file name and path.
+    def getResult(self, root):
+        """ Executes the algorithm, instrumented to record assigned values, in the virtual
+        environment. The run is only done once per tree. Returns a dictionary containing
+        how the program terminated ('termination', one of TERMINATED_NORMALLY, TERMINATION_KILLED
+        and TERMINATION_RAISED), the limit that stopped it ('limit', one of LIMIT_STEPS, LIMIT_CPU,
+        LIMIT_MEMORY, LIMIT_TIMEOUT or None), the last status sent by the sandbox runner ('status', None
+        if it sent none) and whether a value was assigned repeatedly to the same variable ('repeat_values', 1 or 0).
 
         Keyword arguments:
-        self -- the RunCodeEnv instance
+        self -- the DynamicAnalysis instance
+        root -- the root node of the abstract syntax tree
+        """
+
+        if self.__root is root:
+            return self.__result
+
+        # New code with added function. Only fingerprints of the values are kept, at most
+        # MAX_FINGERPRINTS per variable holding at most MAX_FINGERPRINT_ITEMS items, and the
+        # function does nothing after the first repeat. The fingerprint is the value itself,
+        # as an immutable copy, so different values never match.
+        # The program keeps running, as its termination is needed as well.
+        code = """
+import hashlib
+
+saveVarValues = { }
+savedItems = { }
+repeatFound = False
+
+def fingerprintOf(value):
+    # returns the fingerprint and the number of items it holds
+    if value is None or isinstance(value, (int, float, complex)):
+        return (value, 1) # compared like before, so 1 and 1.0 are the same value
+    if isinstance(value, list):
+        value = (list, tuple(value))
+    elif isinstance(value, (set, frozenset)):
+        value = (set, frozenset(value))
+    elif isinstance(value, dict):
+        value = (dict, tuple(value.items()))
+    else:
+        value = (type(value), value)
+    try:
+        hash(value)
+    except TypeError:
+        return ((repr, hashlib.sha256(repr(value).encode()).hexdigest()), 1) # e.g. lists of lists
+    return (value, len(value[1]) if isinstance(value[1], (tuple, frozenset, str, bytes)) else 1)
+
+def addToSaveVarValues(var, value):
+    global repeatFound
+    if repeatFound:
+        return
+    (fingerprint, items) = fingerprintOf(value)
+    fingerprints = saveVarValues.setdefault(var, set())
+    if fingerprint not in fingerprints:
+        if len(fingerprints) < %d and savedItems.get(var, 0) + items <= %d:
+            fingerprints.add(fingerprint)
+            savedItems[var] = savedItems.get(var, 0) + items
+        return
+    repeatFound = True
+    sendResult('repeat_values', 1)
+
+""" % (MAX_FINGERPRINTS, MAX_FINGERPRINT_ITEMS) + astor.to_source(self.instrument(root))
+
+        # Execute the extended code, the sandbox runner provides 'sendResult'
+        venv = RunCodeEnv(code)
+        termination = venv.Run()
+        limit = venv.limit
+        repeat_values = venv.report.get('repeat_values', 0)
+
+        self.__root = root
+        self.__result = {'termination': termination, 'limit': limit, 'status': venv.report.get('status'),
+                         'repeat_values': repeat_values}
+        return self.__result
+
+    def instrument(self, root):
+        """ Returns a copy of the tree with a call to 'addToSaveVarValues' after every
+        assignment to a variable. The assigned value is only calculated once, so the
+        instrumented program terminates like the original one.
+
+        Keyword arguments:
+        self -- the DynamicAnalysis instance
+        root -- the root node of the abstract syntax tree
         """
-        return self.__script_file
 
-    def getErrFile(self):
-        """ Gets the stream to the error file.
+        root = copy.deepcopy(root)
+        for node in ast.walk(root):
+            for field in ('body', 'orelse', 'finalbody'):
+                statements = getattr(node, field, None)
+                if not isinstance(statements, list):
+                    continue # e.g. the body of a lambda or the branches of a conditional expression
+                new_statements = []
+                for statement in statements:
+                    new_statements.append(statement)
+                    if isinstance(statement, ast.Assign):
+                        for target in statement.targets: # do it for all targets in the assignment, e.g. 'a = b = ...'
+                            if isinstance(target, ast.Name):
+                                new_statements.append(ast.Expr(value=ast.Call(func=ast.Name(id='addToSaveVarValues', ctx=ast.Load()),
+                                                args=[ast.Constant(value=target.id), ast.Name(id=target.id, ctx=ast.Load())],
+                                                keywords=[])))
+                setattr(node, field, new_statements)
+        ast.fix_missing_locations(root) # automatically adds the attributes 'lineno' and 'col_offset' of the added nodes needed by AST
+        return root
+
+
+class StaticAnalysis(ast.NodeVisitor):
+    """ Class for collecting everything the static attributes and the complexity need in a
+    single traversal of the tree. Nodes are compared by their position in the breadth-first
+    order of ast.walk(), so the results are the same as searching the tree separately per attribute. """
+
+    def __init__(self):
+        """ Initializes the StaticAnalysis instance.
 
         Keyword arguments:
-        self -- the RunCodeEnv instance
+        self -- the StaticAnalysis instance
         """
-        return self.__errfile
+        self.__root = None
+        self.reset(None)
 
-    def getPathErrFile(self):
-        """ Gets the error file name and path.
+    def reset(self, root):
+        """ Forgets the facts collected for the last tree.
 
         Keyword arguments:
-        self -- the RunCodeEnv instance
+        self -- the StaticAnalysis instance
+        root -- the root node of the tree that is analysed next
+        """
+        self.__root = root
+        self.__counter = 0 # number of nodes visited so far, i.e. the position in depth-first order
+        self.__path = [] # nodes from the root to the current node
+        self.__subtrees = [] # facts of the subtrees of the nodes in the path
+        self.__function_stack = [] # functions the current node is defined in
+        self.__while_stack = [] # while loops the current node is part of
+        self.__functions = []
+        self.__whiles = []
+        self.__loop_children = {root: []}
+        self.__non_scalars = {}
+        self.__for_name_iter = False
+        self.__for_no_range = False
+        self.__has_for = False
+        self.__has_while = False
+        self.__has_non_scalar = False
+        self.__loop_reuse = False
+
+    def analyse(self, root):
+        """ Traverses the tree once and collects the facts. Nothing is done if the
+        tree was already analysed.
+
+        Keyword arguments:
+        self -- the StaticAnalysis instance
+        root -- the root node of the abstract syntax tree
         """
-        return self.__pathErrFile
 
+        if self.root is root:
+            return self
+        self.reset(root)
+        self.visit(root)
+        # Sort by position in breadth-first order
+        self.__functions.sort(key=lambda function: function.get('key'))
+        self.__whiles.sort(key=lambda loop: loop.get('key'))
+        return self
 
-    def __del__(self):
-        """ Destructor of RunCodeEnv. Closes the stream to the
-        error file.
+    def visit(self, node):
+        """ Inherited from 'NodeVisitor'. Visits the node and adds the facts of its subtree
+        to the facts of the parent's subtree.
 
         Keyword arguments:
-        self -- the RunCodeEnv instance
+        self -- the StaticAnalysis instance
+        node -- the node to visit
         """
-        try:
-            self.errfile.close()
-        except IOError as ioe:
-            print("Error file could not be closed:", ioe)
 
-    prg = property(getPrg)
-    cmd = property(getCmd)
-    timeout = property(getTimeout)
-    venv_path = property(getVenvPath)
-    python_path = property(getPythonPath)
-    script_file = property(getScriptFile)
-    errfile = property(getErrFile)
-    pathErrFile = property(getPathErrFile)
+        # Depth first, then position in depth-first order gives the breadth-first order of ast.walk()
+        subtree = {'key': (len(self.__path), self.__counter), 'has_break': False, 'if_break': None, 'reuse_assign': None}
+        self.__counter += 1
+        self.__path.append(node)
+        self.__subtrees.append(subtree)
+        super().visit(node)
+        self.__subtrees.pop()
+        self.__path.pop()
+
+        if self.__subtrees:
+            parent = self.__subtrees[-1]
+            parent['has_break'] = parent.get('has_break') or subtree.get('has_break')
+            parent['if_break'] = firstFound(parent.get('if_break'), subtree.get('if_break'))
+            parent['reuse_assign'] = firstFound(parent.get('reuse_assign'), subtree.get('reuse_assign'))
 
+    def visit_FunctionDef(self, node):
+        """ Saves the function, the number of recursive calls and the variables they take.
 
+        Keyword arguments:
+        self -- the StaticAnalysis instance
+        node -- the function node
+        """
+        subtree = self.__subtrees[-1]
+        function = {'key': subtree.get('key'), 'name': node.name, 'rec_calls': 0, 'div_arg': False, 'arg_names': set(), 'reuse_assign': None}
+        self.__function_stack.append(function)
+        self.generic_visit(node)
+        self.__function_stack.pop()
+        function['reuse_assign'] = subtree.get('reuse_assign')
+        self.__functions.append(function)
 
-class RecCount():
+    def visit_Call(self, node):
+        """ Counts the call as recursive call of every enclosing function with the same name.
+
+        Keyword arguments:
+        self -- the StaticAnalysis instance
+        node -- the call node
+        """
+        self.generic_visit(node)
+        if not isinstance(node.func, ast.Name):
+            return
+        for function in self.__function_stack:
+            if function.get('name') == node.func.id:
+                function['rec_calls'] += 1
+                for arg in node.args:
+                    if isinstance(arg, ast.Name):
+                        function.get('arg_names').add(arg.id)
+                    # Check if the recursive call contains a division
+                    if isinstance(arg, ast.BinOp) and isinstance(arg.op, ast.Div):
+                        function['div_arg'] = True
+
+    def visit_For(self, node):
+        """ Saves the loop and how its iterable is given.
+
+        Keyword arguments:
+        self -- the StaticAnalysis instance
+        node -- the for node
+        """
+        self.__has_for = True
+        if isinstance(node.iter, ast.Name): # set or list is used, no call of range
+            self.__for_name_iter = True
+        if not(isinstance(node.iter, ast.Call) and isinstance(node.iter.func, ast.Name) and node.iter.func.id == "range"):
+            self.__for_no_range = True
+        self.visitLoop(node)
+
+    def visit_While(self, node):
+        """ Saves the loop, its loop condition and the variables divided in it.
+
+        Keyword arguments:
+        self -- the StaticAnalysis instance
+        node -- the while node
+        """
+        self.__has_while = True
+        subtree = self.__subtrees[-1]
+        loop = {'key': subtree.get('key'), 'node': node, 'if_break': None, 'div_assigns': []}
+        self.__while_stack.append(loop)
+        self.visitLoop(node)
+        self.__while_stack.pop()
+        if subtree.get('if_break') is not None:
+            loop['if_break'] = subtree.get('if_break')[1]
+        self.__whiles.append(loop)
+
+    def visitLoop(self, node):
+        """ Visits a loop and saves it as child of its parent if the parent is a loop or the root.
+
+        Keyword arguments:
+        self -- the StaticAnalysis instance
+        node -- the for or while node
+        """
+        parent = self.__path[-2]
+        if parent in self.__loop_children:
+            self.__loop_children[parent].append(node)
+        self.__loop_children[node] = []
+        self.generic_visit(node)
+        # A variable is assigned using itself in the loop; this is then done repeatedly
+        if self.__subtrees[-1].get('reuse_assign') is not None:
+            self.__loop_reuse = True
+
+    def visit_If(self, node):
+        """ Saves the if node as loop condition candidate if a 'break' is in its subtree.
+
+        Keyword arguments:
+        self -- the StaticAnalysis instance
+        node -- the if node
+        """
+        self.generic_visit(node)
+        subtree = self.__subtrees[-1]
+        if subtree.get('has_break'):
+            subtree['if_break'] = (subtree.get('key'), node)
+
+    def visit_Break(self, node):
+        """ Marks the subtree as containing a 'break'.
+
+        Keyword arguments:
+        self -- the StaticAnalysis instance
+        node -- the break node
+        """
+        self.__subtrees[-1]['has_break'] = True
+
+    def visit_Assign(self, node):
+        """ Saves assigned lists and sets, variables assigned using themselves and
+        variables divided in while loops.
+
+        Keyword arguments:
+        self -- the StaticAnalysis instance
+        node -- the assignment node
+        """
+        self.generic_visit(node)
+        subtree = self.__subtrees[-1]
+        key = subtree.get('key')
+        for target in node.targets:
+            if not isinstance(target, ast.Name):
+                continue
+            # Save the first assignment of a list or set to the variable
+            if isinstance(node.value, ast.Set) or isinstance(node.value, ast.List):
+                if target.id not in self.__non_scalars or key < self.__non_scalars.get(target.id):
+                    self.__non_scalars[target.id] = key
+            # The same variable is assigned to it directly or using a calculation; it is then reused
+            if subtree.get('reuse_assign') is None:
+                if (isinstance(node.value, ast.Name) and target.id == node.value.id) or isinstance(node.value, ast.BinOp):
+                    subtree['reuse_assign'] = (key, target.id)
+            # The variable is divided by a value, e.g. i = i / 2
+            if isinstance(node.value, ast.BinOp) and isinstance(node.value.op, ast.Div):
+                if isinstance(node.value.left, ast.Name) and node.value.left.id == target.id:
+                    for loop in self.__while_stack:
+                        loop.get('div_assigns').append(target.id)
+
+    def visit_Set(self, node):
+        """ Marks that a non scalar is used.
+
+        Keyword arguments:
+        self -- the StaticAnalysis instance
+        node -- the set node
+        """
+        self.__has_non_scalar = True
+        self.generic_visit(node)
+
+    def visit_List(self, node):
+        """ Marks that a non scalar is used.
+
+        Keyword arguments:
+        self -- the StaticAnalysis instance
+        node -- the list node
+        """
+        self.__has_non_scalar = True
+        self.generic_visit(node)
+
+    def getCheckedFunctions(self):
+        """ Returns the functions in breadth-first order, without a function that has
+        the same name as the function checked directly before.
+
+        Keyword arguments:
+        self -- the StaticAnalysis instance
+        """
+        checked = []
+        func_name = ""
+        for function in self.functions:
+            if function.get('name') != func_name or func_name == "":
+                func_name = function.get('name')
+                checked += [function]
+        return checked
+
+    # Class helper methods
+
+    def getRoot(self):
+        """ Gets the root node of the analysed tree.
+
+        Keyword arguments:
+        self -- the StaticAnalysis instance
+        """
+        return self.__root
+
+    def getFunctions(self):
+        """ Gets all function definitions in breadth-first order.
+
+        Keyword arguments:
+        self -- the StaticAnalysis instance
+        """
+        return self.__functions
+
+    def getWhiles(self):
+        """ Gets all while loops in breadth-first order.
+
+        Keyword arguments:
+        self -- the StaticAnalysis instance
+        """
+        return self.__whiles
+
+    def getLoopChildren(self):
+        """ Gets the loops that are direct children of the root or of a loop, per node.
+
+        Keyword arguments:
+        self -- the StaticAnalysis instance
+        """
+        return self.__loop_children
+
+    def getNonScalars(self):
+        """ Gets the position of the first assignment of a list or set, per variable name.
+
+        Keyword arguments:
+        self -- the StaticAnalysis instance
+        """
+        return self.__non_scalars
+
+    def getForNameIter(self):
+        """ Gets whether a for loop iterates over a variable.
+
+        Keyword arguments:
+        self -- the StaticAnalysis instance
+        """
+        return self.__for_name_iter
+
+    def getForNoRange(self):
+        """ Gets whether a for loop does not use 'range'.
+
+        Keyword arguments:
+        self -- the StaticAnalysis instance
+        """
+        return self.__for_no_range
+
+    def getHasFor(self):
+        """ Gets whether a for loop is present.
+
+        Keyword arguments:
+        self -- the StaticAnalysis instance
+        """
+        return self.__has_for
+
+    def getHasWhile(self):
+        """ Gets whether a while loop is present.
+
+        Keyword arguments:
+        self -- the StaticAnalysis instance
+        """
+        return self.__has_while
+
+    def getHasNonScalar(self):
+        """ Gets whether a list or set is used.
+
+        Keyword arguments:
+        self -- the StaticAnalysis instance
+        """
+        return self.__has_non_scalar
+
+    def getLoopReuse(self):
+        """ Gets whether a variable is assigned using itself in a loop.
+
+        Keyword arguments:
+        self -- the StaticAnalysis instance
+        """
+        return self.__loop_reuse
+
+    root = property(getRoot)
+    functions = property(getFunctions)
+    whiles = property(getWhiles)
+    loop_children = property(getLoopChildren)
+    non_scalars = property(getNonScalars)
+    for_name_iter = property(getForNameIter)
+    for_no_range = property(getForNoRange)
+    has_for = property(getHasFor)
+    has_while = property(getHasWhile)
+    has_non_scalar = property(getHasNonScalar)
+    loop_reuse = property(getLoopReuse)
+
+
+def firstFound(first, second):
+    """ Returns the one of two found (position, value) pairs that comes first in
+    breadth-first order, or the other one if one was not found (None).
+
+    Keyword arguments:
+    first -- the first pair or None
+    second -- the second pair or None
+    """
+    if first is None:
+        return second
+    if second is None or first[0] < second[0]:
+        return first
+    return second
+
+
+class StaticAttribute():
+    """ Parent class for the attributes that are calculated from the facts of the static analysis. """
+
+    def __init__(self, static=None):
+        """ Initializes the attribute instance.
+
+        Keyword arguments:
+        self -- the attribute instance
+        static -- the StaticAnalysis to take the facts from, shared with the other attributes (default None, creates an own one)
+        """
+        self.__static = static if static is not None else StaticAnalysis()
+
+    # Class helper methods
+
+    def getStatic(self):
+        """ Gets the static analysis.
+
+        Keyword arguments:
+        self -- the attribute instance
+        """
+        return self.__static
+
+    static = property(getStatic)
+
+
+class RecCount(StaticAttribute):
     """ Class for checking the number of recursive calls in a function. """
 
     def getAttribute(self, root):
@@ -211,26 +681,17 @@ class RecCount():
 
         rec_count = 0
         comp_val = 0
-        func_name = ""
-        for node in ast.walk(root):
-            # Check for a function and save the name
-            if isinstance(node, ast.FunctionDef):
-                if node.name != func_name or func_name == "":
-                    func_name = node.name
-                    # Check if the function is called recursively and count how many times
-                    for child in ast.walk(node):
-                        if isinstance(child, ast.Call) and child.func.id == func_name:  
-                            comp_val = comp_val + 1
-
+        for function in self.static.analyse(root).getCheckedFunctions():
+            comp_val = comp_val + function.get('rec_calls')
             # Check if compare value is higher than old value
             if comp_val > rec_count:
                 rec_count = comp_val
                 comp_val = 0
-            
+
         return rec_count
 
 
-class LoopNDepend():
+class LoopNDepend(StaticAttribute):
     """ Class for checking whether a loop depends on the length of a set or list. """
 
     def getAttribute(self, root):
@@ -242,90 +703,68 @@ class LoopNDepend():
         root -- the root node of the abstract syntax tree
         """
 
-        n_depend = 0
-        non_scalars = []
-        for node in ast.walk(root):
-            # Search the complete tree for any assignment where a list or set is used (on the left side) and save the variable name
-            if isinstance(node, ast.Assign):
-                if isinstance(node.value, ast.Set) or isinstance(node.value, ast.List):
-                    for target in node.targets:
-                        non_scalars += [target.id]
-
-            # For for-loops, only check that a name (no call of 'range') is used; it is n_depend then            
-            if isinstance(node, ast.For):
-                if isinstance(node.iter, ast.Name): # set or list is used, no call of range
-                    n_depend = 1
-                    break
-            
-            if isinstance(node, ast.While):
-                # Here, only do-while-loops can be parsed
-                # So, search for the loop condition, i.e. the if-condition with a break in the if-body
-                ifBreakNode = self.getIfNodeWithBreak(node)
-                if ifBreakNode != None:
-                    # Check if there is a comparison
-                    if isinstance(ifBreakNode.test, ast.Compare):
-                        # Check left side for a name, i.e. the complete variable name
-                        if isinstance(ifBreakNode.test.left, ast.Name) and ifBreakNode.test.left.id in non_scalars:
-                            n_depend = 1                            
-                            break
-                        # Check left side for a subscript, i.e. calling the variable name with a certain index
-                        if isinstance(ifBreakNode.test.left, ast.Subscript):
-                            if isinstance(ifBreakNode.test.left.value, ast.Name) and ifBreakNode.test.left.value.id in non_scalars:
-                                n_depend = 1                            
-                                break
-                        # Check the right side for the non scalar
-                        for comp in ifBreakNode.test.comparators:
-                            # Check for a name, see above
-                            if isinstance(comp, ast.Name) and comp.id in non_scalars:
-                                n_depend = 1
-                                break
-                            # CHeck for a subscript, see above
-                            if isinstance(comp, ast.Subscript):
-                                if isinstance(comp.value, ast.Name) and comp.value.id in non_scalars:
-                                    n_depend = 1
-                                    break
-
-
-        return n_depend
-
-    def getIfNodeWithBreak(self, whileNode):
-        """ Searches the subtree for an if-node that contains a 'break' statement
-        in the body. This is the loop-condition for the do-while-loop.
-
-        Keyword arguments:
-        self -- the LoopNDepend instance
-        whileNode -- the while node and subtree to search in
-        """
-        
-        for node in ast.walk(whileNode):
-            # First, search for an if node
-            if isinstance(node, ast.If):
-                # Then, check the subtree for a break statement
-                for child in ast.walk(node):
-                    if isinstance(child, ast.Break):
-                        return node
-        return None
+        static = self.static.analyse(root)
+
+        # For for-loops, only check that a name (no call of 'range') is used; it is n_depend then
+        if static.for_name_iter:
+            return 1
+
+        for loop in static.whiles:
+            # Here, only do-while-loops can be parsed
+            # So, the loop condition is the if-condition with a break in the if-body
+            ifBreakNode = loop.get('if_break')
+            # Check if there is a comparison
+            if ifBreakNode is None or not isinstance(ifBreakNode.test, ast.Compare):
+                continue
+            # Check both sides for a name, i.e. the complete variable name, or a subscript, i.e. calling the variable name with a certain index
+            for side in [ifBreakNode.test.left] + ifBreakNode.test.comparators:
+                if isinstance(side, ast.Subscript):
+                    side = side.value
+                # The list or set has to be assigned before the loop
+                if isinstance(side, ast.Name) and static.non_scalars.get(side.id, loop.get('key')) < loop.get('key'):
+                    return 1
+
+        return 0
 
 class ProgTerminate():
     """ Class for checking whether the algorithm terminates normally or not. """
 
+    def __init__(self, dynamic=None):
+        """ Initializes the ProgTerminate instance.
+
+        Keyword arguments:
+        self -- the ProgTerminate instance
+        dynamic -- the DynamicAnalysis to take the result from, shared with RepeatValues (default None, creates an own one)
+        """
+        self.__dynamic = dynamic if dynamic is not None else DynamicAnalysis()
+
     def getAttribute(self, root):
-        """ Gets the 'ProgTerminate' attribute. Returns 0 if the program terminates after
-        TIMEOUT_TIME seconds normally, or 1 if it was necessary to kill it.
+        """ Gets the 'ProgTerminate' attribute. Returns 0 if the program terminates normally
+        within the limits of the sandbox, or 1 if it was stopped by a limit or it raised an error.
 
         Keyword arguments:
         self -- the ProgTerminate instance
         root -- the root node of the abstract syntax tree
         """
 
-        code = astor.to_source(root)
-        venv = RunCodeEnv(code)
-        if isinstance(venv, RunCodeEnv):
-            result = venv.Run(self)
-            venv.cleanUp()
-        return result
+        result = self.dynamic.getResult(root)
+        if result.get('termination') == TERMINATED_NORMALLY:
+            return 0
+        return 1
+
+    # Class helper methods
+
+    def getDynamic(self):
+        """ Gets the dynamic analysis.
+
+        Keyword arguments:
+        self -- the ProgTerminate instance
+        """
+        return self.__dynamic
 
-class LoopNested():
+    dynamic = property(getDynamic)
+
+class LoopNested(StaticAttribute):
     """ Class for checking the number of nested loops. """
 
     def getAttribute(self, root):
@@ -337,51 +776,45 @@ class LoopNested():
         root -- the root node of the abstract syntax tree
         """
 
+        loop_children = self.static.analyse(root).loop_children
         nested_loop = 0
         comp_val = 0
-        
-        # Initialization: Get child nodes to search in and save parent node
-        children = ast.iter_child_nodes(root)
+
+        # Initialization: Only loops that are children of the root or of a loop are searched; save parent node
+        parent = root
         last_parents = [root]
-        child = next(children)
-        visited = [root]
+        next_child = {} # index of the next child to search, per parent; children before it were already visited
         loop_found = False
 
         # Depth-first-search
         while True:
-            # Only search child if it was not already visited
-            if child not in visited: 
-                visited += [child]
-
-                # Check if child is a loop
-                if isinstance(child, ast.For) or isinstance(child, ast.While):
-                    # Increment the number of nested loops and set child to children of the loop to search the subtree for more loops
-                    loop_found = True
-                    comp_val = comp_val + 1
-                    last_parents += [child]
-                    children = ast.iter_child_nodes(child)
-
-            # Continue iterating
-            try:
-                child = next(children)
-            except StopIteration: # No more children to iterate
-                # New value is higher than last value
-                if comp_val > nested_loop:
-                    nested_loop = comp_val
-                # Go back to last visited parent and continue searching the subtree, if there is a parent left
-                try:
-                    child = last_parents.pop()
-                    children = ast.iter_child_nodes(child)
-                    # Do not completely reset the compare value, but decrement it when there was a loop previously
-                    if comp_val > 0 and loop_found:
-                        comp_val -= 1
-                    loop_found = False
-                except IndexError:
-                    break
-                    
+            index = next_child.get(parent, 0)
+            if index < len(loop_children.get(parent)):
+                # Increment the number of nested loops and continue with the children of the loop to search the subtree for more loops
+                child = loop_children.get(parent)[index]
+                next_child[parent] = index + 1
+                loop_found = True
+                comp_val = comp_val + 1
+                last_parents += [child]
+                parent = child
+                continue
+
+            # No more children to search
+            # New value is higher than last value
+            if comp_val > nested_loop:
+                nested_loop = comp_val
+            # Go back to last visited parent and continue searching the subtree, if there is a parent left
+            if not last_parents:
+                break
+            parent = last_parents.pop()
+            # Do not completely reset the compare value, but decrement it when there was a loop previously
+            if comp_val > 0 and loop_found:
+                comp_val -= 1
+            loop_found = False
+
         return nested_loop
 
-class LoopType():
+class LoopType(StaticAttribute):
     """ Class for checking the type of the loop if present. """
 
     def getAttribute(self, root):
@@ -393,15 +826,14 @@ class LoopType():
         root -- the root node of the abstract syntax tree
         """
 
-        loop_type = 0
-        for node in ast.walk(root):
-            if isinstance(node, ast.For) and loop_type < 2:
-                loop_type = 1
-            if isinstance(node, ast.While):
-                loop_type = 2
-        return loop_type
+        static = self.static.analyse(root)
+        if static.has_while:
+            return 2
+        if static.has_for:
+            return 1
+        return 0
 
-class UsingNonScalar():
+class UsingNonScalar(StaticAttribute):
     """ Class for checking on the use of non scalars. """
 
     def getAttribute(self, root):
@@ -412,16 +844,22 @@ class UsingNonScalar():
         self -- the UsingNonScalar instance
         root -- the root node of the abstract syntax tree
         """
-        nonscalar_found = 0
-        for node in ast.walk(root):
-            # Check if a set or list was used
-            if isinstance(node, ast.Set) or isinstance(node, ast.List):
-                nonscalar_found = 1
-        return nonscalar_found
+        if self.static.analyse(root).has_non_scalar:
+            return 1
+        return 0
 
 class RepeatValues():
     """ Class for checking on repeating values. """
 
+    def __init__(self, dynamic=None):
+        """ Initializes the RepeatValues instance.
+
+        Keyword arguments:
+        self -- the RepeatValues instance
+        dynamic -- the DynamicAnalysis to take the result from, shared with ProgTerminate (default None, creates an own one)
+        """
+        self.__dynamic = dynamic if dynamic is not None else DynamicAnalysis()
+
     def getAttribute(self, root):
         """ Gets the 'RepeatValues' attribute. Returns 1 if the same value is assigned
         more than once to the same variable, 0 otherwise.
@@ -431,95 +869,22 @@ class RepeatValues():
         root -- the root node of the abstract syntax tree
         """
 
-        # Add function call at every var assignment
-        for node in ast.walk(root):
-            assign_childs = self.checkForDirectAssignChild(node)
-            # For all direct children with assignment, add a function call to 'addToSaveVarValues'
-            for child in assign_childs:
-                try:
-                    for target in child.targets: # do it for all targets in the assignment, e.g. 'a, b = ...'
-                        if isinstance(target, ast.Name):
-                            curNode = ast.Expr(value=ast.Call(func=ast.Name(id='addToSaveVarValues', ctx=ast.Load()), 
-                                                args=[ast.Name(id="'" + target.id + "'", ctx=ast.Load()), child.value],
-                                                keywords=[]))
-                            node.body.insert(0, curNode)
-                            ast.fix_missing_locations(curNode) # automatically adds the attributes 'lineno' and 'col_offset' of the added node needed by AST
-                           
-                except AttributeError:
-                    pass # node object has no body attribute - avoid inserting node more than once
-
-        code = astor.to_source(root)
-
-        # New code with added function
-        code = """
-saveVarValues = { }
-
-def addToSaveVarValues(var, value):
-    found = False
-    try:
-        for values in saveVarValues.get(str(var)):
-            if value == values:
-                found = True
-    except TypeError:
-        saveVarValues[str(var)] = []
-    except KeyError:
-        found = False
-
-    if not(found):
-        saveVarValues[str(var)] += [value]
-    else:
-        try:
-            checkFile = open( "%s", "w")
-            checkFile.write("1")
-            checkFile.close()
-        except IOError as ioe:
-            print("Error while writing saved var values to file:", ioe)
-
-""" % (TEMP_DIR + "virtualenvs/checkFile.txt") + code
-
-        # Execute the extended code
-        venv = RunCodeEnv(code)
-        if isinstance(venv, RunCodeEnv):
-            venv.Run(self)
-
-        # Read the result
-        result = 0
-        try:
-            checkFile = open(TEMP_DIR + "virtualenvs/checkFile.txt", "r")
-            res_file = checkFile.read()
-            if int(res_file) == 1:
-                result = 1
-            checkFile.close()
-        except IOError as ioe:
-            print("Could not open saved var values file:", ioe)
-            print("Possibly none existing.")
-        except ValueError:
-            result = 0
-
-        if isinstance(venv, RunCodeEnv):
-            venv.cleanUp()
+        return self.dynamic.getResult(root).get('repeat_values')
 
-        return result
+    # Class helper methods
 
-    def checkForDirectAssignChild(self, node):
-        """ Checks the node's direct children for assignment nodes
-        and returns them if present.
+    def getDynamic(self):
+        """ Gets the dynamic analysis.
 
         Keyword arguments:
         self -- the RepeatValues instance
-        node -- the subtree node root to search in
         """
+        return self.__dynamic
 
-        assign_childs = []
-        # In contrast to ast.walk(node), only iterate over the direct children of node
-        for child in ast.iter_child_nodes(node):
-            if isinstance(child, ast.Assign):
-                assign_childs += [child]
-        return assign_childs
-
+    dynamic = property(getDynamic)
 
 
-class ReuseValues():
+class ReuseValues(StaticAttribute):
     """ Class for checking on reused values. """
 
     def getAttribute(self, root):
@@ -530,88 +895,73 @@ class ReuseValues():
         self -- the ReuseValues instance
         root -- the root node of the abstract syntax tree
         """
-        reuse_values = 0
-        func_name = ""
-        indexVars = {}
-        for node in ast.walk(root):
-            # Check if a variable is used and assigned in a loop; this is then done repeatedly
-            if isinstance(node, ast.While) or isinstance(node, ast.For):
-                if self.checkSubTreeForVarName(node) is not None:
-                    reuse_values = 1
-                    break
-
-            # Check if a variable is used and assigned in a recursive function and taken into function call; this is then done repeatedly
-            if isinstance(node, ast.FunctionDef):
-                # Get the function name
-                if node.name != func_name or func_name == "":
-                    func_name = node.name
-                    # Get the variable name which could possibly be repeatedly called
-                    var_name = self.checkSubTreeForVarName(node)
-                    if var_name is not None:
-                        indexVars[var_name] = node
-                    # Check children of function for a recursive call
-                    for child in ast.walk(node):
-                        if isinstance(child, ast.Call) and child.func.id == func_name: 
-                            # Now it is a recursive function; check reuse
-                            for arg in child.args:
-                                if isinstance(arg, ast.Name) and arg.id in indexVars and indexVars[arg.id] == node:
-                                    reuse_values = 1
-                                    break
-
-        return reuse_values
-
-    def checkSubTreeForVarName(self, node):
-        """ Checks a given sub tree for an assignment in which a
-        variable is present on both sides of the assignment, e.g. i = 1 + i.
-        Returns the variable name for which this is the case, None otherwise.
+
+        static = self.static.analyse(root)
+
+        # Check if a variable is used and assigned in a loop; this is then done repeatedly
+        if static.loop_reuse:
+            return 1
+
+        # Check if a variable is used and assigned in a recursive function and taken into function call; this is then done repeatedly
+        for function in static.getCheckedFunctions():
+            # The variable name which could possibly be repeatedly called, i.e. the first one assigned using itself
+            reuse_assign = function.get('reuse_assign')
+            if reuse_assign is not None and reuse_assign[1] in function.get('arg_names'):
+                return 1
+
+        return 0
+
+class FeatureVector(NamedTuple):
+    """ Class for the extracted attributes of an algorithm (prediction case), in the
+    order of the columns the machine learning model was trained with. Unlike AlgorithmData,
+    it is only kept in memory. """
+
+    rec_count: int
+    loop_n_depend: int
+    loop_nested: int
+    loop_type: int
+    prog_terminate: int
+    using_non_scalar: int
+    repeat_values: int
+    reuse_values: int
+    complexity: int
+
+    @classmethod
+    def fromAttributes(cls, attr_list):
+        """ Returns the feature vector for the extracted attributes.
 
         Keyword arguments:
-        self -- the ReuseValues instance
-        node -- the subtree root node to search in
-        """
-
-        var_name = None
-        for child in ast.walk(node):
-            # Search for assignment node
-            if isinstance(child, ast.Assign):
-                for target in child.targets:
-                    # Check for a variable name
-                    if isinstance(target, ast.Name):
-                        # Checks if the same variable is assigned to it directly; it is then reused
-                        if isinstance(child.value, ast.Name) and target.id == child.value.id:
-                            return target.id
-                        # Checks if the same variable is assigned using a calculation; it is then reused
-                        elif isinstance(child.value, ast.BinOp):
-                            for subchild in ast.walk(child):
-                                if isinstance(subchild, ast.Name) and target.id == subchild.id:
-                                    return target.id
-                            
-        return var_name
+        cls -- the FeatureVector class
+        attr_list -- dictionary containing the names and values of the attributes, as returned by AttributeFinder.extractAttributes()
+        """
+        return cls(int(attr_list.get('RecCount')), int(attr_list.get('LoopNDepend')), int(attr_list.get('LoopNested')),
+                   int(attr_list.get('LoopType')), int(attr_list.get('ProgTerminate')), int(attr_list.get('UsingNonScalar')),
+                   int(attr_list.get('RepeatValues')), int(attr_list.get('ReuseValues')), int(attr_list.get('Complexity')))
+
 
 class AttributeFinder():
     """ Main class for extracting attributes """
     
-    def __init__(self, base_dir, attrs_as_dict = False):
+    def __init__(self, attrs_as_dict = False):
         """ Initializes the AttributeFinder instance.
 
         Keyword arguments:
         self -- the AttributeFinder instance
-        base_dir -- the basic temporary directory to work on
-        attrs_as_dict -- if set to True, the attributes are (later) returned as dictionary; else, they are returned as AlgorithmData object (default False)
+        attrs_as_dict -- if set to True, the attributes are (later) returned as dictionary; else, they are returned as FeatureVector (default False)
         """
 
-        global TEMP_DIR
-        TEMP_DIR = base_dir
         self.__delimiter = ","
+        self.__dynamic = DynamicAnalysis() # executes the code once for ProgTerminate and RepeatValues
+        self.__static = StaticAnalysis() # traverses the tree once for all other attributes and the complexity
         self.__attr_classes = {
-            "Number of recursive calls in a recursive function": RecCount(),
-            "Loop condition depends on a length n": LoopNDepend(),
-            "Number of nested loops": LoopNested(),
-            "Type of loop": LoopType(),
-            "Program terminates normally and independently": ProgTerminate(),
-            "At least one non scalar is used": UsingNonScalar(),
-            "Repeating values are assigned to variable": RepeatValues(),
-            "Variable is used repeatedly": ReuseValues(),
+            "Number of recursive calls in a recursive function": RecCount(self.static),
+            "Loop condition depends on a length n": LoopNDepend(self.static),
+            "Number of nested loops": LoopNested(self.static),
+            "Type of loop": LoopType(self.static),
+            "Program terminates normally and independently": ProgTerminate(self.dynamic),
+            "At least one non scalar is used": UsingNonScalar(self.static),
+            "Repeating values are assigned to variable": RepeatValues(self.dynamic),
+            "Variable is used repeatedly": ReuseValues(self.static),
         }
         self.__attr_pattern = []
         for key in self.attr_classes.keys():
@@ -643,7 +993,7 @@ class AttributeFinder():
  
     def extractAttributes(self, root):
         """ Method to extract the attributes. Depending on initializiation of the class,
-        a dictionary or an instance of AlgorithmData is returned.
+        a dictionary or a FeatureVector is returned.
 
         Keyword arguments:
         self -- the AttributeFinder instance
@@ -663,17 +1013,27 @@ class AttributeFinder():
             # Calculate the complexity
             self.results['Complexity'] = self.getComplexity(root)
 
-        # Return an object if attrs_as_dict is set to False
+        # Return a feature vector if attrs_as_dict is set to False
         if not(self.attrs_as_dict):
-            predObj = AlgorithmData()
-            predObj.initAttr(self.results)
-            predObj.save()
-            return predObj
+            return FeatureVector.fromAttributes(self.results)
         
         else:
             return self.results
 
 
+    def isReproducible(self, root):
+        """ Returns whether the attributes only depend on the code. They do not if the run of the
+        program was stopped at the timeout, e.g. while the sandbox was overloaded, or if the sandbox
+        runner sent no status, e.g. as the sandbox failed or the child was killed from outside.
+
+        Keyword arguments:
+        self -- the AttributeFinder instance
+        root -- the root node of the abstract syntax tree
+        """
+
+        result = self.dynamic.getResult(root)
+        return result.get('limit') != LIMIT_TIMEOUT and result.get('status') is not None
+
     def getComplexity(self, root):
         """ Gets the complexity of the algorithm.
 
@@ -682,14 +1042,12 @@ class AttributeFinder():
         root -- the root node of the abstract syntax tree
         """
 
-        func_name = ""
-        divOp = False
-        isRec = False
-
         mainComplex = 0 # constant if no other applies
 
         # Try getting the result of ProgTerminate
-        progTerm = self.results.get('ProgTerminate')
+        progTerm = None
+        if self.results is not None:
+            progTerm = self.results.get('ProgTerminate')
 
         # If not existent, call the extractAttributes method
         if progTerm is None:
@@ -701,20 +1059,17 @@ class AttributeFinder():
             mainComplex = 4
             return str(mainComplex)
 
+        static = self.static.analyse(root)
+
         # Check whether, if a recursion is present, the arguments in the recursive call are minimized by recursion
-        for node in ast.walk(root):
-            # Check if there is a function
-            if isinstance(node, ast.FunctionDef):
-                if node.name != func_name or func_name == "":
-                    func_name = node.name
-                    for child in ast.walk(node):
-                        # Check if there is a recursive call in the function
-                        if isinstance(child, ast.Call) and child.func.id == func_name: 
-                            isRec = True
-                            # Check if the recursive call contains a calculation respectively a division
-                            for item in child.args:
-                                if isinstance(item, ast.BinOp) and isinstance(item.op, ast.Div):
-                                    divOp = True
+        isRec = False
+        divOp = False
+        for function in static.getCheckedFunctions():
+            if function.get('rec_calls') > 0:
+                isRec = True
+                # Check if the recursive call contains a calculation respectively a division
+                if function.get('div_arg'):
+                    divOp = True
 
         # first check on exponential: recursion
         if isRec:
@@ -723,41 +1078,24 @@ class AttributeFinder():
                 mainComplex = 4
                 return str(mainComplex)
 
-        curComplex = 0
-
         indexVars = {}
-        logWhiles = []
+        logWhiles = set()
 
         # Check logarithmic which is present if the variable for a while loop is minimized by dividing in the loop body
-        for node in ast.walk(root):
-            # Check if there is a while loop
-            if isinstance(node, ast.While):
-                ifNode = LoopNDepend().getIfNodeWithBreak(node)
-                # Check if a variable is used for the loop condition and save the name
-                if ifNode is not None and isinstance(ifNode.test, ast.Compare):
-                    if isinstance(ifNode.test.left, ast.Name):
-                        indexVars[ifNode.test.left.id] = node
-                    elif isinstance(ifNode.test.comparators, ast.Name):
-                        indexVars[ifNode.test.comparators.id] = node
-                
-                for child in ast.walk(node):
-                    # Check if there is an assignment in the while loop
-                    if isinstance(child, ast.Assign):
-                        # Check if the assignment contains a saved variable from the loop condition
-                        for target in child.targets:
-                            if isinstance(target, ast.Name) and target.id in indexVars:
-                                if isinstance(child.value, ast.BinOp):
-                                    if isinstance(child.value.left, ast.Name) and child.value.left.id == target.id:
-                                        # Check if there is a division in the calculation
-                                        if isinstance(child.value.op, ast.Div):
-                                            curComplex = 1
-                                            logWhiles += [indexVars.get(target.id)]
-
-            # If the current complexity is higher than before, set it as new complexity
-            if curComplex > mainComplex:
-                mainComplex = curComplex
-            curComplex = 0
-
+        for loop in static.whiles:
+            ifNode = loop.get('if_break')
+            # Check if a variable is used for the loop condition and save the name
+            if ifNode is not None and isinstance(ifNode.test, ast.Compare):
+                if isinstance(ifNode.test.left, ast.Name):
+                    indexVars[ifNode.test.left.id] = loop.get('node')
+
+            # Check if a saved variable from the loop condition is divided in the while loop
+            for var_name in loop.get('div_assigns'):
+                if var_name in indexVars:
+                    logWhiles.add(indexVars.get(var_name))
+                    # If the current complexity is higher than before, set it as new complexity
+                    if 1 > mainComplex:
+                        mainComplex = 1
 
         # Get number of nested loops; if not present, call the extractAttributes method
         numLoops = self.results.get('LoopNested')
@@ -775,24 +1113,18 @@ class AttributeFinder():
             mainComplex = 3
 
         # Check loop-exponential complexity
-        for node in ast.walk(root):
-            
-            if isinstance(node, ast.For):
-                # check for use of 'range'; if not, complexity is set to exponential
-                if not(isinstance(node.iter, ast.Call) and node.iter.func.id == "range"):
-                    curComplex = 4
-           
-                    
-            if isinstance(node, ast.While) and not(node in logWhiles):
-                # if while is no log-while and not n dependent: no defined end; complexity is exponential
-                n_depend = self.results.get('LoopNDepend')
-                if n_depend == 0:
-                    curComplex = 4
-
-            # If the current complexity is higher than before, set it as new complexity
-            if curComplex > mainComplex:
-                mainComplex = curComplex
-            curComplex = 0
+        curComplex = 0
+        # check for use of 'range'; if not, complexity is set to exponential
+        if static.for_no_range:
+            curComplex = 4
+        # if while is no log-while and not n dependent: no defined end; complexity is exponential
+        for loop in static.whiles:
+            if not(loop.get('node') in logWhiles) and self.results.get('LoopNDepend') == 0:
+                curComplex = 4
+
+        # If the current complexity is higher than before, set it as new complexity
+        if curComplex > mainComplex:
+            mainComplex = curComplex
         
         return str(mainComplex)
 
@@ -822,6 +1154,22 @@ class AttributeFinder():
         """
         return self.__delimiter
 
+    def getStatic(self):
+        """  Returns the static analysis shared by the attribute classes.
+
+        Keyword arguments:
+        self -- the AttributeFinder instance
+        """
+        return self.__static
+
+    def getDynamic(self):
+        """  Returns the dynamic analysis shared by the attribute classes.
+
+        Keyword arguments:
+        self -- the AttributeFinder instance
+        """
+        return self.__dynamic
+
     def getResults(self):
         """  Returns the extraction result.
 
@@ -851,5 +1199,7 @@ class AttributeFinder():
     attr_classes = property(getAttrClasses)
     delimiter = property(getDelimiter)
     attrs_as_dict = property(getAttrsAsDict)
+    static = property(getStatic)
+    dynamic = property(getDynamic)
     results = property(getResults, setResults)
 
@@ -0,0 +1,148 @@
+import atexit
+import multiprocessing
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from threading import Lock
+
+import django
+
+
+WORKERS = 2 # default number of worker processes, overridden by settings.BATCH_WORKERS
+MAX_SIZE = 500 # default maximum number of programs per batch, overridden by settings.BATCH_MAX_SIZE
+
+_executor = None
+_executor_pid = None
+_executor_lock = Lock()
+
+def initWorker():
+    """ Sets up Django in a new worker process. The worker processes live as long as
+    the pool, so their sandbox pool, linter, model and result cache are reused for
+    all programs they analyse. """
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "AlgoBooster.settings")
+    django.setup()
+
+    from ab_ui.ab_main import sandbox_pool
+    sandbox_pool.warmUpPool()
+
+def analyse(code):
+    """ Analyses a single pseudo code in a worker process. Returns a tuple of the
+    result of startAB() and the seconds spent per stage.
+
+    Keyword arguments:
+    code -- the input pseudo code
+    """
+
+    # imported here, as the models can only be loaded after initWorker()
+    from ab_ui.ab_main import ab_controller
+    timings = {}
+    result = ab_controller.startAB(code, timings=timings)
+    return (result, timings)
+
+def createExecutor(workers):
+    """ Returns a new process pool for the analysis.
+
+    Keyword arguments:
+    workers -- the number of worker processes
+    """
+
+    # 'spawn' as the web process has threads (e.g. the training worker) that must not be forked
+    return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"), initializer=initWorker)
+
+def getExecutor():
+    """ Returns the process pool of the current process and creates it on first use. """
+
+    global _executor, _executor_pid
+    with _executor_lock:
+        if _executor is None or _executor_pid != os.getpid():
+            from django.conf import settings
+            _executor_pid = os.getpid()
+            _executor = createExecutor(getattr(settings, 'BATCH_WORKERS', WORKERS))
+            atexit.register(_executor.shutdown)
+    return _executor
+
+def resetExecutor(executor):
+    """ Forgets a broken process pool, so the next batch creates a new one.
+
+    Keyword arguments:
+    executor -- the broken process pool
+    """
+
+    global _executor
+    with _executor_lock:
+        if _executor is executor:
+            _executor = None
+
+def runAll(get_executor, items, max_pending):
+    """ Analyses the pseudo codes in a process pool. Yields a tuple of the key of the code,
+    its result and the seconds spent per stage as soon as it was analysed, so the order
+    differs from the input. The items are only read while less than max_pending codes are
+    analysed, so an iterator over many codes is not loaded at once. If the analysis of a code
+    failed, the result only contains an 'error' message. If a worker process died, the broken
+    pool is replaced by a new one from get_executor for the remaining codes.
+
+    Keyword arguments:
+    get_executor -- a function returning the process pool to use, called again after it broke
+    items -- an iterable of tuples of a key and a pseudo code
+    max_pending -- the maximum number of codes submitted to the pool at the same time
+    """
+
+    items = iter(items)
+    executor = get_executor()
+    pending = {} # future -> (key, process pool it was submitted to)
+    exhausted = False
+    while True:
+        # Fill up the pending codes
+        while not exhausted and len(pending) < max_pending:
+            try:
+                (key, code) = next(items)
+            except StopIteration:
+                exhausted = True
+                break
+            try:
+                pending[executor.submit(analyse, code)] = (key, executor)
+            except BrokenProcessPool:
+                executor = replaceExecutor(get_executor, executor)
+                try:
+                    pending[executor.submit(analyse, code)] = (key, executor)
+                except BrokenProcessPool as bpp:
+                    yield (key, {'error': "Analysis failed: " + str(bpp)}, {})
+        if not pending:
+            return
+
+        (done, _) = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            (key, submitted_to) = pending.pop(future)
+            try:
+                (result, timings) = future.result()
+            except BrokenProcessPool as bpp:
+                if submitted_to is executor:
+                    executor = replaceExecutor(get_executor, executor)
+                (result, timings) = ({'error': "Analysis failed: " + str(bpp)}, {})
+            except Exception as exc:
+                (result, timings) = ({'error': "Analysis failed: " + str(exc)}, {})
+            yield (key, result, timings)
+
+def replaceExecutor(get_executor, executor):
+    """ Shuts a broken process pool down and returns the new one to use instead.
+
+    Keyword arguments:
+    get_executor -- the function returning the process pool to use
+    executor -- the broken process pool
+    """
+
+    resetExecutor(executor)
+    executor.shutdown(wait=False)
+    return get_executor()
+
+def runBatch(codes):
+    """ Analyses the pseudo codes in parallel in the process pool of the current process.
+    Yields a tuple of the index of the code and its result as soon as it was analysed.
+
+    Keyword arguments:
+    codes -- the list of input pseudo codes
+    """
+
+    for (index, result, _) in runAll(getExecutor, enumerate(codes), len(codes)):
+        yield (index, result)
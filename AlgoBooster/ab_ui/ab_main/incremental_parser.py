@@ -0,0 +1,180 @@
+import copy
+from collections import OrderedDict
+from threading import Lock
+
+from django.conf import settings
+
+from ab_ui.ab_main.ps2py_parser import ps2py_yacc
+from ab_ui.ab_main.ps2py_parser import ps2py_ast
+from ab_ui.ab_main.ps2py_parser import ps2py_lex
+
+
+SESSIONS = 100 # default number of sessions whose blocks are kept, overridden by settings.LIVE_PARSE_SESSIONS
+
+# Tokens changing the nesting depth of the blocks
+OPENING = {'PROCEDURE', 'FOR', 'REPEAT', 'IF'}
+CLOSING = {'ENDPROC', 'ENDFOR', 'UNTIL', 'ENDIF'}
+
+# Tokens a statement can start with besides an assignment, and the ones it can end with
+STARTING = {'PROCEDURE', 'FOR', 'REPEAT', 'IF', 'RETURN'}
+ENDING = {'NUMBER', 'NAME', 'RPARENROUND', 'RPARENANG', 'RBRACE', 'ENDPROC', 'ENDFOR', 'ENDIF'}
+
+_parsers = None
+_parsers_lock = Lock()
+
+class IncrementalParser():
+    """ Class for parsing the pseudo code of an editor again after every change.
+    The code is split into blocks of top level statements (see splitBlocks()), and only
+    the blocks that changed since the last call are parsed; the others are taken from it. """
+
+    def __init__(self):
+        """ Initializes the IncrementalParser instance.
+
+        Keyword arguments:
+        self -- the IncrementalParser instance
+        """
+        self.__lexer = ps2py_lex.lexer.clone()
+        self.__lines = {} # summaries of the lines of the last code, by their text
+        self.__blocks = {} # parse results of the blocks of the last code, by their text
+        self.__lock = Lock()
+
+    def parse(self, code):
+        """ Parses pseudo code to Python. Returns a dictionary containing the Python code
+        of all blocks that could be parsed ('code'), the syntax errors ('errors'), the
+        number of blocks ('blocks') and the number of blocks that had to be parsed ('parsed').
+
+        Keyword arguments:
+        self -- the IncrementalParser instance
+        code -- the pseudo code to parse
+        """
+        # the same editor sends its changes one after another, so they are parsed in order
+        with self.__lock:
+            lines = code.split("\n")
+            summaries = {}
+            for line in lines:
+                if line not in summaries:
+                    summaries[line] = self.__lines[line] if line in self.__lines else self.summarizeLine(line)
+            self.__lines = summaries
+
+            py_lines = []
+            errors = []
+            blocks = {}
+            count = 0
+            parsed = 0
+            parser = ps2py_yacc.getParser()
+            for (start, end, offset) in splitBlocks(lines, summaries):
+                text = "\n".join(lines[start:end])
+                block = blocks.get(text) or self.__blocks.get(text)
+                if block is None:
+                    block = parseBlock(parser, text)
+                    parsed += 1
+                blocks[text] = block
+                count += 1
+
+                (py_code, error_tokens) = block
+                if py_code:
+                    py_lines.append(py_code)
+                for token in error_tokens:
+                    errors.append(ps2py_yacc.p_error(moveToken(token, start, offset)))
+            self.__blocks = blocks
+
+        return {'code': "\n".join(py_lines), 'errors': "".join(errors), 'blocks': count, 'parsed': parsed}
+
+    def summarizeLine(self, line):
+        """ Returns a tuple of whether the line starts with a statement, the change of the
+        nesting depth and whether it ends with a token a statement can end with; None if
+        the line has no tokens. Tokens never span several lines, so every line is read alone.
+
+        Keyword arguments:
+        self -- the IncrementalParser instance
+        line -- a line of pseudo code
+        """
+        self.__lexer.input(line)
+        types = [token.type for token in iter(self.__lexer.token, None)]
+        if not types:
+            return None
+
+        # assignments start with a variable: NAME or NAME [ NUMBER|NAME ]
+        starts = types[0] in STARTING or (types[0] == 'NAME' and (types[1:2] == ['ASSIGN']
+            or (types[1:2] == ['LPARENANG'] and types[2:3] in (['NUMBER'], ['NAME']) and types[3:5] == ['RPARENANG', 'ASSIGN'])))
+        depth = sum(1 for token_type in types if token_type in OPENING) - sum(1 for token_type in types if token_type in CLOSING)
+        return (starts, depth, types[-1] in ENDING)
+
+
+def splitBlocks(lines, summaries):
+    """ Yields a tuple of the first line, the line after the last one and the position
+    of the first character per block of the code. A block starts with a line starting a
+    top level statement after a line ending one, so every block is parsed the same way
+    as in the whole code; the blocks of invalid code may contain several statements.
+
+    Keyword arguments:
+    lines -- the lines of the pseudo code
+    summaries -- the summaries of the lines by their text (see IncrementalParser.summarizeLine())
+    """
+    start = 0
+    start_offset = 0
+    offset = 0
+    depth = 0
+    ended = False # whether the last line with tokens ends with a token a statement can end with
+    for (index, line) in enumerate(lines):
+        summary = summaries[line]
+        if summary is not None:
+            (starts, depth_change, ends) = summary
+            if starts and ended and depth == 0:
+                yield (start, index, start_offset)
+                (start, start_offset) = (index, offset)
+            depth += depth_change
+            if depth < 0:
+                depth = 0 # more blocks closed than opened; the code is invalid anyway
+            ended = ends
+        offset += len(line) + 1
+    if lines:
+        yield (start, len(lines), start_offset)
+
+def parseBlock(parser, text):
+    """ Returns a tuple of the Python code of a block (None if it could not be parsed)
+    and the tokens of its syntax errors, with their positions within the block.
+
+    Keyword arguments:
+    parser -- the Ps2PyParser to use
+    text -- the pseudo code of the block
+    """
+    parse_result = parser.parse(text, True)
+    root = parse_result.get('result')
+    py_code = None if root is None else ps2py_ast.toPython(root)
+    return (py_code, list(parser.error_tokens))
+
+def moveToken(token, line, offset):
+    """ Returns a copy of the token of a block with its position in the whole code.
+
+    Keyword arguments:
+    token -- the token, None at the end of the block
+    line -- the index of the first line of the block
+    offset -- the position of the first character of the block
+    """
+    if token is None:
+        return None
+    token = copy.copy(token)
+    token.lineno += line
+    token.lexpos += offset
+    return token
+
+def getParser(session_key):
+    """ Returns the incremental parser of a session and creates it on first use.
+    Only the parsers of the most recently used sessions are kept.
+
+    Keyword arguments:
+    session_key -- the key of the session
+    """
+    global _parsers
+    with _parsers_lock:
+        if _parsers is None:
+            _parsers = OrderedDict()
+        parser = _parsers.get(session_key)
+        if parser is None:
+            parser = IncrementalParser()
+            _parsers[session_key] = parser
+            while len(_parsers) > getattr(settings, 'LIVE_PARSE_SESSIONS', SESSIONS):
+                _parsers.popitem(last=False)
+        _parsers.move_to_end(session_key)
+    return parser
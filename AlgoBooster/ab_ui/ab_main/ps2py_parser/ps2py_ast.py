@@ -0,0 +1,413 @@
+import ast
+from typing import NamedTuple
+
+import ply.yacc as yacc
+
+# Grammar actions building a Python abstract syntax tree (AST) instead of Python code.
+# The grammar rules are the ones of ps2py_yacc; each action has the name of the rule's
+# function there, so both parsers can share the same parsing tables.
+
+# Kinds of lines yielded by iterLines()
+HEADER = "header" # the first line of a statement
+ELSE = "else" # the 'else:' line of an if statement
+END = "end" # no line, the statement and its blocks are complete
+
+# Binary operators of the pseudo code with their precedence in Python
+ARITH_OPS = {'+': ast.Add, '-': ast.Sub}
+TERM_OPS = {'*': ast.Mult, '/': ast.Div, '//': ast.FloorDiv, '%': ast.Mod}
+POWER_OP = '^'
+
+COMP_OPS = {'==': ast.Eq, '!=': ast.NotEq, '>': ast.Gt, '>=': ast.GtE, '<': ast.Lt, '<=': ast.LtE, 'in': ast.In}
+
+class Parenthesized(NamedTuple):
+    """ Operand of a calculation that was put in parentheses, so it is never split up by the operator precedence. """
+    node: ast.expr
+
+# General expressions
+# Statements are lists of ast.stmt nodes, calculations and conditions are lists of
+# operands and operators, which are combined with the precedence of Python
+# (see foldCalc() and foldCond()) as the pseudo code is translated without
+# adding parentheses
+
+def p_code(p):
+    p[0] = p[1]
+    if len(p) == 3:
+        p[0].extend(p[2])
+
+def p_expr(p):
+    p[0] = p[1]
+
+
+# Calculations
+
+def p_calcexpr(p):
+    target = p[1]
+    target.ctx = ast.Store()
+    p[0] = [ast.Assign(targets=[target], value=foldCalc(p[3]), type_comment=None)]
+
+def p_calc(p):
+    if len(p) == 2:
+        p[0] = [p[1]]
+    elif p.slice[1].type == 'LPARENROUND':
+        p[0] = [Parenthesized(foldCalc(p[2]))]
+    else:
+        p[0] = p[1] + [p[2]] + p[3]
+
+def p_op(p):
+    p[0] = p[1]
+
+
+# Data Types
+
+def p_var(p):
+    p[0] = ast.Name(id=p[1], ctx=ast.Load())
+    if len(p) == 5:
+        if p.slice[3].type == 'NUMBER':
+            index = number(p[3])
+        else:
+            index = ast.Name(id=p[3], ctx=ast.Load())
+        p[0] = ast.Subscript(value=p[0], slice=index, ctx=ast.Load())
+
+def p_term(p):
+    p[0] = p[1]
+
+def p_scalar(p):
+    if p.slice[1].type == 'NUMBER':
+        p[0] = number(p[1])
+    else:
+        p[0] = p[1]
+
+def p_funccall(p):
+    p[0] = ast.Call(func=ast.Name(id=p[1], ctx=ast.Load()), args=[foldCalc(calc) for calc in p[3]], keywords=[])
+
+def p_callparams(p):
+    if len(p) == 4:
+        p[0] = p[1]
+        p[0].append(p[3])
+    else:
+        p[0] = [p[1]]
+
+def p_set(p):
+    p[0] = ast.Set(elts=p[2])
+
+def p_seq(p):
+    p[0] = ast.List(elts=p[2], ctx=ast.Load())
+
+def p_value(p):
+    if len(p) == 4:
+        p[0] = p[1]
+        p[0].append(p[3])
+    else:
+        p[0] = [p[1]]
+
+# Conditions
+
+def p_condexpr(p):
+    orelse = p[6] if len(p) == 8 else []
+    p[0] = [ast.If(test=foldCond(p[2]), body=p[4], orelse=orelse)]
+
+def p_cond(p):
+    if len(p) == 2:
+        p[0] = [p[1]]
+    elif p.slice[1].type == 'NOT':
+        p[0] = [ast.UnaryOp(op=ast.Not(), operand=foldCond(p[2]))]
+    elif p.slice[1].type == 'LPARENROUND':
+        p[0] = [foldCond(p[2])]
+    elif p.slice[1].type == 'cond':
+        p[0] = p[1] + [p[2]] + p[3]
+    else:
+        p[0] = [ast.Compare(left=p[1], ops=[p[2]()], comparators=[p[3]])]
+
+def p_log(p):
+    p[0] = p[1].lower()
+
+def p_comp(p):
+    if len(p) == 3:
+        p[0] = ast.NotIn
+    else:
+        p[0] = COMP_OPS[p[1].lower()]
+
+
+# Loops
+
+def p_loopexpr(p):
+    if p.slice[1].type == 'REPEAT': # do-while-loop
+        p[2].append(ast.If(test=foldCond(p[4]), body=[ast.Break()], orelse=[]))
+        p[0] = [ast.While(test=ast.Constant(value=True), body=p[2], orelse=[])]
+    else:
+        p[0] = [ast.For(target=ast.Name(id=p[2][0], ctx=ast.Store()), iter=p[2][1], body=p[4], orelse=[], type_comment=None)]
+
+def p_condfor(p):
+    # tuple of the name of the loop variable and the iterated node
+    if len(p) == 8:
+        p[0] = (p[1], ast.Call(func=ast.Name(id='range', ctx=ast.Load()), args=[p[3], p[5], p[7]], keywords=[]))
+    elif p.slice[3].type == 'NAME':
+        p[0] = (p[1], ast.Name(id=p[3], ctx=ast.Load()))
+    else:
+        p[0] = (p[1], p[3])
+
+# Functions
+
+def p_funcexpr(p):
+    args = ast.arguments(posonlyargs=[], args=[ast.arg(arg=name, annotation=None, type_comment=None) for name in p[4]],
+                         vararg=None, kwonlyargs=[], kw_defaults=[], kwarg=None, defaults=[])
+    p[0] = [ast.FunctionDef(name=p[2], args=args, body=p[6], decorator_list=[], returns=None, type_comment=None)]
+    if 'type_params' in ast.FunctionDef._fields:
+        p[0][0].type_params = [] # Python 3.12 and later
+
+def p_returnexpr(p):
+    if len(p) == 3:
+        p[0] = [ast.Return(value=foldCalc(p[2]))]
+    else:
+        p[0] = [ast.Return(value=None)]
+
+def p_params(p):
+    if len(p) == 4:
+        p[0] = p[1]
+        p[0].append(p[3])
+    else:
+        p[0] = [p[1]]
+
+
+# Helper methods
+
+def number(value):
+    """ Returns the node of a number token. Negative numbers are a minus applied
+    to the number, as in the tree of Python itself.
+
+    Keyword arguments:
+    value -- the value of the NUMBER token
+    """
+    if value.startswith('-'):
+        return ast.UnaryOp(op=ast.USub(), operand=ast.Constant(value=int(value[1:])))
+    return ast.Constant(value=int(value))
+
+def unwrap(operand):
+    """ Returns the node of an operand of a calculation.
+
+    Keyword arguments:
+    operand -- the operand, a node or a Parenthesized node
+    """
+    if isinstance(operand, Parenthesized):
+        return operand.node
+    return operand
+
+def isNegativeNumber(operand):
+    """ Checks if an operand of a calculation is a negative number, whose minus
+    binds less than a following power operator.
+
+    Keyword arguments:
+    operand -- the operand of the calculation
+    """
+    return isinstance(operand, ast.UnaryOp) and isinstance(operand.op, ast.USub) and isinstance(operand.operand, ast.Constant)
+
+def foldCalc(items):
+    """ Combines the operands and operators of a calculation to a single node,
+    using the operator precedence and associativity of Python.
+
+    Keyword arguments:
+    items -- the list of operands and operators in the order of the code
+    """
+
+    # Powers bind strongest and from right to left; the minus of a negative number binds less than a power
+    operand = unwrap(items[-1])
+    factors = []
+    for index in range(len(items) - 3, -1, -2):
+        base = items[index]
+        if items[index + 1] != POWER_OP:
+            factors += [operand, items[index + 1]]
+            operand = unwrap(base)
+        elif isNegativeNumber(base):
+            operand = ast.UnaryOp(op=ast.USub(), operand=ast.BinOp(left=base.operand, op=ast.Pow(), right=operand))
+        else:
+            operand = ast.BinOp(left=unwrap(base), op=ast.Pow(), right=operand)
+    factors.append(operand)
+    factors.reverse()
+
+    # Then multiplications and divisions, then additions and subtractions, both from left to right
+    for operators in (TERM_OPS, ARITH_OPS):
+        folded = [factors[0]]
+        for index in range(1, len(factors), 2):
+            if factors[index] in operators:
+                folded[-1] = ast.BinOp(left=folded[-1], op=operators[factors[index]](), right=factors[index + 1])
+            else:
+                folded += factors[index:index + 2]
+        factors = folded
+    return factors[0]
+
+def foldCond(items):
+    """ Combines the operands and logical operators of a condition to a single node.
+    As in Python, 'and' binds stronger than 'or'.
+
+    Keyword arguments:
+    items -- the list of operands and logical operators in the order of the code
+    """
+    alternatives = [[items[0]]]
+    for index in range(1, len(items), 2):
+        if items[index] == 'or':
+            alternatives.append([items[index + 1]])
+        else:
+            alternatives[-1].append(items[index + 1])
+
+    values = [ast.BoolOp(op=ast.And(), values=values) if len(values) > 1 else values[0] for values in alternatives]
+    if len(values) > 1:
+        return ast.BoolOp(op=ast.Or(), values=values)
+    return values[0]
+
+def bindProductions(productions):
+    """ Returns copies of the productions of the ps2py_yacc tables that call the grammar actions of this module.
+
+    Keyword arguments:
+    productions -- the productions of the parser built by ps2py_yacc
+    """
+    result = []
+    for production in productions:
+        mini = yacc.MiniProduction(str(production), production.name, production.len, production.func, production.file, production.line)
+        mini.bind(globals())
+        result.append(mini)
+    return result
+
+def toModule(statements):
+    """ Returns the module of the parsed statements, with the line numbers
+    of the Python code generated by toPython().
+
+    Keyword arguments:
+    statements -- the list of statements returned by the parser
+    """
+    root = ast.Module(body=statements, type_ignores=[])
+    setLines(root)
+    return root
+
+def iterLines(statements):
+    """ Yields a tuple of the kind (HEADER, ELSE or END), the statement and the
+    indentation depth for every line of the Python code of the statements, in order.
+    After the lines of a statement and its blocks, an END tuple is yielded for it.
+
+    Keyword arguments:
+    statements -- the list of statements
+    """
+    tasks = [(iter(statements), 0)] # blocks whose statements are not completely yielded yet, and pending tuples
+    while tasks:
+        if len(tasks[-1]) == 3:
+            yield tasks.pop()
+            continue
+
+        (block, depth) = tasks[-1]
+        statement = next(block, None)
+        if statement is None:
+            tasks.pop()
+            continue
+
+        yield (HEADER, statement, depth)
+        # pushed in reverse order of their lines
+        tasks.append((END, statement, depth))
+        orelse = getattr(statement, 'orelse', None)
+        if orelse:
+            tasks.append((iter(orelse), depth + 1))
+            tasks.append((ELSE, statement, depth))
+        body = getattr(statement, 'body', None)
+        if isinstance(body, list):
+            tasks.append((iter(body), depth + 1))
+
+def setLines(root):
+    """ Sets the line numbers of all nodes of the tree to the lines of the Python code
+    generated by toPython(). The nodes of the expressions of a statement get the line of
+    the statement. Has to be called again after statements were added or removed.
+
+    Keyword arguments:
+    root -- the root node of the abstract syntax tree
+    """
+    line = 0
+    for (kind, statement, depth) in iterLines(root.body):
+        if kind == END:
+            statement.end_lineno = line
+            continue
+        line += 1
+        if kind == ELSE:
+            continue
+
+        statement.lineno = line
+        statement.col_offset = depth
+        statement.end_col_offset = None
+        for (field, value) in ast.iter_fields(statement):
+            if field in ('body', 'orelse'):
+                continue # statements with own lines
+            for child in (value if isinstance(value, list) else [value]):
+                if not isinstance(child, ast.AST):
+                    continue
+                for node in ast.walk(child):
+                    if 'lineno' in node._attributes:
+                        node.lineno = node.end_lineno = line
+                        node.col_offset = depth
+                        node.end_col_offset = None
+
+def getHeader(statement):
+    """ Returns the Python code of the first line of a statement.
+
+    Keyword arguments:
+    statement -- the statement node
+    """
+    if isinstance(statement, ast.If):
+        return "if " + ast.unparse(statement.test) + ":"
+    if isinstance(statement, ast.While):
+        return "while " + ast.unparse(statement.test) + ":"
+    if isinstance(statement, ast.For):
+        return "for " + ast.unparse(statement.target) + " in " + ast.unparse(statement.iter) + ":"
+    if isinstance(statement, ast.FunctionDef):
+        return "def " + statement.name + "(" + ast.unparse(statement.args) + "):"
+    return ast.unparse(statement)
+
+def toPython(root):
+    """ Generates the Python code of the tree, with one line per statement (and 'else')
+    and a tab per indentation level, so the lines match the line numbers set by setLines().
+
+    Keyword arguments:
+    root -- the root node of the abstract syntax tree
+    """
+    lines = []
+    for (kind, statement, depth) in iterLines(root.body):
+        if kind == HEADER:
+            lines.append("\t" * depth + getHeader(statement))
+        elif kind == ELSE:
+            lines.append("\t" * depth + "else:")
+    return "\n".join(lines)
+
+def getStatementAt(root, line):
+    """ Returns the statement starting in the given line of the Python code generated
+    by toPython(), None if no statement starts there.
+
+    Keyword arguments:
+    root -- the root node of the abstract syntax tree
+    line -- the line number, starting at 1
+    """
+    current = 0
+    for (kind, statement, depth) in iterLines(root.body):
+        if kind == END:
+            continue
+        current += 1
+        if current == line:
+            return statement if kind == HEADER else None
+    return None
+
+def removeStatements(root, condition):
+    """ Removes all statements the condition is true for, together with the statements
+    in their blocks. Returns the number of removed statements, not counting the ones in
+    their blocks. The line numbers are not updated, see setLines().
+
+    Keyword arguments:
+    root -- the root node of the abstract syntax tree
+    condition -- a function getting a statement and returning True if it should be removed
+    """
+    removed = 0
+    blocks = [root.body]
+    while blocks:
+        block = blocks.pop()
+        kept = [statement for statement in block if not condition(statement)]
+        removed += len(block) - len(kept)
+        block[:] = kept # changed in place, the lists can be shared with other trees
+        for statement in kept:
+            for field in ('body', 'orelse'):
+                statements = getattr(statement, field, None)
+                if isinstance(statements, list):
+                    blocks.append(statements)
+    return removed
@@ -1,4 +1,7 @@
+import sys
+
 import ply.lex as lex
+from ab_ui.ab_main.ps2py_parser import ps2py_tables
 
 # List of tokens
 
@@ -81,8 +84,8 @@ def t_error(t):
     print("Illegal character '%s'" % t.value[0])
     t.lexer.skip(1)
 
-# Build the lexer
-lexer = lex.lex()
+# Load the lexer from its precompiled tables (see ps2py_tables)
+lexer = ps2py_tables.loadLexer(sys.modules[__name__])
 
 # Testing
 if __name__ == '__main__':
@@ -0,0 +1,209 @@
+import os
+import pickle
+import sys
+from types import ModuleType
+
+import ply.lex as lex
+import ply.yacc as yacc
+
+# Precompiled lexing and parsing tables of ps2py_lex and ps2py_yacc.
+# The tables are built and checked once by
+#     python manage.py build_parser_tables
+# and importing the parser only reads them: the rules are not validated again,
+# and no tables are generated or written, so every worker process starts the same way.
+# Each file contains the signature of the rules it was built from; tables of other
+# rules or another PLY version are not used (see loadLexer() and loadParser()).
+
+TABLES_DIR = os.path.dirname(os.path.abspath(__file__))
+LEXTAB_FILE = os.path.join(TABLES_DIR, "lextab.obj") # tables of ps2py_lex
+PARSETAB_FILE = os.path.join(TABLES_DIR, "parsetab.obj") # tables of ps2py_yacc
+DEBUG_FILE = os.path.join(TABLES_DIR, "parser.out") # description of the grammar and its states, written with the tables
+
+TABLES_FORMAT = 1 # increase if the content of the table files changes
+PICKLE_PROTOCOL = 4 # fixed, so the files do not depend on the Python version building them
+
+def getLexerSignature(lex_module):
+    """ Returns the signature of the tokens and rules of a lexer module. It changes
+    whenever they change, so outdated tables can be recognized without validating the rules.
+
+    Keyword arguments:
+    lex_module -- the module with the lexer rules
+    """
+    info = lex.LexerReflect(vars(lex_module))
+    info.get_all()
+    rules = []
+    for state in sorted(info.stateinfo):
+        rules.append((state,
+            [(name, func.__doc__) for (name, func) in info.funcsym[state]],
+            info.strsym[state],
+            info.ignore.get(state),
+            getattr(info.errorf.get(state), '__name__', None),
+            getattr(info.eoff.get(state), '__name__', None)))
+    content = (TABLES_FORMAT, lex.__tabversion__, sorted(info.tokens), info.literals, info.stateinfo, rules)
+    return repr(content)
+
+def getParserSignature(yacc_module):
+    """ Returns the signature of the tokens, precedence and grammar rules of a parser module.
+
+    Keyword arguments:
+    yacc_module -- the module with the grammar rules
+    """
+    info = yacc.ParserReflect(vars(yacc_module))
+    info.get_all()
+    content = (TABLES_FORMAT, yacc.__tabversion__, info.signature())
+    return repr(content)
+
+def buildLexerTables(lex_module):
+    """ Validates the rules of a lexer module and returns its tables, in the form
+    of the lextab module PLY writes.
+
+    Keyword arguments:
+    lex_module -- the module with the lexer rules
+    """
+    lexer = lex.lex(module=lex_module) # raises a SyntaxError if the rules are invalid
+
+    # the master regular expressions with the names of their rules instead of the functions
+    statere = {}
+    for state, regexes in lexer.lexstatere.items():
+        statere[state] = []
+        for ((pattern, funcs), text, names) in zip(regexes, lexer.lexstateretext[state], lexer.lexstaterenames[state]):
+            rules = [(name, func[1]) if func and func[0] else func for (func, name) in zip(funcs, names)]
+            statere[state].append((text, rules))
+
+    return {
+        'signature': getLexerSignature(lex_module),
+        '_tabversion': lex.__tabversion__,
+        '_lextokens': set(lexer.lextokens),
+        '_lexreflags': int(lexer.lexreflags),
+        '_lexliterals': lexer.lexliterals,
+        '_lexstateinfo': lexer.lexstateinfo,
+        '_lexstatere': statere,
+        '_lexstateignore': lexer.lexstateignore,
+        '_lexstateerrorf': {state: func.__name__ if func else None for (state, func) in lexer.lexstateerrorf.items()},
+        '_lexstateeoff': {state: func.__name__ if func else None for (state, func) in lexer.lexstateeoff.items()},
+    }
+
+def buildParserTables(yacc_module, debuglog=None):
+    """ Validates the grammar of a parser module and returns its LALR tables, in the
+    form of the parsetab module PLY writes.
+
+    Keyword arguments:
+    yacc_module -- the module with the grammar rules
+    debuglog -- if set, the ply.yacc.PlyLogger the grammar and its states are described to (default None)
+    """
+    # yacc() only generates the tables if it cannot import a table module, so the import is blocked
+    tabmodule = yacc_module.__name__ + "_parsetab"
+    blocked = sys.modules.get(tabmodule)
+    sys.modules[tabmodule] = None
+    try:
+        parser = yacc.yacc(module=yacc_module, tabmodule=tabmodule, write_tables=False,
+            debug=debuglog is not None, debuglog=debuglog, outputdir=TABLES_DIR) # raises a YaccError if the grammar is invalid
+    finally:
+        if blocked is None:
+            del sys.modules[tabmodule]
+        else:
+            sys.modules[tabmodule] = blocked
+
+    productions = []
+    for production in parser.productions:
+        if production.func:
+            productions.append((str(production), production.name, production.len, production.func, os.path.basename(production.file), production.line))
+        else:
+            productions.append((str(production), production.name, production.len, None, None, None))
+
+    signature = getParserSignature(yacc_module)
+    return {
+        'signature': signature,
+        '_tabversion': yacc.__tabversion__,
+        '_lr_method': 'LALR',
+        '_lr_signature': signature,
+        '_lr_action': parser.action,
+        '_lr_goto': parser.goto,
+        '_lr_productions': productions,
+    }
+
+def readTables(path):
+    """ Returns the tables of a table file, or None if it is missing or cannot be read.
+
+    Keyword arguments:
+    path -- the path of the table file
+    """
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, "rb") as tables_file:
+            return pickle.load(tables_file)
+    except (IOError, pickle.UnpicklingError, EOFError) as err:
+        print("Could not read the parser tables " + path + ": " + str(err))
+        return None
+
+def writeTables(path, tables):
+    """ Writes tables to a table file. The file is replaced at once, so processes
+    starting at the same time read either the old or the new tables.
+
+    Keyword arguments:
+    path -- the path of the table file
+    tables -- the tables returned by buildLexerTables() or buildParserTables()
+    """
+    temp_path = path + ".tmp"
+    with open(temp_path, "wb") as tables_file:
+        pickle.dump(tables, tables_file, PICKLE_PROTOCOL)
+    os.replace(temp_path, path)
+
+def loadTables(path, signature, build):
+    """ Returns the tables of a table file as a module to be read by PLY. Tables of
+    other rules are rebuilt in memory only, as the file is never written while loading.
+
+    Keyword arguments:
+    path -- the path of the table file
+    signature -- the signature of the current rules
+    build -- function returning the tables of the current rules
+    """
+    tables = readTables(path)
+    if tables is None or tables.get('signature') != signature:
+        print("The parser tables " + path + " are missing or do not match the grammar and are built in memory. "
+            + "Run python manage.py build_parser_tables to update them.")
+        tables = build()
+    module = ModuleType(os.path.splitext(os.path.basename(path))[0])
+    module.__dict__.update(tables)
+    return module
+
+def loadLexer(lex_module, path=LEXTAB_FILE):
+    """ Returns a lexer of a lexer module, read from the tables built for its rules.
+
+    Keyword arguments:
+    lex_module -- the module with the lexer rules
+    path -- the path of the table file (default LEXTAB_FILE)
+    """
+    tables = loadTables(path, getLexerSignature(lex_module), lambda: buildLexerTables(lex_module))
+    lexer = lex.Lexer()
+    lexer.lexoptimize = True
+    lexer.readtab(tables, vars(lex_module))
+    return lexer
+
+def loadParser(yacc_module, path=PARSETAB_FILE):
+    """ Returns the LR tables (ply.yacc.LRTable) of a parser module, read from the tables
+    built for its grammar, with the productions bound to the grammar actions of the module.
+
+    Keyword arguments:
+    yacc_module -- the module with the grammar rules
+    path -- the path of the table file (default PARSETAB_FILE)
+    """
+    tables = loadTables(path, getParserSignature(yacc_module), lambda: buildParserTables(yacc_module))
+    lr_tables = yacc.LRTable()
+    lr_tables.read_table(tables)
+    lr_tables.bind_callables(vars(yacc_module))
+    return lr_tables
+
+def buildAll(lex_module, yacc_module):
+    """ Builds the tables of the lexer and parser modules and writes them to their table
+    files, together with the description of the grammar (DEBUG_FILE).
+
+    Keyword arguments:
+    lex_module -- the module with the lexer rules
+    yacc_module -- the module with the grammar rules
+    """
+    writeTables(LEXTAB_FILE, buildLexerTables(lex_module))
+    with open(DEBUG_FILE, "w") as debug_file:
+        parser_tables = buildParserTables(yacc_module, yacc.PlyLogger(debug_file))
+    writeTables(PARSETAB_FILE, parser_tables)
@@ -1,5 +1,12 @@
+import sys
+from threading import local
+from types import SimpleNamespace
+
 import ply.yacc as yacc
 from ab_ui.ab_main.ps2py_parser.ps2py_lex import tokens
+from ab_ui.ab_main.ps2py_parser import ps2py_lex
+from ab_ui.ab_main.ps2py_parser import ps2py_ast
+from ab_ui.ab_main.ps2py_parser import ps2py_tables
 
 # precedence of mathematical operations
 precedence = (
@@ -8,19 +15,18 @@ precedence = (
     ('left', 'LPARENROUND', 'RPARENROUND')
 )
 
-errors = ""
-
 start = 'code'
 
 # General expressions
+# Statements are tuples of a Python line and the list of statements
+# in its indented block, or None if the line has no block
 
 def p_code(p):
-    '''code : expr 
-            | expr code'''
-    try:
-        p[0] = p[1] + p[2]
-    except IndexError:
-        p[0] = p[1]
+    '''code : code expr
+            | expr'''
+    p[0] = p[1]
+    if len(p) == 3:
+        p[0].extend(p[2]) # left recursion: the list grows without copying
 
 def p_expr(p):
     ''' expr : calcexpr
@@ -35,7 +41,7 @@ def p_expr(p):
 
 def p_calcexpr(p):
     ' calcexpr : var ASSIGN calc'
-    p[0] =  p[1] + " = " + p[3] + "\n"
+    p[0] = [(p[1] + " = " + p[3], None)]
 
 def p_calc(p):
     ''' calc : LPARENROUND calc RPARENROUND
@@ -93,7 +99,7 @@ def p_funccall(p):
 
 def p_callparams(p):
     ''' callparams : calc
-                    | calc COMMA callparams'''
+                    | callparams COMMA calc'''
     p[0] = p[1]
     try:
         p[0] += ", " + p[3]
@@ -102,19 +108,20 @@ def p_callparams(p):
 
 def p_set(p):
     ''' set : LBRACE value RBRACE'''
-    p[0] = '{' + p[2] + '}'
+    p[0] = '{' + ','.join(p[2]) + '}'
 
 def p_seq(p):
     ' seq : LPARENANG value RPARENANG'
-    p[0] = '[' + p[2] + ']'
+    p[0] = '[' + ','.join(p[2]) + ']'
 
 def p_value(p):
-    ''' value : scalar COMMA value
+    ''' value : value COMMA scalar
                 | scalar'''
-    try:
-        p[0] = p[1] + ',' + p[3]
-    except IndexError:
+    if len(p) == 4:
         p[0] = p[1]
+        p[0].append(p[3])
+    else:
+        p[0] = [p[1]]
 
 # Conditions
 
@@ -122,9 +129,9 @@ def p_condexpr(p):
     '''condexpr : IF cond THEN code ENDIF
                 | IF cond THEN code ELSE code ENDIF'''
     
-    p[0] = 'if ' +  p[2] + ":" + "\nINDENT\n" + p[4] + "UNINDENT\n"
+    p[0] = [('if ' +  p[2] + ":", p[4])]
     try:
-        p[0] += 'else:\nINDENT\n' + p[6] + "UNINDENT\n"
+        p[0].append(('else:', p[6]))
     except IndexError:
         pass # no extended rule needed
 
@@ -167,9 +174,10 @@ def p_loopexpr(p):
     ''' loopexpr : REPEAT code UNTIL cond
                 | FOR condfor DO code ENDFOR'''
     if p[1] == 'repeat': # do-while-loop
-        p[0] = 'while True:\nINDENT\n' + p[2] + 'if ' + p[4] + ":\n\tbreak\nUNINDENT\n"
+        p[2].append(('if ' + p[4] + ":", [('break', None)]))
+        p[0] = [('while True:', p[2])]
     else:
-        p[0] = 'for ' + p[2] + ":" + "\nINDENT\n" + p[4] + "UNINDENT\n"
+        p[0] = [('for ' + p[2] + ":", p[4])]
     
 def p_condfor(p):
     ''' condfor : NAME IN set
@@ -185,18 +193,18 @@ def p_condfor(p):
 
 def p_funcexpr(p):
     ' funcexpr : PROCEDURE NAME LPARENROUND params RPARENROUND code ENDPROC'
-    p[0] = 'def ' + p[2] + " (" + p[4] + "):\nINDENT\n" + p[6] + "UNINDENT\n"
+    p[0] = [('def ' + p[2] + " (" + p[4] + "):", p[6])]
     
 def p_returnexpr(p):
     ''' returnexpr : RETURN
                     | RETURN calc '''
     try:
-        p[0] = "return " + p[2] + "\n"
+        p[0] = [("return " + p[2], None)]
     except IndexError:
-        p[0] = "return\n"
+        p[0] = [("return", None)]
 
 def p_params(p):
-    ''' params : NAME COMMA params
+    ''' params : params COMMA NAME
                 | NAME '''
     p[0] = p[1]
     try:
@@ -205,34 +213,168 @@ def p_params(p):
         pass # no more arguments to handle
 
 
-# Error rule for syntax errors
+# Error rule for syntax errors; returns the message, which the Ps2PyParser
+# the error occurred in adds to its errors
 def p_error(p):
-    global errors
-    errors += "Syntax error in input at: " + str(p) + "\n"
-
-# Build the parser
-parser = yacc.yacc()
+    return "Syntax error in input at: " + str(p) + "\n"
+
+# Load the precompiled parsing tables once (see ps2py_tables); they are only read while parsing
+_tables = ps2py_tables.loadParser(sys.modules[__name__])
+_ast_productions = ps2py_ast.bindProductions(_tables.lr_productions)
+
+# Parsers of the threads
+_local = local()
+
+class Ps2PyParser():
+    """ Class for a parser with its own lexer, parsing state and errors. An instance
+    parses one pseudo code at a time, so threads parsing at the same time use
+    their own instances (see getParser()). """
+
+    def __init__(self):
+        """ Initializes the Ps2PyParser instance. The parsing tables are shared with all other instances.
+
+        Keyword arguments:
+        self -- the Ps2PyParser instance
+        """
+        self.__lexer = ps2py_lex.lexer.clone()
+        self.__errors = []
+        self.__error_tokens = []
+        self.__parse_string = ""
+        self.__text_parser = makeParser(_tables.lr_productions, self.addError)
+        self.__ast_parser = makeParser(_ast_productions, self.addError) # same tables, building a Python abstract syntax tree
+
+    def parse(self, parse_string, as_ast=False):
+        """ Parses pseudo code to Python. Returns a dictionary containing the result
+        ('result', None if the code could not be parsed) and the syntax errors ('errors').
+
+        Keyword arguments:
+        self -- the Ps2PyParser instance
+        parse_string -- the pseudo code to parse
+        as_ast -- if set to True, the result is the ast.Module of the code; else, the Python code as string (default False)
+        """
+        self.__errors = []
+        self.__error_tokens = []
+        self.__parse_string = parse_string
+
+        # Start parsing process
+        if as_ast:
+            statements = self.ast_parser.parse(parse_string, lexer=self.lexer)
+            if statements is None:
+                return {'result': statements, 'errors': "".join(self.errors)}
+            return {'result': ps2py_ast.toModule(statements), 'errors': "".join(self.errors)}
+
+        statements = self.text_parser.parse(parse_string, lexer=self.lexer)
+        if statements is None:
+            return {'result': statements, 'errors': "".join(self.errors)}
+
+        result = toPython(statements).replace("  ", " ")
+        return {'result': result.strip(), 'errors': "".join(self.errors)}
+
+    def addError(self, token):
+        """ Adds the message of a syntax error. Called by the parser on every syntax error.
+
+        Keyword arguments:
+        self -- the Ps2PyParser instance
+        token -- the token the error occurred at, None at the end of the input
+        """
+        if token is not None:
+            # the lexer does not count the lines, so they are only counted for errors
+            token.lineno = self.parse_string.count("\n", 0, token.lexpos) + 1
+        self.errors.append(p_error(token))
+        self.error_tokens.append(token)
+
+    # Class helper methods
+
+    def getLexer(self):
+        """ Gets the lexer.
+
+        Keyword arguments:
+        self -- the Ps2PyParser instance
+        """
+        return self.__lexer
+
+    def getErrors(self):
+        """ Gets the messages of the syntax errors of the last parsed code.
+
+        Keyword arguments:
+        self -- the Ps2PyParser instance
+        """
+        return self.__errors
+
+    def getErrorTokens(self):
+        """ Gets the tokens the syntax errors of the last parsed code occurred at (None at the end of the input).
+
+        Keyword arguments:
+        self -- the Ps2PyParser instance
+        """
+        return self.__error_tokens
+
+    def getParseString(self):
+        """ Gets the pseudo code that is parsed.
+
+        Keyword arguments:
+        self -- the Ps2PyParser instance
+        """
+        return self.__parse_string
+
+    def getTextParser(self):
+        """ Gets the parser building Python code.
+
+        Keyword arguments:
+        self -- the Ps2PyParser instance
+        """
+        return self.__text_parser
+
+    def getAstParser(self):
+        """ Gets the parser building an abstract syntax tree.
+
+        Keyword arguments:
+        self -- the Ps2PyParser instance
+        """
+        return self.__ast_parser
+
+    lexer = property(getLexer)
+    errors = property(getErrors)
+    error_tokens = property(getErrorTokens)
+    parse_string = property(getParseString)
+    text_parser = property(getTextParser)
+    ast_parser = property(getAstParser)
+
+
+def makeParser(productions, error_func):
+    """ Returns a new parser with its own parsing state, using the shared tables.
+
+    Keyword arguments:
+    productions -- the productions of the tables, bound to the grammar actions to use
+    error_func -- the function called on syntax errors
+    """
+    return yacc.LRParser(SimpleNamespace(lr_productions=productions, lr_action=_tables.lr_action, lr_goto=_tables.lr_goto), error_func)
+
+def getParser():
+    """ Returns the parser of the current thread and creates it on first use. """
+
+    parser = getattr(_local, 'parser', None)
+    if parser is None:
+        parser = Ps2PyParser()
+        _local.parser = parser
+    return parser
 
 # Parse method
-def parse_ps2py(parse_string): 
-    global errors
-    errors = ""
-    
-    # Start parsing process
-    result_pre = parser.parse(parse_string)
-    if result_pre is None:
-        return {'result': result_pre, 'errors': errors}
-
-    # Add tabs for valid Python code
-    result_after = ""
-    tab = 0
-    for line in result_pre.splitlines():
-        if line == "INDENT":
-            tab = tab+1
-        elif line == "UNINDENT":
-            tab = tab-1
-        else:
-            result_after += "\t" * tab + line + "\n"
-    result_after = result_after.replace("  ", " ")
-    return {'result': result_after.strip(), 'errors': errors}
-
+def parse_ps2py(parse_string, as_ast=False):
+    return getParser().parse(parse_string, as_ast)
+
+# Joins the statements to Python code in one go, adding tabs for the blocks
+def toPython(statements):
+    lines = []
+    blocks = [(iter(statements), 0)] # blocks with their number of tabs, whose statements are not completely added yet
+    while blocks:
+        (block, tab) = blocks[-1]
+        statement = next(block, None)
+        if statement is None:
+            blocks.pop()
+            continue
+        (line, body) = statement
+        lines.append("\t" * tab + line)
+        if body is not None:
+            blocks.append((iter(body), tab + 1))
+    return "\n".join(lines)
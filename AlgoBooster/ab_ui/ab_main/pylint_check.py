@@ -1,22 +1,25 @@
+import ast
+import io
+import logging
+import tokenize
 
-from pylint import epylint as lint
+from ab_ui.ab_main import static_check
+from ab_ui.ab_main.ps2py_parser import ps2py_ast
+
+
+CODE_FILE = "output_codebefore.py" # name the code is reported as in the messages
+
+logger = logging.getLogger(__name__)
 
 class CodeChecker():
     """ Class for the static code analysis. """
 
-    def __init__(self, base_dir):
+    def __init__(self):
         """ Initializes the code checker.
 
         Keyword arguments:
         self -- the CodeChecker instance
-        base_dir -- the basic temporary directory to work on
         """
-        self.__base_dir = base_dir
-
-        self.__pylint_options = ' -s n' # show no score
-        self.__pylint_options += ' -f text' # set output format to text
-        self.__pylint_options += ' -r n' # no full report, only messages
-        self.__pylint_options += " --msg-template='[{msg_id}]{line:3d}: {msg}'" # set message template
         self.__relevant_msgs = {
             'error_msgs': [
                 'E0001', # syntax error
@@ -50,153 +53,175 @@ class CodeChecker():
                 'W0122', # use of exec
             ]
         }
-        self.__keywords = ["import", "eval", "compile", "input", "open", "close"]
+        self.__forbidden_names = {"__import__", "eval", "compile", "input", "open", "close"}
+        all_msgs = []
+        for msgs in self.relevant_msgs.values():
+            all_msgs += msgs
+        self.__engine = static_check.StaticChecker(all_msgs)
 
-    def executeCheck(self, py_code, code_file, error_file):
-        """ Executes the static code analysis. Returns a result containing
-        the corrected code, possible errors and tips from the analysis.
+    def executeCheck(self, root):
+        """ Executes the static code analysis on the abstract syntax tree of the parsed code.
+        Statements that have to be corrected are removed from the tree. Returns a result
+        containing the number of removed statements, possible errors and tips from the analysis.
 
         Keyword arguments:
         self -- the CodeChecker instance
-        py_code -- the submitted and parsed Python code to check
-        code_file -- name of the file where the code should be written to
-        error-file -- name of the file where the errors should be written to
+        root -- the root node of the abstract syntax tree of the submitted and parsed code
         """
 
-        # Initialize response and file paths
-        result = {'corrected_code': py_code, 'errors': "", 'tips' : ""}
-        filename = self.base_dir + code_file
-        errorfile =  self.base_dir + error_file
+        # Initialize response
+        result = {'removed': 0, 'errors': "", 'tips' : ""}
 
-        # Delete lines with certain keywords
-        for kw in self.keywords:
-            kw_res = self.checkAndFixKeyword(result.get('corrected_code'), kw)
-            if kw_res[1]:   # line with keyword was found
-                result['tips'] += "Use of '" + kw + "' forbidden. Line was removed.\n"
-                result['corrected_code'] = kw_res[0]
+        # Delete statements with imports or uses of forbidden names
+        (removed, tips) = self.checkAndFixForbidden(root)
+        result['removed'] += removed
+        result['tips'] += tips
 
-        # Try writing code to file
-        if self.writeToFile(result['corrected_code'], filename) != 0:
-            return result
-
-        # Get result of the pylint analysis
-        (pylint_stdout, pylint_stderr) = lint.py_run(filename + self.pylint_options, return_std=True)
-        output = pylint_stdout.read()
-
-        # Try writing errors to file
-        if self.writeToFile(pylint_stderr.read(), errorfile) != 0:
-            print("Error log could not be written!")
+        # Get result of the static analysis; the code is generated from the tree and checked in memory with the same messages as pylint
+        try:
+            messages = self.engine.check(ps2py_ast.toPython(root) + "\n", CODE_FILE)
+        except Exception:
+            logger.exception("Static code analysis failed")
+            messages = []
+        index = self.indexMessages(messages)
 
         # Get error messages: code won't be checked further if at least one of them appears
         for msg in self.relevant_msgs.get('error_msgs'):
-            result['errors'] += self.checkAndReportMsg(msg, self.getFittingLine(msg,output))
+            result['errors'] += self.checkAndReportMsg(msg, index.get(msg, []))
 
         # Get tip messages: these will be returned for further human optimization
         for msg in self.relevant_msgs.get('tip_msgs'):
-            result['tips'] += self.checkAndReportMsg(msg, self.getFittingLine(msg, output))
+            result['tips'] += self.checkAndReportMsg(msg, index.get(msg, []))
 
         # Get change messages: these will be changed immediately by program
         for msg in self.relevant_msgs.get('change_msgs'):
-            result['corrected_code'] = self.checkAndFixMsg(result.get('corrected_code'), msg, self.getFittingLine(msg,output))
+            result['removed'] += self.checkAndFixMsg(root, msg, index.get(msg, []))
 
         return result
 
-    def getFittingLine(self, msg, stdout):
-        """ Gets the line of the pylint result containing the searched message.
+    def indexMessages(self, messages):
+        """ Returns the messages of the static analysis by their message code, each
+        list ordered by line and column.
 
         Keyword arguments:
         self -- the CodeChecker instance
-        msg -- the message to search the output for
-        stdout -- the pylint output to search in
+        messages -- the messages returned by the static checker
         """
-        for line in stdout.splitlines():
-            if msg in line:
-                return line
-        return None
+        index = {}
+        for msg in sorted(messages, key=lambda msg: (msg.get('line'), msg.get('column'))):
+            index.setdefault(msg.get('msg_id'), []).append(msg)
+        return index
 
-    def writeToFile(self, content, filename):
-        """ Writes a given content to the given file.
+    def checkAndReportMsg(self, msg_code, occurrences):
+        """ Returns the report of all occurrences of a message used for optimization hints, one line each.
 
         Keyword arguments:
         self -- the CodeChecker instance
-        content -- the content to write to the file
-        filename -- the name and path of the file to write the content to
+        msg_code -- the code of the searched message
+        occurrences -- the messages with this code found by the static checker
         """
-        try:
-            code_file = open(filename, "w")
-            code_file.write(content)
-            code_file.close()
-        except IOError as ioe:
-            print("Error while writing to file:", ioe)
-            return -1
-        return 0
 
-    def checkAndReportMsg(self, msg_code, line):
-        """ Checks for and extracts messages used for optimization hints.
+        report = ""
+        for msg in occurrences:
+            lineno = msg.get('line') - 1 # substracts 1 because of the added main function which does not belong to the initial program
+            report += "line " + str(lineno) + ": " + msg.get('msg') + "\n"
+        return report
 
-        Keyword arguments:
+    def checkAndFixMsg(self, root, msg_code, occurrences):
+        """ Checks for and corrects messages that can be changed immediately, by removing
+        the statements of all their occurrences from the tree. Returns the number of removed statements.
+
+        Keyword aruments:
         self -- the CodeChecker instance
+        root -- the root node of the abstract syntax tree to correct
         msg_code -- the code of the searched message
-        line -- the complete line which contains the message
+        occurrences -- the messages with this code found by the static checker
         """
 
-        if line is None:
-            return ""
-        
-        lineno = int(line[(len(msg_code) + 3):line.index(':')]) # start: after message code and two brackets, starting at 0
-        lineno = lineno-1 # substracts 1 because of the added main function which does not belong to the initial program
-        line = line.replace("[" + msg_code + "]", "line ") + "\n"
-        line = "line " + str(lineno) + line[line.index(':'):]
-        return line
-
-    def checkAndFixMsg(self, py_code, msg_code, line):
-        """ Checks for and corrects messages that can be changed immediately.
+        # the statements starting in the lines of the checked code; all are looked up before the tree changes
+        statements = set()
+        for msg in occurrences:
+            statement = ps2py_ast.getStatementAt(root, msg.get('line'))
+            if statement is not None:
+                statements.add(id(statement))
+        if not statements:
+            return 0
+        return ps2py_ast.removeStatements(root, lambda node: id(node) in statements)
+
+    def checkAndFixForbidden(self, root):
+        """ Checks for and removes the statements importing a module or using a forbidden name, in
+        one pass over the tree. Only whole names are matched, so e.g. a variable 'opened' is kept.
+        Returns a tuple of the number of removed statements and the report of every use, one line each.
 
-        Keyword aruments:
+        Keyword arguments:
         self -- the CodeChecker instance
-        py_code -- the code to correct
-        msg_code -- the code of the searched message
-        line -- the complete line which contains the message
+        root -- the root node of the abstract syntax tree to correct
         """
 
-        if line is None:
-            return py_code
+        statements = set()
+        report = ""
+        for (kind, statement, depth) in ps2py_ast.iterLines(root.body):
+            if kind != ps2py_ast.HEADER or not self.isForbidden(statement):
+                continue
+            statements.add(id(statement))
+            # the column in the code without the added main function, like the line
+            for (name, column) in self.findForbiddenNames(ps2py_ast.getHeader(statement)):
+                report += "line " + str(statement.lineno) + ", column " + str(column + max(depth - 1, 0)) + ": Use of '" + name + "' forbidden. Line was removed.\n"
+        if not statements:
+            return (0, "")
+        return (ps2py_ast.removeStatements(root, lambda node: id(node) in statements), report)
+
+    def isForbidden(self, statement):
+        """ Returns whether a statement is an import or its first line uses a forbidden name,
+        as a variable, function or attribute. The blocks of the statement are not searched.
 
-        lineno = int(line[(len(msg_code) + 3):line.index(':')]) # start: after message code and two brackets, starting at 0
-        
-        # remove line (either with or without newline)
-        linecontent = py_code.splitlines()[lineno-1] # substracts 1 because of the added main function which does not belong to the initial program
-        py_code = py_code.replace(linecontent + "\n", "")
-        py_code = py_code.replace(linecontent, "")
-        return py_code            
+        Keyword arguments:
+        self -- the CodeChecker instance
+        statement -- the statement node
+        """
 
-    def checkAndFixKeyword(self, py_code, keyword):
-        """ Checks for and removes line containing the given keyword.
+        if isinstance(statement, (ast.Import, ast.ImportFrom)):
+            return True
+        for (field, value) in ast.iter_fields(statement):
+            if field in ('body', 'orelse'):
+                continue
+            for child in (value if isinstance(value, list) else [value]):
+                if not isinstance(child, ast.AST):
+                    continue
+                for node in ast.walk(child):
+                    if isinstance(node, ast.Name) and node.id in self.forbidden_names:
+                        return True
+                    if isinstance(node, ast.Attribute) and node.attr in self.forbidden_names:
+                        return True
+        return False
+
+    def findForbiddenNames(self, header):
+        """ Returns a list of tuples of the forbidden name (or 'import') and its column
+        for every use in the first line of a statement.
 
         Keyword arguments:
         self -- the CodeChecker instance
-        py_code -- the code to correct
-        keyword -- the Python keyword to search for
+        header -- the Python code of the first line of the statement
         """
-        
-        result = ""
-        found = False
-        for line in py_code.splitlines():
-            if keyword not in line:
-                result += line + "\n"
-            else:
-                found = True
-        return (result, found)
+
+        found = []
+        try:
+            for token in tokenize.generate_tokens(io.StringIO(header).readline):
+                if token.type == tokenize.NAME and (token.string == "import" or token.string in self.forbidden_names):
+                    found.append((token.string, token.start[1]))
+        except tokenize.TokenError:
+            pass # headers are generated from the tree and always complete
+        return found
 
     # Class helper methods
 
-    def getPylintOptions(self):
-        """ Returns the Pylint options.
+    def getEngine(self):
+        """ Returns the static checker.
 
         Keyword arguments:
         self -- the CodeChecker instance
         """
-        return self.__pylint_options
+        return self.__engine
 
     def getRelevantMsgs(self):
         """ Returns the relevant messages.
@@ -206,28 +231,20 @@ class CodeChecker():
         """
         return self.__relevant_msgs
 
-    def getKeywords(self):
-        """ Returns the keywords
-
-        Keyword arguments:
-        self -- the CodeChecker instance
-        """
-        return self.__keywords
-
-    def getBaseDir(self):
-        """ Returns the base directory.
+    def getForbiddenNames(self):
+        """ Returns the forbidden names.
 
         Keyword arguments:
         self -- the CodeChecker instance
         """
-        return self.__base_dir
+        return self.__forbidden_names
 
-    pylint_options = property(getPylintOptions)
+    engine = property(getEngine)
     relevant_msgs = property(getRelevantMsgs)
-    keywords = property(getKeywords)
-    base_dir = property(getBaseDir)
+    forbidden_names = property(getForbiddenNames)
 
 # Testing
 if __name__ == '__main__':
-    checker = CodeChecker("temp/")
-    checker.executeCheck("a = 3\n", "output.py", "error.py")
\ No newline at end of file
+    import ast
+    checker = CodeChecker()
+    checker.executeCheck(ast.parse("a = 3\n"))
\ No newline at end of file
@@ -0,0 +1,99 @@
+from threading import Lock
+
+from pylint.lint import PyLinter
+from pylint.reporters import CollectingReporter
+from pylint.typing import FileItem
+
+
+# Linters of the process, one per set of enabled messages
+_engines = {}
+_engines_lock = Lock()
+
+class StringLinter(PyLinter):
+    """ Linter checking the source code given as string instead of reading a file. """
+
+    def __init__(self, *args, **kwargs):
+        """ Initializes the StringLinter instance.
+
+        Keyword arguments:
+        self -- the StringLinter instance
+        """
+        super().__init__(*args, **kwargs)
+        self.source = ""
+
+    def get_ast(self, filepath, modname, data=None):
+        """ Inherited from 'PyLinter'. Builds the AST from the source string.
+
+        Keyword arguments:
+        self -- the StringLinter instance
+        filepath -- the file name shown in the messages
+        modname -- the module name of the code
+        data -- ignored, the source string is used
+        """
+        return super().get_ast(filepath, modname, self.source)
+
+
+class PylintEngine():
+    """ Class for a long-lived, in-process pylint instance which only checks the given messages.
+    The code checker uses the native checks of 'static_check', pylint is the reference they are
+    compared to in the tests and the benchmark. """
+
+    def __init__(self, msg_ids):
+        """ Initializes the PylintEngine instance and loads the checkers once.
+
+        Keyword arguments:
+        self -- the PylintEngine instance
+        msg_ids -- the ids of the messages to enable, all others are disabled
+        """
+        self.__linter = StringLinter(reporter=CollectingReporter())
+        self.linter.load_default_plugins()
+        self.linter.disable("all")
+        for msg_id in msg_ids:
+            self.linter.enable(msg_id)
+        self.__lock = Lock() # the linter keeps the state of the current check
+
+    def check(self, py_code, filename):
+        """ Checks the code and returns the found messages as list of dictionaries
+        containing 'msg_id', 'line', 'column' and 'msg'.
+
+        Keyword arguments:
+        self -- the PylintEngine instance
+        py_code -- the Python code to check
+        filename -- the file name to use for the code in the messages
+        """
+        modname = filename.rsplit("/", 1)[-1].replace(".py", "")
+        with self.__lock:
+            self.linter.source = py_code
+            self.linter.reporter.messages = []
+            self.linter.open() # resets the statistics of the last check
+            self.linter.initialize()
+            self.linter.check_single_file_item(FileItem(modname, filename, modname))
+            messages = self.linter.reporter.messages
+            self.linter.reporter.messages = []
+
+        return [{'msg_id': msg.msg_id, 'line': msg.line or 0, 'column': msg.column, 'msg': msg.msg} for msg in messages]
+
+    # Class helper methods
+
+    def getLinter(self):
+        """ Returns the linter.
+
+        Keyword arguments:
+        self -- the PylintEngine instance
+        """
+        return self.__linter
+
+    linter = property(getLinter)
+
+
+def getEngine(msg_ids):
+    """ Returns the pylint engine of the process for the given messages and creates it on first use.
+
+    Keyword arguments:
+    msg_ids -- the ids of the messages to enable
+    """
+    key = tuple(sorted(msg_ids))
+    with _engines_lock:
+        if key not in _engines:
+            _engines[key] = PylintEngine(key)
+        return _engines[key]
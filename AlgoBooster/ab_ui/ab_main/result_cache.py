@@ -0,0 +1,122 @@
+import copy
+import hashlib
+from collections import OrderedDict
+from threading import Lock
+
+from django.conf import settings
+
+
+CACHE_SIZE = 1024 # default number of results, overridden by settings.RESULT_CACHE_SIZE
+
+_cache = None
+_cache_lock = Lock()
+
+class ResultCache():
+    """ Class for a size-bounded cache of analysis results, keyed by the parsed code and
+    the model version. The least recently used result is evicted first. """
+
+    def __init__(self, max_size):
+        """ Initializes the ResultCache instance.
+
+        Keyword arguments:
+        self -- the ResultCache instance
+        max_size -- the maximum number of cached results
+        """
+        self.__max_size = max_size
+        self.__results = OrderedDict()
+        self.__model_version = None
+        self.__lock = Lock()
+
+    def makeKey(self, py_code, model_version):
+        """ Returns the key for a parsed code and model version. Codes that only differ
+        in surrounding or trailing whitespace get the same key.
+
+        Keyword arguments:
+        self -- the ResultCache instance
+        py_code -- the Python code returned by the parser
+        model_version -- the version of the model used for the prediction
+        """
+        normalized = "\n".join(line.rstrip() for line in py_code.strip().splitlines())
+        content = str(model_version) + "\n" + normalized
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+    def get(self, key):
+        """ Returns a copy of the cached result for the key, None if there is none.
+
+        Keyword arguments:
+        self -- the ResultCache instance
+        key -- the key created by makeKey()
+        """
+        with self.__lock:
+            result = self.__results.get(key)
+            if result is None:
+                return None
+            self.__results.move_to_end(key)
+        return copy.deepcopy(result)
+
+    def put(self, key, result):
+        """ Saves a copy of the result and evicts the least recently used results if the cache is full.
+
+        Keyword arguments:
+        self -- the ResultCache instance
+        key -- the key created by makeKey()
+        result -- the result to save
+        """
+        result = copy.deepcopy(result)
+        with self.__lock:
+            self.__results[key] = result
+            self.__results.move_to_end(key)
+            while len(self.__results) > self.max_size:
+                self.__results.popitem(last=False)
+
+    def checkModelVersion(self, model_version):
+        """ Empties the cache if the model changed since the last call, as the
+        results of the old model can not be requested anymore.
+
+        Keyword arguments:
+        self -- the ResultCache instance
+        model_version -- the current version of the model
+        """
+        with self.__lock:
+            if model_version != self.__model_version:
+                self.__results.clear()
+                self.__model_version = model_version
+
+    def clear(self):
+        """ Removes all cached results.
+
+        Keyword arguments:
+        self -- the ResultCache instance
+        """
+        with self.__lock:
+            self.__results.clear()
+
+    def __len__(self):
+        """ Returns the number of cached results.
+
+        Keyword arguments:
+        self -- the ResultCache instance
+        """
+        return len(self.__results)
+
+    # Class helper methods
+
+    def getMaxSize(self):
+        """ Returns the maximum number of cached results.
+
+        Keyword arguments:
+        self -- the ResultCache instance
+        """
+        return self.__max_size
+
+    max_size = property(getMaxSize)
+
+
+def getCache():
+    """ Returns the result cache of the current process and creates it on first use. """
+
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = ResultCache(getattr(settings, 'RESULT_CACHE_SIZE', CACHE_SIZE))
+    return _cache
@@ -0,0 +1,342 @@
+import atexit
+import logging
+import os
+import pwd
+import shutil
+import signal
+import socket
+import subprocess
+from queue import Queue
+from threading import Lock
+import virtualenv
+
+from django.conf import settings
+
+from ab_ui.ab_main import sandbox_runner
+
+
+POOL_DIR = "ab_ui/ab_main/sandboxes/" # directory containing the pools of all processes
+POOL_SIZE = 2 # default number of environments, overridden by settings.SANDBOX_POOL_SIZE
+HEALTH_TIMEOUT = 10 # seconds for the interpreter smoke test
+
+logger = logging.getLogger(__name__)
+
+_pool = None
+_pool_pid = None
+_pool_lock = Lock()
+
+class Zygote():
+    """ Class for the zygote process of an environment. It is started once with the interpreter
+    of the environment and forks a child for every run, see 'sandbox_runner'. Only one run
+    at a time is possible, as the environment is reserved by the run. The answers of the
+    zygote are read from the control socket by the sandbox supervisor. """
+
+    def __init__(self, python_path):
+        """ Initializes the Zygote instance and starts the process.
+
+        Keyword arguments:
+        self -- the Zygote instance
+        python_path -- the interpreter of the environment
+        """
+        (self.__control, zygote_control) = socket.socketpair()
+        try:
+            self.__process = subprocess.Popen([python_path, os.path.abspath(sandbox_runner.__file__), str(zygote_control.fileno())],
+                                              stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                                              pass_fds=(zygote_control.fileno(),))
+        finally:
+            zygote_control.close()
+
+    def submit(self, code, filename, limits, result_fd):
+        """ Lets the zygote fork a child running the code. Returns False if the zygote is
+        not working. The zygote answers with the frames {'pid': ...} and {'returncode': ...}.
+
+        Keyword arguments:
+        self -- the Zygote instance
+        code -- the Python code to run
+        filename -- the file name of the code, e.g. in tracebacks
+        limits -- the dictionary with the limits 'steps', 'cpu_time', 'memory', 'uid' and 'gid'
+        result_fd -- the writing end of the pipe the child sends its results to
+        """
+        job = dict(limits, code=code, filename=filename)
+        try:
+            socket.send_fds(self.__control, [sandbox_runner.JOB_MARKER], [result_fd])
+            sandbox_runner.writeFrame(self.__control.fileno(), job)
+        except OSError as ose:
+            print("Job could not be sent to the sandbox:", ose)
+            return False
+        return True
+
+    def kill(self, pid):
+        """ Kills the child of a job and all processes of its process group.
+
+        Keyword arguments:
+        self -- the Zygote instance
+        pid -- the process id of the child, which is also the id of its process group
+        """
+        try:
+            os.killpg(pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass # all of them exited in the meantime
+
+    def fileno(self):
+        """ Returns the file descriptor of the control socket, to wait for answers.
+
+        Keyword arguments:
+        self -- the Zygote instance
+        """
+        return self.__control.fileno()
+
+    def isAlive(self):
+        """ Returns True if the zygote process is running.
+
+        Keyword arguments:
+        self -- the Zygote instance
+        """
+        return self.__process.poll() is None
+
+    def stop(self):
+        """ Stops the zygote process. A running child is not affected.
+
+        Keyword arguments:
+        self -- the Zygote instance
+        """
+        self.__control.close() # the zygote exits once the socket is closed
+        self.__process.kill()
+        self.__process.wait()
+
+
+class SandboxPool():
+    """ Class for a pool of pre-built virtual environments the submitted algorithms are run in.
+    The environments are created once and recycled between runs. """
+
+    def __init__(self, pool_dir, size):
+        """ Initializes the SandboxPool instance. No environment is created yet.
+
+        Keyword arguments:
+        self -- the SandboxPool instance
+        pool_dir -- the directory to create the environments in
+        size -- the number of environments in the pool
+        """
+        self.__pool_dir = pool_dir
+        self.__size = size
+        self.__free = Queue()
+        self.__base_entries = {} # files and directories of a freshly created environment
+        self.__zygotes = {} # zygote process by environment
+        self.__warm = False
+        self.__lock = Lock()
+        self.__owner_pid = os.getpid() # forked children inherit the pool, but must not shut it down
+
+    def warmUp(self):
+        """ Creates all environments of the pool if this was not done before.
+
+        Keyword arguments:
+        self -- the SandboxPool instance
+        """
+        with self.lock:
+            if self.__warm:
+                return
+            venv_paths = [self.pool_dir + "env_" + str(i) + "/" for i in range(self.size)]
+            for venv_path in venv_paths:
+                self.createEnv(venv_path)
+            # only hand out environments once all of them were created
+            for venv_path in venv_paths:
+                self.__free.put(venv_path)
+            self.__warm = True
+
+    def acquire(self):
+        """ Takes a free environment from the pool and returns its path. Blocks until
+        an environment is free. Unhealthy environments are rebuilt before they are handed out.
+
+        Keyword arguments:
+        self -- the SandboxPool instance
+        """
+        self.warmUp()
+        venv_path = self.__free.get()
+        try:
+            if not self.checkHealth(venv_path):
+                self.createEnv(venv_path)
+            elif not self.__zygotes[venv_path].isAlive():
+                self.startZygote(venv_path)
+        except Exception:
+            self.__free.put(venv_path) # keep the pool size, the next acquire tries again
+            raise
+        return venv_path
+
+    def getZygote(self, venv_path):
+        """ Returns the zygote process of an acquired environment.
+
+        Keyword arguments:
+        self -- the SandboxPool instance
+        venv_path -- the path of the environment
+        """
+        return self.__zygotes[venv_path]
+
+    def getUserIds(self):
+        """ Returns the user and group the runs are started as, set by settings.SANDBOX_USER,
+        as dictionary with 'uid' and 'gid'. Both are None if the user is not changed.
+
+        Keyword arguments:
+        self -- the SandboxPool instance
+        """
+        user = getattr(settings, 'SANDBOX_USER', None)
+        if user is None:
+            return {'uid': None, 'gid': None}
+        entry = pwd.getpwnam(user)
+        return {'uid': entry.pw_uid, 'gid': entry.pw_gid}
+
+    def release(self, venv_path):
+        """ Removes everything a run left in the environment and puts it back into the pool.
+
+        Keyword arguments:
+        self -- the SandboxPool instance
+        venv_path -- the path of the environment to give back
+        """
+        base_entries = self.__base_entries.get(venv_path, set())
+        try:
+            for entry in os.listdir(venv_path):
+                if entry not in base_entries:
+                    path = os.path.join(venv_path, entry)
+                    if os.path.isdir(path):
+                        shutil.rmtree(path, ignore_errors=True)
+                    else:
+                        os.remove(path)
+        except OSError as ose:
+            print("Sandbox could not be reset:", ose)
+        self.__free.put(venv_path)
+
+    def createEnv(self, venv_path):
+        """ Creates a 'safe' environment without wheel, pip, setuptools or site packages,
+        checks that its interpreter works and starts its zygote.
+
+        Keyword arguments:
+        self -- the SandboxPool instance
+        venv_path -- the path of the environment to create
+        """
+        virtualenv.create_environment(venv_path, site_packages=False, no_wheel=True, no_pip=True, no_setuptools=True, clear=True)
+        if not self.checkHealth(venv_path, True):
+            raise RuntimeError("Sandbox interpreter in " + venv_path + " is not working.")
+        self.__base_entries[venv_path] = set(os.listdir(venv_path))
+        self.startZygote(venv_path)
+
+    def startZygote(self, venv_path):
+        """ Starts the zygote process of an environment, a running one is stopped before.
+
+        Keyword arguments:
+        self -- the SandboxPool instance
+        venv_path -- the path of the environment
+        """
+        if venv_path in self.__zygotes:
+            self.__zygotes.pop(venv_path).stop()
+        self.__zygotes[venv_path] = Zygote(venv_path + "bin/python")
+
+    def checkHealth(self, venv_path, run_interpreter=False):
+        """ Checks whether the environment can be used. Returns True if the interpreter
+        is present and executable, False otherwise.
+
+        Keyword arguments:
+        self -- the SandboxPool instance
+        venv_path -- the path of the environment to check
+        run_interpreter -- if set to True, additionally starts the interpreter once (default False)
+        """
+        python_path = venv_path + "bin/python"
+        if not os.access(python_path, os.X_OK):
+            return False
+        if run_interpreter:
+            try:
+                subprocess.run([python_path, "-c", "pass"], timeout=HEALTH_TIMEOUT, check=True,
+                                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            except (OSError, subprocess.SubprocessError) as err:
+                print("Sandbox health check failed:", err)
+                return False
+        return True
+
+    def shutdown(self):
+        """ Stops all zygotes and deletes all environments of the pool. Does nothing in
+        processes forked from the one that created the pool, e.g. when their inherited
+        exit handlers run.
+
+        Keyword arguments:
+        self -- the SandboxPool instance
+        """
+        if os.getpid() != self.__owner_pid:
+            return
+        for zygote in self.__zygotes.values():
+            zygote.stop()
+        self.__zygotes = {}
+        shutil.rmtree(self.pool_dir, ignore_errors=True)
+
+    # Class helper methods
+
+    def getPoolDir(self):
+        """ Gets the directory of the pool.
+
+        Keyword arguments:
+        self -- the SandboxPool instance
+        """
+        return self.__pool_dir
+
+    def getSize(self):
+        """ Gets the number of environments in the pool.
+
+        Keyword arguments:
+        self -- the SandboxPool instance
+        """
+        return self.__size
+
+    def getLock(self):
+        """ Gets the lock used while creating the pool.
+
+        Keyword arguments:
+        self -- the SandboxPool instance
+        """
+        return self.__lock
+
+    pool_dir = property(getPoolDir)
+    size = property(getSize)
+    lock = property(getLock)
+
+
+def removeStalePools(pool_dir):
+    """ Deletes the directories of the pools of processes that no longer run, e.g. of
+    processes that were killed before they could delete their own directory.
+
+    Keyword arguments:
+    pool_dir -- the directory containing one directory per process id
+    """
+
+    if not os.path.isdir(pool_dir):
+        return
+    for name in os.listdir(pool_dir):
+        if not name.isdigit() or int(name) == os.getpid():
+            continue
+        try:
+            os.kill(int(name), 0)
+        except ProcessLookupError:
+            shutil.rmtree(pool_dir + name, ignore_errors=True)
+        except OSError:
+            pass # the process runs as another user
+
+def warmUpPool():
+    """ Builds the environments of the pool of the current process ahead of the first run.
+    If this fails, the error is logged and the environments are built by the first acquire(). """
+
+    try:
+        getPool().warmUp()
+    except (Exception, SystemExit): # virtualenv exits the process on errors
+        logger.exception("Sandbox environments could not be built")
+
+def getPool():
+    """ Returns the sandbox pool of the current process and creates it on first use.
+    Each process gets its own directory, which is deleted when the process exits.
+    The directories left behind by processes that stopped are deleted beforehand. """
+
+    global _pool, _pool_pid
+    with _pool_lock:
+        # a forked child must not share the environments of its parent
+        if _pool is None or _pool_pid != os.getpid():
+            size = getattr(settings, 'SANDBOX_POOL_SIZE', POOL_SIZE)
+            _pool_pid = os.getpid()
+            removeStalePools(POOL_DIR)
+            _pool = SandboxPool(POOL_DIR + str(_pool_pid) + "/", size)
+            atexit.register(_pool.shutdown)
+    return _pool
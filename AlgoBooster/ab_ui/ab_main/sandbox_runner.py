@@ -0,0 +1,214 @@
+""" Zygote process of a sandbox environment. It is started once by the interpreter of the
+virtual environment, so it only uses the standard library, and forks a child for every run.
+The child limits its CPU time and memory, drops its privileges and runs the code with a budget
+of executed lines.
+
+The jobs are received as frames over a socket together with the writing end of a pipe, the
+child sends its results as frames to that pipe, see writeFrame(). For every job, the zygote
+answers with the process id of the child and, once it exited, with its exit code. The child
+leads its own process group, so it can be killed together with the processes it started.
+
+Usage: python sandbox_runner.py <socket fd>
+"""
+
+import json
+import os
+import resource
+import socket
+import struct
+import sys
+
+
+HEADER = struct.Struct(">I") # length of the frame in bytes, followed by the frame as JSON
+JOB_MARKER = b"J" # byte the pipe of a job is sent with
+
+# Status of the last frame sent before the child exits
+STATUS_NORMAL = "normal"
+STATUS_RAISED = "raised"
+STATUS_STEPS = "steps"
+STATUS_MEMORY = "memory"
+
+def writeFrame(fd, message):
+    """ Sends a dictionary as one frame to a pipe or socket.
+
+    Keyword arguments:
+    fd -- the file descriptor to write to
+    message -- the dictionary to send, it has to be serializable as JSON
+    """
+    data = json.dumps(message).encode("utf-8")
+    data = HEADER.pack(len(data)) + data
+    while data:
+        data = data[os.write(fd, data):]
+
+def readExactly(fd, size):
+    """ Returns the given number of bytes read from a pipe or socket, or less if it was closed before.
+
+    Keyword arguments:
+    fd -- the file descriptor to read from
+    size -- the number of bytes to read
+    """
+    data = b""
+    while len(data) < size:
+        chunk = os.read(fd, size - len(data))
+        if not chunk:
+            break
+        data += chunk
+    return data
+
+def readFrame(fd):
+    """ Returns the next dictionary sent to a pipe or socket, or None if it was closed before
+    a complete frame was sent.
+
+    Keyword arguments:
+    fd -- the file descriptor to read from
+    """
+    header = readExactly(fd, HEADER.size)
+    if len(header) < HEADER.size:
+        return None
+    (length,) = HEADER.unpack(header)
+    data = readExactly(fd, length)
+    if len(data) < length:
+        return None
+    return json.loads(data.decode("utf-8"))
+
+def splitFrames(buffer):
+    """ Returns the dictionaries of the complete frames at the start of the buffer and the
+    bytes of the incomplete frame following them, for reading without blocking.
+
+    Keyword arguments:
+    buffer -- the bytes read so far
+    """
+    frames = []
+    offset = 0
+    while offset + HEADER.size <= len(buffer):
+        (length,) = HEADER.unpack_from(buffer, offset)
+        if offset + HEADER.size + length > len(buffer):
+            break
+        frames.append(json.loads(buffer[offset + HEADER.size:offset + HEADER.size + length].decode("utf-8")))
+        offset += HEADER.size + length
+    return (frames, buffer[offset:])
+
+def limitResources(cpu_time, memory):
+    """ Limits the CPU time and the address space of the process. The process gets SIGXCPU
+    once the CPU time is used up and SIGKILL one second later.
+
+    Keyword arguments:
+    cpu_time -- the CPU time in seconds
+    memory -- the size of the address space in bytes
+    """
+    resource.setrlimit(resource.RLIMIT_CPU, (cpu_time, cpu_time + 1))
+    resource.setrlimit(resource.RLIMIT_AS, (memory, memory))
+
+def dropPrivileges(uid, gid):
+    """ Changes the user and group of the process, if given.
+
+    Keyword arguments:
+    uid -- the id of the user to run as, None to keep the current one
+    gid -- the id of the group to run as, None to keep the current one
+    """
+    if gid is not None:
+        os.setgroups([])
+        os.setgid(gid)
+    if uid is not None:
+        os.setuid(uid)
+
+def countSteps(script_file, steps, result_fd):
+    """ Installs a trace function that counts the executed lines of the script and exits
+    once more than the given number of lines were executed. Lines of other files, e.g. of
+    the standard library, are not counted. Returns a function giving the executed lines.
+
+    Keyword arguments:
+    script_file -- the script whose lines are counted
+    steps -- the number of lines the script may execute
+    result_fd -- the file descriptor to send the last frame to
+    """
+    remaining = [steps]
+
+    def traceLine(frame, event, arg):
+        if event == 'line':
+            remaining[0] -= 1
+            if remaining[0] < 0:
+                sys.settrace(None)
+                writeFrame(result_fd, {'status': STATUS_STEPS, 'exception': None, 'steps': steps})
+                os._exit(1) # the program can not catch it, and there is nothing to clean up
+        return traceLine
+
+    def traceCall(frame, event, arg):
+        if frame.f_code.co_filename == script_file:
+            return traceLine
+        return None
+
+    sys.settrace(traceCall)
+    return lambda: steps - remaining[0]
+
+def runJob(job, result_fd):
+    """ Runs the code of a job within its limits and sends the results. Called in the forked
+    child, which exits afterwards. The code can send its own results with the function
+    'sendResult(name, value)'.
+
+    Keyword arguments:
+    job -- the dictionary with the 'code', its 'filename' and the limits 'steps', 'cpu_time',
+           'memory', 'uid' and 'gid'
+    result_fd -- the file descriptor of the pipe to send the results to
+    """
+    script_file = job.get('filename')
+    sys.argv = [script_file]
+    sys.path[0] = os.path.dirname(script_file) # as if the script was started directly
+    limitResources(job.get('cpu_time'), job.get('memory'))
+    dropPrivileges(job.get('uid'), job.get('gid'))
+
+    def sendResult(name, value):
+        writeFrame(result_fd, {'name': name, 'value': value})
+
+    executed_steps = countSteps(script_file, job.get('steps'), result_fd)
+    result = {'status': STATUS_NORMAL, 'exception': None}
+    try:
+        code = compile(job.get('code'), script_file, "exec")
+        exec(code, {'__name__': "__main__", '__file__': script_file, '__builtins__': __builtins__,
+                    'sendResult': sendResult})
+    except SystemExit as stop:
+        if stop.code not in (None, 0):
+            result = {'status': STATUS_RAISED, 'exception': "SystemExit"}
+    except MemoryError:
+        result = {'status': STATUS_MEMORY, 'exception': "MemoryError"}
+    except BaseException as exception:
+        result = {'status': STATUS_RAISED, 'exception': type(exception).__name__}
+    sys.settrace(None)
+    result['steps'] = executed_steps()
+    writeFrame(result_fd, result)
+
+def serve(control):
+    """ Forks a child for every job received over the socket, until it is closed.
+
+    Keyword arguments:
+    control -- the socket to the parent process
+    """
+    while True:
+        (marker, fds, _, _) = socket.recv_fds(control, len(JOB_MARKER), 1)
+        job = readFrame(control.fileno()) if marker == JOB_MARKER and fds else None
+        if job is None:
+            return # the parent closed the socket
+
+        pid = os.fork()
+        if pid == 0:
+            try:
+                os.setpgid(0, 0)
+                control.close()
+                runJob(job, fds[0])
+            finally:
+                os._exit(0)
+        os.setpgid(pid, 0) # also here, so the group exists once the process id is sent
+        os.close(fds[0]) # the pipe is closed once the child exits
+        writeFrame(control.fileno(), {'pid': pid})
+        (_, status) = os.waitpid(pid, 0)
+        writeFrame(control.fileno(), {'returncode': os.waitstatus_to_exitcode(status)})
+
+def main():
+    """ Runs the zygote on the socket given on the command line. """
+
+    control = socket.socket(fileno=int(sys.argv[1]))
+    serve(control)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,380 @@
+import heapq
+import itertools
+import os
+import selectors
+import time
+import traceback
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from threading import Lock, Thread
+
+from ab_ui.ab_main import sandbox_pool
+from ab_ui.ab_main import sandbox_runner
+
+
+SCRIPT_NAME = "sandbox_code.py" # file name of the code in the environment, e.g. in tracebacks
+READ_SIZE = 65536 # bytes read at once from a pipe or socket
+
+_supervisor = None
+_supervisor_pid = None
+_supervisor_lock = Lock()
+
+class SandboxJob():
+    """ Class for a run of code in the sandbox, from its submission until the child exited. """
+
+    def __init__(self, py_code, limits, timeout):
+        """ Initializes the SandboxJob instance.
+
+        Keyword arguments:
+        self -- the SandboxJob instance
+        py_code -- the Python code to run
+        limits -- the dictionary with the limits 'steps', 'cpu_time', 'memory', 'uid' and 'gid'
+        timeout -- the seconds after which the child is killed
+        """
+        self.py_code = py_code
+        self.limits = limits
+        self.timeout = timeout
+        self.future = Future()
+        self.venv_path = None
+        self.zygote = None
+        self.result_fd = None # reading end of the pipe the child sends its results to
+        self.result_buffer = b""
+        self.control_buffer = b""
+        self.report = {} # status, exception and steps of the run and the results sent by the program
+        self.pid = None
+        self.returncode = None
+        self.exited = False # the zygote sent the exit code or stopped working
+        self.timed_out = False
+
+
+class Supervisor(Thread):
+    """ Class for the background thread owning all running sandbox jobs of the process. It waits
+    for the answers of all zygotes and the results of all children with a single selector,
+    starts the queued jobs whenever an environment of the pool is free and kills the children
+    at their deadlines, which are kept in a heap. The environments are taken from the pool by
+    helper threads, as building one takes seconds, and handed over through the wake-up pipe. """
+
+    def __init__(self, pool):
+        """ Initializes the Supervisor instance.
+
+        Keyword arguments:
+        self -- the Supervisor instance
+        pool -- the sandbox pool to take the environments from
+        """
+        Thread.__init__(self, daemon=True)
+        self.__pool = pool
+        self.__selector = selectors.DefaultSelector()
+        self.__queued = deque() # jobs waiting for an environment
+        self.__preparing = set() # jobs whose environment is taken from the pool by a helper thread
+        self.__prepared = deque() # (job, environment, exception) of the jobs whose environment was taken
+        self.__helpers = ThreadPoolExecutor(max_workers=pool.size)
+        self.__running = 0 # jobs holding or taking an environment
+        self.__deadlines = [] # (time, counter, job) of the running jobs, the earliest first
+        self.__counter = itertools.count() # orders jobs with the same deadline
+        self.__lock = Lock()
+        (self.__wake_up_read, self.__wake_up_write) = os.pipe()
+        os.set_blocking(self.__wake_up_read, False)
+        os.set_blocking(self.__wake_up_write, False)
+        self.__selector.register(self.__wake_up_read, selectors.EVENT_READ, None)
+
+    def submit(self, py_code, limits, timeout):
+        """ Queues the code to run in the sandbox and returns a 'concurrent.futures.Future'
+        of it, which can be awaited with 'asyncio.wrap_future'. Its result is a dictionary
+        containing the 'report' sent by the child, its 'returncode', negative if it was killed
+        by a signal or None if it is unknown, and whether it was killed at the deadline ('timeout').
+
+        Keyword arguments:
+        self -- the Supervisor instance
+        py_code -- the Python code to run
+        limits -- the dictionary with the limits 'steps', 'cpu_time', 'memory', 'uid' and 'gid'
+        timeout -- the seconds after which the child is killed
+        """
+        job = SandboxJob(py_code, limits, timeout)
+        with self.lock:
+            self.__queued.append(job)
+        self.notify()
+        return job.future
+
+    def notify(self):
+        """ Wakes the supervisor up to start queued jobs.
+
+        Keyword arguments:
+        self -- the Supervisor instance
+        """
+        try:
+            os.write(self.__wake_up_write, b"x")
+        except BlockingIOError:
+            pass # the supervisor is woken up anyway
+
+    def run(self):
+        """ Inherited from 'Thread'. Handles the events of the running jobs until the process exits.
+        Errors of single jobs, also a 'SystemExit' e.g. of creating an environment, do not stop
+        the supervisor. If it stops anyway, the futures of all jobs left are failed.
+
+        Keyword arguments:
+        self -- the Supervisor instance
+        """
+        try:
+            while True:
+                try:
+                    for (key, _) in self.__selector.select(self.nextTimeout()):
+                        if key.data is None:
+                            self.readWakeUp()
+                        else:
+                            (handler, job) = key.data
+                            handler(job)
+                    self.checkDeadlines()
+                    self.startPrepared()
+                    self.startQueued()
+                except BaseException:
+                    traceback.print_exc()
+        finally:
+            self.failJobs(RuntimeError("The sandbox supervisor stopped."))
+
+    def nextTimeout(self):
+        """ Returns the seconds until the earliest deadline, or None if there is none.
+
+        Keyword arguments:
+        self -- the Supervisor instance
+        """
+        if not self.__deadlines:
+            return None
+        return max(0, self.__deadlines[0][0] - time.monotonic())
+
+    def readWakeUp(self):
+        """ Empties the pipe other threads wake the supervisor up with.
+
+        Keyword arguments:
+        self -- the Supervisor instance
+        """
+        try:
+            while os.read(self.__wake_up_read, READ_SIZE):
+                pass
+        except BlockingIOError:
+            pass
+
+    def startQueued(self):
+        """ Lets a helper thread take an environment for queued jobs as long as one of the pool is free.
+
+        Keyword arguments:
+        self -- the Supervisor instance
+        """
+        while self.__running < self.pool.size:
+            with self.lock:
+                if not self.__queued:
+                    return
+                job = self.__queued.popleft()
+                if not job.future.set_running_or_notify_cancel():
+                    continue
+                self.__preparing.add(job)
+            self.__running += 1
+            self.__helpers.submit(self.prepare, job)
+
+    def prepare(self, job):
+        """ Takes an environment for the job from the pool, which may rebuild it, and hands it
+        over to the supervisor. Called in a helper thread.
+
+        Keyword arguments:
+        self -- the Supervisor instance
+        job -- the SandboxJob to take the environment for
+        """
+        (venv_path, exception) = (None, None)
+        try:
+            venv_path = self.pool.acquire()
+        except BaseException as exc: # e.g. the SystemExit of a failed virtualenv creation
+            exception = exc
+        with self.lock:
+            self.__preparing.discard(job)
+            self.__prepared.append((job, venv_path, exception))
+        self.notify()
+
+    def startPrepared(self):
+        """ Starts the jobs whose environment was taken, or fails them if that was not possible.
+
+        Keyword arguments:
+        self -- the Supervisor instance
+        """
+        while True:
+            with self.lock:
+                if not self.__prepared:
+                    return
+                (job, venv_path, exception) = self.__prepared.popleft()
+            if exception is not None:
+                self.__running -= 1
+                job.future.set_exception(exception)
+                continue
+            job.venv_path = venv_path
+            self.startJob(job)
+
+    def startJob(self, job):
+        """ Lets the zygote of the environment of the job fork the child.
+
+        Keyword arguments:
+        self -- the Supervisor instance
+        job -- the SandboxJob to start, its environment is taken already
+        """
+        job.zygote = self.pool.getZygote(job.venv_path)
+        (job.result_fd, write_fd) = os.pipe()
+        try:
+            started = job.zygote.submit(job.py_code, job.venv_path + SCRIPT_NAME, job.limits, write_fd)
+        finally:
+            os.close(write_fd) # the pipe is closed once the child exits
+        if not started:
+            job.exited = True
+            self.closeResults(job)
+            self.finish(job) # the zygote is restarted by the next acquire
+            return
+        os.set_blocking(job.result_fd, False)
+        self.__selector.register(job.result_fd, selectors.EVENT_READ, (self.readResults, job))
+        self.__selector.register(job.zygote.fileno(), selectors.EVENT_READ, (self.readControl, job))
+        heapq.heappush(self.__deadlines, (time.monotonic() + job.timeout, next(self.__counter), job))
+
+    def readResults(self, job):
+        """ Reads the frames the child sent to the pipe into the report of the job.
+
+        Keyword arguments:
+        self -- the Supervisor instance
+        job -- the SandboxJob the pipe belongs to
+        """
+        try:
+            data = os.read(job.result_fd, READ_SIZE)
+        except BlockingIOError:
+            return
+        if not data:
+            self.closeResults(job) # an incomplete last frame, e.g. of a killed child, is ignored
+            self.finish(job)
+            return
+        (frames, job.result_buffer) = sandbox_runner.splitFrames(job.result_buffer + data)
+        for frame in frames:
+            if 'name' in frame:
+                job.report[frame.get('name')] = frame.get('value')
+            else:
+                job.report.update(frame)
+
+    def readControl(self, job):
+        """ Reads the answers of the zygote of the job, the process id and exit code of the child.
+
+        Keyword arguments:
+        self -- the Supervisor instance
+        job -- the SandboxJob the zygote runs
+        """
+        data = os.read(job.zygote.fileno(), READ_SIZE) # the selector reported it readable
+        (frames, job.control_buffer) = sandbox_runner.splitFrames(job.control_buffer + data)
+        for frame in frames:
+            if 'pid' in frame:
+                job.pid = frame.get('pid')
+                if job.timed_out:
+                    job.zygote.kill(job.pid)
+            if 'returncode' in frame:
+                job.returncode = frame.get('returncode')
+                job.exited = True
+        if not data:
+            job.exited = True # the zygote stopped working, it is restarted by the next acquire
+        if job.exited:
+            self.__selector.unregister(job.zygote.fileno())
+            if job.pid is not None:
+                job.zygote.kill(job.pid) # processes the child started and left behind
+            self.finish(job)
+
+    def checkDeadlines(self):
+        """ Kills the children of the jobs whose deadline passed. If the job is not finished
+        within another timeout, its zygote is stopped and its pipe is closed.
+
+        Keyword arguments:
+        self -- the Supervisor instance
+        """
+        now = time.monotonic()
+        while self.__deadlines and self.__deadlines[0][0] <= now:
+            (_, _, job) = heapq.heappop(self.__deadlines)
+            if job.future.done():
+                continue
+            if not job.timed_out:
+                job.timed_out = True
+                if job.pid is not None:
+                    job.zygote.kill(job.pid)
+                heapq.heappush(self.__deadlines, (now + job.timeout, next(self.__counter), job))
+            else:
+                if not job.exited:
+                    self.__selector.unregister(job.zygote.fileno())
+                    job.zygote.stop()
+                    job.exited = True
+                self.closeResults(job)
+                self.finish(job)
+
+    def closeResults(self, job):
+        """ Stops reading the results of a job and closes its pipe.
+
+        Keyword arguments:
+        self -- the Supervisor instance
+        job -- the SandboxJob the pipe belongs to
+        """
+        if job.result_fd is None:
+            return
+        if job.result_fd in self.__selector.get_map():
+            self.__selector.unregister(job.result_fd)
+        os.close(job.result_fd)
+        job.result_fd = None
+
+    def finish(self, job):
+        """ Completes the job once the pipe is closed and the zygote answered: gives the
+        environment back to the pool and sets the result of the future.
+
+        Keyword arguments:
+        self -- the Supervisor instance
+        job -- the SandboxJob
+        """
+        if not job.exited or job.result_fd is not None or job.future.done():
+            return # the child or the zygote is still running
+        self.pool.release(job.venv_path)
+        self.__running -= 1
+        job.future.set_result({'report': job.report, 'returncode': job.returncode, 'timeout': job.timed_out})
+
+    def failJobs(self, exc):
+        """ Sets the exception on the futures of all queued and running jobs, so nobody waits
+        for them forever.
+
+        Keyword arguments:
+        self -- the Supervisor instance
+        exc -- the exception to set
+        """
+        with self.lock:
+            jobs = list(self.__queued) + list(self.__preparing) + [job for (job, _, _) in self.__prepared]
+            jobs += [job for (_, _, job) in self.__deadlines]
+            self.__queued.clear()
+        for job in jobs:
+            if not job.future.done():
+                job.future.set_exception(exc)
+
+    # Class helper methods
+
+    def getPool(self):
+        """ Gets the sandbox pool.
+
+        Keyword arguments:
+        self -- the Supervisor instance
+        """
+        return self.__pool
+
+    def getLock(self):
+        """ Gets the lock of the queued jobs.
+
+        Keyword arguments:
+        self -- the Supervisor instance
+        """
+        return self.__lock
+
+    pool = property(getPool)
+    lock = property(getLock)
+
+
+def getSupervisor():
+    """ Returns the sandbox supervisor of the current process and starts it on first use. """
+
+    global _supervisor, _supervisor_pid
+    with _supervisor_lock:
+        # threads are not inherited by a forked child
+        if _supervisor is None or _supervisor_pid != os.getpid():
+            _supervisor_pid = os.getpid()
+            _supervisor = Supervisor(sandbox_pool.getPool())
+            _supervisor.start()
+    return _supervisor
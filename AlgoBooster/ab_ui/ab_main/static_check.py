@@ -0,0 +1,1539 @@
+import ast
+import builtins
+import itertools
+import operator
+import re
+
+
+# Texts of the messages, the same as the ones of pylint
+MESSAGES = {
+    'E0001': "Parsing failed: '%s'",
+    'E0102': "function already defined line %s",
+    'E0108': "Duplicate argument name %s in function definition",
+    'E0601': "Using variable %r before assignment",
+    'E0602': "Undefined variable %r",
+    'E1111': "Assigning result of a function call, where the function has no return",
+    'E1120': "No value for argument %r in function call",
+    'E1121': "Too many positional arguments for function call",
+    'E1126': "Sequence index is not an int, slice, or instance with __index__",
+    'E1128': "Assigning result of a function call, where the function returns None",
+    'E1133': "Non-iterable value %s is used in an iterating context",
+    'R1705': 'Unnecessary "else" after "return", remove the "else" and de-indent the code inside it',
+    'W0101': "Unreachable code",
+    'W0122': "Use of exec",
+    'W0125': "Using a conditional statement with a constant value",
+    'W0612': "Unused variable %r",
+    'W0631': "Using possibly undefined loop variable %r",
+}
+
+MAX_VALUES = 100 # values inferred per expression, further ones are unknown
+MAX_ITEMS = 10000 # items of an inferred list, longer lists are unknown
+MAX_CALLS = 8 # nested calls of functions followed to infer a value
+MAX_DEPTH = 100 # nested expressions and names followed to infer a value
+MAX_BITS = 1e5 # bits of an integer result above it, calculations are not done
+MAX_LENGTH = 1e6 # characters of a string result above it, calculations are not done
+MAX_REPEAT = 1e8 # lists repeated more often have unknown items
+
+DUMMY_NAMES = re.compile(r"_+$|(_[a-zA-Z0-9_]*[a-zA-Z0-9]+?$)|dummy|^ignored_|^unused_") # names never reported as unused or redefined
+BUILTIN_NAMES = set(dir(builtins)) | {'__builtins__'}
+MODULE_NAMES = {'__name__', '__doc__', '__file__', '__path__', '__package__'}
+SEQUENCE_TYPES = {'str', 'list', 'tuple', 'bytearray', 'range', 'bytes', 'memoryview'} # builtin types indexed by integers
+ORDERED_KINDS = ('list', 'tuple') # kinds of sequences that are indexed and iterated by their items
+SEQUENCE_CALLS = {'list', 'tuple', 'set', 'frozenset'} # builtin names creating a sequence from another one
+BRAIN_CALLS = SEQUENCE_CALLS | {'str', 'int', 'len', 'bool', 'callable', 'type'} # builtin names whose calls are inferred from the arguments
+
+BINARY_OPS = {
+    ast.Add: operator.add, ast.Sub: operator.sub, ast.Mult: operator.mul, ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv, ast.Mod: operator.mod, ast.Pow: operator.pow, ast.LShift: operator.lshift,
+    ast.RShift: operator.rshift, ast.BitOr: operator.or_, ast.BitXor: operator.xor, ast.BitAnd: operator.and_,
+    ast.MatMult: operator.matmul,
+}
+UNARY_OPS = {ast.USub: operator.neg, ast.UAdd: operator.pos, ast.Invert: operator.invert}
+COMPARE_OPS = {
+    ast.Eq: operator.eq, ast.NotEq: operator.ne, ast.Lt: operator.lt, ast.LtE: operator.le,
+    ast.Gt: operator.gt, ast.GtE: operator.ge,
+}
+
+
+class Constant():
+    """ Inferred number, string, boolean or None. """
+
+    def __init__(self, value):
+        self.value = value
+
+
+class Sequence():
+    """ Inferred list, tuple or set. Its items are either nodes, inferred in the context of the
+    sequence, or values that were inferred already. """
+
+    def __init__(self, kind, items, context=None, node=None):
+        self.kind = kind # 'list', 'tuple', 'set' or 'frozenset'
+        self.items = items
+        self.context = context
+        self.node = node # the literal of the sequence, None if it was computed
+
+
+class Function():
+    """ Inferred function defined in the checked code. """
+
+    def __init__(self, node):
+        self.node = node
+
+
+class Builtin():
+    """ Inferred builtin function or class. """
+
+    def __init__(self, name):
+        self.name = name
+        self.is_class = isinstance(getattr(builtins, name, None), type)
+
+
+class Instance():
+    """ Inferred instance of a builtin class, e.g. the result of 'range()'. """
+
+    def __init__(self, name):
+        self.name = name
+
+
+class Unknown():
+    """ Value that could not be inferred. """
+
+
+class NameNotFound(Exception):
+    """ Raised while inferring a name that is not bound anywhere. """
+
+
+UNKNOWN = Unknown()
+
+
+class Scope():
+    """ Names bound in a function or the module. """
+
+    def __init__(self, node):
+        self.node = node
+        self.locals = {} # binding nodes by name, in the order of the code
+        self.returns = [] # return statements, without the ones of nested functions
+        self.assigned = None # names assigned in the scope or nested ones, see Analysis.getAssigned()
+
+    def bind(self, name, node):
+        self.locals.setdefault(name, []).append(node)
+
+
+class Consumer():
+    """ Names of a scope that were not used yet, while the checks visit the scope. """
+
+    def __init__(self, scope):
+        self.scope = scope
+        self.to_consume = {name: list(nodes) for (name, nodes) in scope.locals.items()}
+        self.consumed = {}
+        self.uncertain = {} # bindings below a condition that is always false, by name
+        self.uncertain_ifs = [] # if statements whose test is always false
+
+    def consume(self, name, nodes):
+        self.consumed[name] = nodes
+        unconsumed = [node for node in self.to_consume[name] if not any(node is other for other in nodes)]
+        if unconsumed:
+            self.to_consume[name] = unconsumed
+        else:
+            del self.to_consume[name]
+
+
+class StaticChecker():
+    """ Class for the static code analysis of the Python code generated from pseudo code, without
+    pylint. It reports the messages of pylint that AlgoBooster uses, with the same texts and
+    positions, in one pass over the tree (see Analysis). Messages pylint cannot report for the
+    generated code (e.g. about imports or '__all__') are never reported. """
+
+    def __init__(self, msg_ids):
+        """ Initializes the StaticChecker instance.
+
+        Keyword arguments:
+        self -- the StaticChecker instance
+        msg_ids -- the ids of the messages to report, all others are left out
+        """
+        self.__msg_ids = frozenset(msg_ids)
+
+    def check(self, py_code, filename):
+        """ Checks the code and returns the found messages as list of dictionaries
+        containing 'msg_id', 'line', 'column' and 'msg', like PylintEngine.check().
+
+        Keyword arguments:
+        self -- the StaticChecker instance
+        py_code -- the Python code to check
+        filename -- the file name of the code, only used by pylint
+        """
+        try:
+            tree = ast.parse(py_code + "\n", type_comments=True)
+        except SyntaxError as e:
+            messages = [{'msg_id': 'E0001', 'line': e.lineno or 0, 'column': e.offset, 'msg': MESSAGES['E0001'] % e}]
+        else:
+            messages = Analysis(tree).run()
+        return [msg for msg in messages if msg.get('msg_id') in self.msg_ids]
+
+    # Class helper methods
+
+    def getMsgIds(self):
+        """ Returns the ids of the reported messages.
+
+        Keyword arguments:
+        self -- the StaticChecker instance
+        """
+        return self.__msg_ids
+
+    msg_ids = property(getMsgIds)
+
+
+class Analysis():
+    """ One check of a tree. First the bindings of every scope are collected (see collect()),
+    then the statements are visited in the order of the code, and the names are consumed the
+    way pylint does (see checkName()). Values are inferred on demand, like astroid does it for
+    the values the generated code can have: literals, names, calculations, comparisons, calls
+    of its functions and of 'len()' and 'range()'. """
+
+    def __init__(self, tree):
+        """ Initializes the Analysis instance.
+
+        Keyword arguments:
+        self -- the Analysis instance
+        tree -- the parsed module
+        """
+        self.__tree = tree
+        self.__messages = []
+        self.__parents = {} # parent node by node
+        self.__frames = {} # innermost function or module by node
+        self.__order = {} # position of a node in the order of the code
+        self.__sizes = {} # number of nodes of the subtree of a node, see number()
+        self.__statements = {} # statement by node
+        self.__scopes = {} # Scope by function or module
+        self.__consumers = []
+        self.__lookups = {} # bindings of a name by the name node, see lookup()
+        self.__values = {} # inferred values by node and context
+        self.__inferring = set() # node and context of the values being inferred
+        self.__calls = set() # calls whose result is being inferred
+        self.__depth = 0
+        self.__functions = {} # Function by node
+        self.__builtins = {} # Builtin by name
+
+    def run(self):
+        """ Runs all checks and returns the found messages.
+
+        Keyword arguments:
+        self -- the Analysis instance
+        """
+        self.collect(self.__tree)
+        self.number()
+        self.visitFrame(self.__tree)
+        return self.__messages
+
+    def addMessage(self, msg_id, node, *args):
+        """ Adds a message at the position of a node.
+
+        Keyword arguments:
+        self -- the Analysis instance
+        msg_id -- the id of the message
+        node -- the node the message is about
+        args -- the values for the placeholders of the message text
+        """
+        text = MESSAGES[msg_id] % args if args else MESSAGES[msg_id]
+        self.__messages.append({'msg_id': msg_id, 'line': node.lineno, 'column': node.col_offset, 'msg': text})
+
+    # Tree
+
+    def collect(self, frame):
+        """ Collects the parents and the bindings of a function or the module, and of the
+        functions defined in it.
+
+        Keyword arguments:
+        self -- the Analysis instance
+        frame -- the function or module node
+        """
+        scope = Scope(frame)
+        self.__scopes[frame] = scope
+        if isinstance(frame, ast.FunctionDef):
+            self.__parents[frame.args] = frame
+            for arg in frame.args.args:
+                self.__parents[arg] = frame.args
+                scope.bind(arg.arg, arg)
+        for statement in frame.body:
+            self.__parents[statement] = frame
+
+        stack = list(reversed(frame.body))
+        while stack:
+            node = stack.pop()
+            self.__frames[node] = frame
+            if isinstance(node, ast.FunctionDef):
+                self.collect(node)
+                scope.bind(node.name, node)
+                continue
+            if isinstance(node, ast.Name) and isinstance(node.ctx, ast.Store):
+                scope.bind(node.id, node)
+            elif isinstance(node, ast.Return):
+                scope.returns.append(node)
+            children = [child for child in ast.iter_child_nodes(node) if isinstance(child, (ast.stmt, ast.expr))]
+            for child in children:
+                self.__parents[child] = node
+            stack.extend(reversed(children))
+
+    def number(self):
+        """ Numbers the nodes in the order of the code, so that the nodes below a node directly
+        follow it, and counts the nodes below every node.
+
+        Keyword arguments:
+        self -- the Analysis instance
+        """
+        nodes = list(self.iterTree(self.__tree))
+        for (position, node) in enumerate(nodes):
+            self.__order[node] = position
+            self.__sizes[node] = 1
+        for node in reversed(nodes[1:]):
+            self.__sizes[self.parentOf(node)] += self.__sizes[node]
+
+    def childrenOf(self, node):
+        """ Returns the statements and expressions of a node, the arguments for a function.
+
+        Keyword arguments:
+        self -- the Analysis instance
+        node -- the node
+        """
+        if isinstance(node, ast.FunctionDef):
+            return [node.args] + node.body
+        if isinstance(node, ast.arguments):
+            return list(node.args)
+        return [child for child in ast.iter_child_nodes(node) if isinstance(child, (ast.stmt, ast.expr))]
+
+    def parentOf(self, node):
+        """ Returns the parent of a node, None for the module.
+
+        Keyword arguments:
+        self -- the Analysis instance
+        node -- the node
+        """
+        return self.__parents.get(node)
+
+    def ancestorsOf(self, node):
+        """ Yields the ancestors of a node, from its parent to the module.
+
+        Keyword arguments:
+        self -- the Analysis instance
+        node -- the node
+        """
+        node = self.parentOf(node)
+        while node is not None:
+            yield node
+            node = self.parentOf(node)
+
+    def isParentOf(self, parent, node):
+        """ Returns whether a node is below another one.
+
+        Keyword arguments:
+        self -- the Analysis instance
+        parent -- the possible ancestor
+        node -- the node
+        """
+        position = self.__order[parent]
+        return position < self.__order[node] < position + self.__sizes[parent]
+
+    def frameOf(self, node):
+        """ Returns the function or module a node is in, the node itself for functions.
+
+        Keyword arguments:
+        self -- the Analysis instance
+        node -- the node
+        """
+        if isinstance(node, (ast.FunctionDef, ast.Module)):
+            return node
+        if isinstance(node, ast.arg):
+            return self.parentOf(self.parentOf(node))
+        return self.__frames.get(node, self.__tree)
+
+    def statementOf(self, node):
+        """ Returns the statement a node is part of, the function for its arguments.
+
+        Keyword arguments:
+        self -- the Analysis instance
+        node -- the node
+        """
+        if node not in self.__statements:
+            statement = node
+            while not isinstance(statement, (ast.stmt, ast.Module)):
+                statement = self.parentOf(statement)
+            self.__statements[node] = statement
+        return self.__statements[node]
+
+    def assignTypeOf(self, binding):
+        """ Returns the node assigning a binding: the assignment or loop, the arguments of
+        a function, or the function itself.
+
+        Keyword arguments:
+        self -- the Analysis instance
+        binding -- a name node, argument or function binding a name
+        """
+        if isinstance(binding, ast.arg):
+            return self.parentOf(binding)
+        return self.statementOf(binding)
+
+    def fieldOf(self, parent, node):
+        """ Returns the name of the field of an if statement containing a node.
+
+        Keyword arguments:
+        self -- the Analysis instance
+        parent -- the if statement
+        node -- a node below it
+        """
+        if self.__order[node] < self.__order[parent.body[0]]:
+            return 'test'
+        if parent.orelse and self.__order[node] >= self.__order[parent.orelse[0]]:
+            return 'orelse'
+        return 'body'
+
+    def areExclusive(self, first, second):
+        """ Returns whether two nodes are in different branches of an if statement.
+
+        Keyword arguments:
+        self -- the Analysis instance
+        first -- a node
+        second -- another node
+        """
+        for ancestor in self.ancestorsOf(second):
+            if self.isParentOf(ancestor, first):
+                if isinstance(ancestor, ast.If):
+                    fields = (self.fieldOf(ancestor, first), self.fieldOf(ancestor, second))
+                    return 'test' not in fields and fields[0] != fields[1]
+                return False
+        return False
+
+    def iterTree(self, node):
+        """ Yields a node and all nodes below it, in the order of the code.
+
+        Keyword arguments:
+        self -- the Analysis instance
+        node -- the node
+        """
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(reversed(self.childrenOf(node)))
+
+    def getAssigned(self, frame):
+        """ Returns the names assigned in a function, including its arguments and the names
+        assigned in nested functions.
+
+        Keyword arguments:
+        self -- the Analysis instance
+        frame -- the function or module node
+        """
+        scope = self.__scopes[frame]
+        if scope.assigned is None:
+            scope.assigned = {node.id if isinstance(node, ast.Name) else node.arg for node in self.iterTree(frame)
+                if isinstance(node, ast.arg) or (isinstance(node, ast.Name) and isinstance(node.ctx, ast.Store))}
+        return scope.assigned
+
+    # Names
+
+    def lookup(self, node, name=None):
+        """ Returns the bindings of a name that can reach its use, in the innermost scope having
+        any, or None if the name is a builtin or undefined.
+
+        Keyword arguments:
+        self -- the Analysis instance
+        node -- the name node, or a function to look up a name from as a whole
+        name -- the name, if the node is a function
+        """
+        name = name or node.id
+        key = (node, name)
+        if key not in self.__lookups:
+            frame = self.frameOf(node)
+            bindings = None
+            while frame is not None:
+                bindings = self.filterBindings(node, frame, self.__scopes[frame].locals.get(name, []))
+                if bindings:
+                    break
+                frame = None if frame is self.__tree else self.frameOf(self.parentOf(frame))
+            self.__lookups[key] = bindings or None
+        return self.__lookups[key]
+
+    def filterBindings(self, node, frame, bindings):
+        """ Returns the bindings of a scope that can reach the use of a name: the last one of
+        each block before the use, as long as no later binding of an enclosing block hides it,
+        and all bindings of loops. Bindings in another branch of an if statement are left out.
+
+        Keyword arguments:
+        self -- the Analysis instance
+        node -- the name node, or the function the name is looked up from
+        frame -- the function or module node of the scope
+        bindings -- the bindings of the name in the scope
+        """
+        use_statement = self.statementOf(node)
+        use_frame = self.frameOf(self.parentOf(node)) if isinstance(node, ast.FunctionDef) else self.frameOf(node)
+        use_line = use_statement.lineno if use_frame is frame else 0
+        found = []
+        blocks = [] # the node containing the statement of each found binding
+        for binding in bindings:
+            statement = self.statementOf(binding)
+            if statement.lineno > use_line > 0:
+                break
+            assign_type = self.assignTypeOf(binding)
+            if assign_type is use_statement:
+                return [binding] if isinstance(assign_type, ast.FunctionDef) else found
+            if statement is use_statement:
+                return [binding]
+
+            optional = isinstance(assign_type, ast.For) # the loop may not run at all
+            if optional and self.isParentOf(assign_type, node):
+                found = [binding]
+                blocks = [self.parentOf(statement)]
+                continue
+            index = next((i for (i, block) in enumerate(blocks) if block is self.parentOf(statement)), None)
+            if index is not None:
+                if self.isParentOf(self.assignTypeOf(found[index]), assign_type):
+                    continue
+                if not (optional or self.areExclusive(found[index], binding)):
+                    del blocks[index]
+                    del found[index]
+            if self.areExclusive(node, binding):
+                continue
+            if not isinstance(binding, ast.FunctionDef) and not optional and self.parentOf(statement) is self.parentOf(use_statement):
+                found = []
+                blocks = []
+            found.append(binding)
+            blocks.append(statement if isinstance(binding, ast.arg) else self.parentOf(statement))
+        return found
+
+    # Inference
+
+    def infer(self, node, context=None):
+        """ Returns the tuple of the possible values of an expression. Raises NameNotFound
+        if it uses a name that is not bound anywhere.
+
+        Keyword arguments:
+        self -- the Analysis instance
+        node -- the expression node
+        context -- the call whose arguments the function arguments have, see inferCall()
+        """
+        if context is not None and self.frameOf(node) is not context[1]:
+            context = None # only the arguments of the called function are known
+        key = (node, context)
+        if key in self.__values:
+            if self.__values[key] is None:
+                raise NameNotFound(node)
+            return self.__values[key]
+        if key in self.__inferring or self.__depth >= MAX_DEPTH:
+            return (UNKNOWN,)
+
+        self.__inferring.add(key)
+        self.__depth += 1
+        try:
+            values = self.inferNode(node, context)
+        except NameNotFound:
+            self.__values[key] = None
+            raise
+        finally:
+            self.__inferring.discard(key)
+            self.__depth -= 1
+
+        # the same value reached in several ways is kept once
+        unique = []
+        for value in values:
+            if not any(value is other for other in unique):
+                unique.append(value)
+                if len(unique) == MAX_VALUES:
+                    unique.append(UNKNOWN)
+                    break
+        values = tuple(unique) or (UNKNOWN,)
+        self.__values[key] = values
+        return values
+
+    def inferNode(self, node, context):
+        """ Returns the list of the possible values of an expression, see infer().
+
+        Keyword arguments:
+        self -- the Analysis instance
+        node -- the expression node
+        context -- the call whose arguments the function arguments have
+        """
+        if isinstance(node, ast.Constant):
+            return [Constant(node.value)]
+        if isinstance(node, (ast.List, ast.Set)):
+            return [Sequence('list' if isinstance(node, ast.List) else 'set', tuple(node.elts), context, node)]
+        if isinstance(node, ast.Name):
+            return self.inferName(node, context)
+        if isinstance(node, ast.BinOp):
+            return self.inferBinOp(node, context)
+        if isinstance(node, ast.UnaryOp):
+            return [self.unaryOperation(node.op, value) for value in self.infer(node.operand, context)]
+        if isinstance(node, ast.BoolOp):
+            return self.inferBoolOp(node, context)
+        if isinstance(node, ast.Compare):
+            return [self.inferCompare(node, context)]
+        if isinstance(node, ast.Call):
+            return self.inferCall(node, context)
+        if isinstance(node, ast.Subscript):
+            return self.inferSubscript(node, context)
+        return [UNKNOWN]
+
+    def inferName(self, node, context):
+        """ Returns the list of the values of the bindings of a name that reach its use.
+
+        Keyword arguments:
+        self -- the Analysis instance
+        node -- the name node
+        context -- the call whose arguments the function arguments have
+        """
+        bindings = self.lookup(node)
+        if bindings is None and node.id in BUILTIN_NAMES:
+            return [self.builtinValue(node.id)]
+        if bindings is None:
+            # a name of a nested function may be bound anywhere in the enclosing function
+            current = self.frameOf(node)
+            while self.parentOf(current) is not None and not isinstance(self.parentOf(current), ast.FunctionDef):
+                current = self.parentOf(current)
+            if self.parentOf(current) is not None:
+                bindings = self.lookup(self.parentOf(current), node.id)
+            if bindings is None:
+                raise NameNotFound(node)
+
+        # bindings whose value uses an unbound name are left out, except for assignments
+        values = []
+        for binding in bindings:
+            try:
+                if isinstance(binding, ast.FunctionDef):
+                    values.append(self.functionValue(binding))
+                elif isinstance(binding, ast.arg):
+                    values.extend(self.inferArgument(binding, context))
+                elif isinstance(self.parentOf(binding), ast.For):
+                    values.extend(self.inferLoopTarget(self.parentOf(binding), context) or [UNKNOWN])
+                elif isinstance(self.parentOf(binding), ast.Assign):
+                    values.extend(self.inferValue(self.parentOf(binding).value, context))
+                else:
+                    values.append(UNKNOWN)
+            except NameNotFound:
+                pass
+        return values
+
+    def inferArgument(self, arg, context):
+        """ Returns the values of a function argument, known only while a call of the function
+        is inferred.
+
+        Keyword arguments:
+        self -- the Analysis instance
+        arg -- the argument node
+        context -- the call whose arguments the function arguments have
+        """
+        function = self.parentOf(self.parentOf(arg))
+        if context is None or context[1] is not function:
+            return [UNKNOWN]
+        (call, _, call_context) = context
+        params = [param.arg for param in function.args.args]
+        position = params.index(arg.arg)
+        if len(call.args) > len(params) or position >= len(call.args) or call.keywords:
+            return [UNKNOWN]
+        return self.infer(call.args[position], call_context)
+
+    def inferLoopTarget(self, loop, context):
+        """ Returns the values of the target of a loop: the items of the lists it iterates,
+        none if they are not known.
+
+        Keyword arguments:
+        self -- the Analysis instance
+        loop -- the for statement
+        context -- the call whose arguments the function arguments have
+        """
+        values = []
+        for sequence in self.infer(loop.iter, context):
+            if isinstance(sequence, Sequence) and sequence.kind in ORDERED_KINDS:
+                for item in sequence.items:
+                    try:
+                        values.extend(self.inferItem(sequence, item))
+                    except NameNotFound:
+                        pass
+        return values
+
+    def inferValue(self, node, context=None):
+        """ Returns the tuple of the possible values of an expression, UNKNOWN if it uses
+        a name that is not bound anywhere.
+
+        Keyword arguments:
+        self -- the Analysis instance
+        node -- the expression node
+        context -- the call whose arguments the function arguments have
+        """
+        try:
+            return self.infer(node, context)
+        except NameNotFound:
+            return (UNKNOWN,)
+
+    def inferItem(self, sequence, item):
+        """ Returns the values of an item of a sequence.
+
+        Keyword arguments:
+        self -- the Analysis instance
+        sequence -- the Sequence
+        item -- the item node or value
+        """
+        if isinstance(item, ast.AST):
+            return self.infer(item, sequence.context)
+        return (item,)
+
+    def safeItem(self, sequence, item):
+        """ Returns the only value of an item of a sequence, UNKNOWN if it has several.
+
+        Keyword arguments:
+        self -- the Analysis instance
+        sequence -- the Sequence
+        item -- the item node or value
+        """
+        if isinstance(item, ast.AST):
+            value = self.safeInfer(item, sequence.context)
+            return UNKNOWN if value is None else value
+        return item
+
+    def inferBinOp(self, node, context):
+        """ Returns the list of the values of a calculation, for every combination of the values
+        of its operands. The values stop at the first unknown operand.
+
+        Keyword arguments:
+        self -- the Analysis instance
+        node -- the BinOp node
+        context -- the call whose arguments the function arguments have
+        """
+        values = []
+        for (left, right) in itertools.product(self.infer(node.left, context), self.infer(node.right, context)):
+            if left is UNKNOWN or right is UNKNOWN:
+                values.append(UNKNOWN)
+                break
+            values.append(self.binaryOperation(node.op, left, right))
+            if len(values) > MAX_VALUES:
+                break
+        return values
+
+    def isTooLarge(self, op, left, right):
+        """ Returns whether the result of a calculation on two constants can have more than
+        MAX_BITS bits or MAX_LENGTH characters, estimated from the size of the operands, so
+        calculations taking long are not done. Calculations on floats raise an OverflowError instead.
+
+        Keyword arguments:
+        self -- the Analysis instance
+        op -- the operator node
+        left -- the value of the left operand
+        right -- the value of the right operand
+        """
+        texts = [value for value in (left, right) if isinstance(value, (str, bytes))]
+        if texts:
+            if isinstance(op, ast.Add) and len(texts) == 2:
+                return len(left) + len(right) > MAX_LENGTH
+            if isinstance(op, ast.Mult) and len(texts) == 1:
+                times = right if texts[0] is left else left
+                return isinstance(times, int) and len(texts[0]) * times > MAX_LENGTH
+            return False
+        if not (isinstance(left, int) and isinstance(right, int)):
+            return False
+        if isinstance(op, ast.Mult):
+            bits = left.bit_length() + right.bit_length()
+        elif isinstance(op, ast.LShift):
+            bits = left.bit_length() + right
+        elif isinstance(op, ast.Pow):
+            bits = left.bit_length() * right # a negative exponent gives a float
+        else:
+            bits = max(left.bit_length(), right.bit_length()) + 1
+        return bits > MAX_BITS
+
+    def binaryOperation(self, op, left, right):
+        """ Returns the value of a calculation on two known values.
+
+        Keyword arguments:
+        self -- the Analysis instance
+        op -- the operator node
+        left -- the value of the left operand
+        right -- the value of the right operand
+        """
+        if isinstance(left, Constant) and isinstance(right, Constant):
+            if self.isTooLarge(op, left.value, right.value):
+                return UNKNOWN
+            try:
+                return Constant(BINARY_OPS[type(op)](left.value, right.value))
+            except Exception:
+                return UNKNOWN
+
+        # lists and tuples can be concatenated and repeated
+        if isinstance(op, ast.Add) and isinstance(left, Sequence) and isinstance(right, Sequence) and left.kind == right.kind and left.kind in ORDERED_KINDS:
+            return Sequence(left.kind, tuple(self.safeItem(sequence, item) for sequence in (left, right) for item in sequence.items))
+        if isinstance(op, ast.Mult):
+            if isinstance(right, Sequence):
+                (left, right) = (right, left)
+            if isinstance(left, Sequence) and left.kind in ORDERED_KINDS and isinstance(right, Constant) and isinstance(right.value, int):
+                if right.value > MAX_REPEAT:
+                    return Sequence(left.kind, (UNKNOWN,))
+                if len(left.items) * right.value > MAX_ITEMS:
+                    return UNKNOWN
+                return Sequence(left.kind, tuple(self.safeItem(left, item) for item in left.items) * right.value)
+        return UNKNOWN
+
+    def unaryOperation(self, op, value):
+        """ Returns the value of a unary operation on a value.
+
+        Keyword arguments:
+        self -- the Analysis instance
+        op -- the operator node
+        value -- the value of the operand
+        """
+        if value is UNKNOWN:
+            return UNKNOWN
+        if isinstance(op, ast.Not):
+            truth = self.truthOf(value)
+            return UNKNOWN if truth is None else Constant(not truth)
+        if isinstance(value, Constant):
+            try:
+                return Constant(UNARY_OPS[type(op)](value.value))
+            except Exception:
+                return UNKNOWN
+        return UNKNOWN
+
+    def truthOf(self, value):
+        """ Returns whether a value is true, None if it is not known.
+
+        Keyword arguments:
+        self -- the Analysis instance
+        value -- the value
+        """
+        if isinstance(value, Constant):
+            return bool(value.value)
+        if isinstance(value, Sequence):
+            return bool(value.items)
+        if isinstance(value, (Function, Builtin)):
+            return True
+        return None
+
+    def inferBoolOp(self, node, context):
+        """ Returns the list of the values of a boolean operation, for every combination of the
+        values of its operands.
+
+        Keyword arguments:
+        self -- the Analysis instance
+        node -- the BoolOp node
+        context -- the call whose arguments the function arguments have
+        """
+        predicate = operator.truth if isinstance(node.op, ast.Or) else operator.not_
+        values = []
+        for combination in itertools.product(*[self.infer(value, context) for value in node.values]):
+            truths = [None if value is UNKNOWN else self.truthOf(value) for value in combination]
+            if any(truth is None for truth in truths):
+                values.append(UNKNOWN)
+            else:
+                selected = next((value for (value, truth) in zip(combination, truths) if predicate(truth)), combination[-1])
+                values.append(selected)
+            if len(values) > MAX_VALUES:
+                break
+        return values
+
+    def inferCompare(self, node, context):
+        """ Returns the value of a comparison, UNKNOWN unless all values of its operands
+        give the same result.
+
+        Keyword arguments:
+        self -- the Analysis instance
+        node -- the Compare node
+        context -- the call whose arguments the function arguments have
+        """
+        result = True
+        lefts = self.infer(node.left, context)
+        for (op, comparator) in zip(node.ops, node.comparators):
+            rights = self.infer(comparator, context)
+            if type(op) not in COMPARE_OPS:
+                return UNKNOWN
+            result = None
+            for (left, right) in itertools.product(lefts, rights):
+                try:
+                    value = COMPARE_OPS[type(op)](self.literalOf(left), self.literalOf(right))
+                except Exception:
+                    return UNKNOWN
+                if result is None:
+                    result = value
+                elif result != value:
+                    return UNKNOWN
+            if result is not True:
+                break
+            lefts = rights
+        return Constant(result)
+
+    def literalOf(self, value):
+        """ Returns the Python object of a value that can be written as literal, and raises
+        a ValueError for all other values.
+
+        Keyword arguments:
+        self -- the Analysis instance
+        value -- the value
+        """
+        if isinstance(value, Constant):
+            return ast.literal_eval(repr(value.value))
+        if isinstance(value, Sequence):
+            if value.node is not None:
+                return ast.literal_eval(value.node)
+            if value.kind == 'frozenset':
+                raise ValueError("no literal")
+            return getattr(builtins, value.kind)(self.literalOf(item) for item in value.items)
+        raise ValueError("no literal")
+
+    def inferCall(self, node, context):
+        """ Returns the list of the values a call can return.
+
+        Keyword arguments:
+        self -- the Analysis instance
+        node -- the Call node
+        context -- the call whose arguments the function arguments have
+        """
+        if node in self.__calls or (context is not None and len(self.contextCalls(context)) >= MAX_CALLS):
+            return [UNKNOWN] # recursion
+        if isinstance(node.func, ast.Name) and node.func.id in BRAIN_CALLS and not node.keywords:
+            # calls of the builtin names are inferred from their arguments, whatever the name is bound to
+            value = self.inferBuiltinCall(node.func.id, node, context)
+            if value is not None:
+                return [value]
+        values = []
+        self.__calls.add(node)
+        try:
+            for callee in self.infer(node.func, context):
+                if callee is UNKNOWN:
+                    values.append(UNKNOWN)
+                elif isinstance(callee, Function):
+                    values.extend(self.inferResult(callee.node, node, context))
+                elif isinstance(callee, Builtin) and callee.is_class:
+                    values.append(Instance(callee.name))
+        finally:
+            self.__calls.discard(node)
+        return values
+
+    def contextCalls(self, context):
+        """ Returns the calls of a context, from the innermost one.
+
+        Keyword arguments:
+        self -- the Analysis instance
+        context -- the call whose arguments the function arguments have
+        """
+        calls = []
+        while context is not None:
+            calls.append(context[0])
+            context = context[2]
+        return calls
+
+    def inferResult(self, function, call, context):
+        """ Returns the list of the values a function returns for a call: the values of
+        all its return statements, None if it has none.
+
+        Keyword arguments:
+        self -- the Analysis instance
+        function -- the FunctionDef node
+        call -- the Call node
+        context -- the call whose arguments the arguments of the call have
+        """
+        returns = self.__scopes[function].returns
+        if not returns:
+            return [Constant(None)]
+        values = []
+        for statement in returns:
+            if statement.value is None:
+                values.append(Constant(None))
+            else:
+                values.extend(self.inferValue(statement.value, (call, function, context)))
+        return values
+
+    def inferBuiltinCall(self, name, call, context):
+        """ Returns the value of a call of a builtin name computed from its arguments, or None
+        if the call is inferred from the called value instead.
+
+        Keyword arguments:
+        self -- the Analysis instance
+        name -- the called name
+        call -- the Call node
+        context -- the call whose arguments the arguments of the call have
+        """
+        if name in SEQUENCE_CALLS:
+            return self.inferSequenceCall(name, call, context)
+        if name == 'str':
+            return Constant("")
+        if name == 'int':
+            value = self.inferValue(call.args[0], context)[0] if call.args else Constant(0)
+            if value is UNKNOWN:
+                return None
+            if isinstance(value, Constant) and isinstance(value.value, (int, str)):
+                try:
+                    return Constant(int(value.value))
+                except ValueError:
+                    return Constant(0)
+            return Constant(0)
+        if name == 'len':
+            value = self.safeInfer(call.args[0], context) if len(call.args) == 1 else None
+            if isinstance(value, Constant) and isinstance(value.value, (str, bytes)):
+                return Constant(len(value.value))
+            if isinstance(value, Sequence):
+                return Constant(len(value.items))
+            return None
+
+        # 'bool()', 'callable()' and 'type()' of the first value of the argument
+        if len(call.args) != 1:
+            return Constant(False) if name == 'bool' and not call.args else None
+        value = self.inferValue(call.args[0], context)[0]
+        if value is UNKNOWN:
+            return UNKNOWN
+        if name == 'bool':
+            truth = self.truthOf(value)
+            return UNKNOWN if truth is None else Constant(truth)
+        if name == 'callable':
+            return Constant(isinstance(value, (Function, Builtin)))
+        kind = 'type' if isinstance(value, Builtin) and value.is_class else self.typeOf(value)
+        return self.builtinValue(kind) if kind in BUILTIN_NAMES else UNKNOWN
+
+    def inferSequenceCall(self, kind, call, context):
+        """ Returns the sequence created by a call of 'list()', 'tuple()', 'set()' or
+        'frozenset()' from the items of a sequence or the characters of a string, or None
+        if the argument is another value.
+
+        Keyword arguments:
+        self -- the Analysis instance
+        kind -- the called name
+        call -- the Call node
+        context -- the call whose arguments the arguments of the call have
+        """
+        if not call.args:
+            return Sequence(kind, ())
+        if len(call.args) > 1:
+            return None
+        value = self.inferValue(call.args[0], context)[0]
+        if isinstance(value, Sequence) and value.kind == kind:
+            return value
+        if isinstance(value, Sequence):
+            items = [self.safeItem(value, item) for item in value.items]
+            return Sequence(kind, tuple(item for item in items if item is not UNKNOWN))
+        if isinstance(value, Constant) and isinstance(value.value, (str, bytes)):
+            return Sequence(kind, tuple(Constant(char) for char in value.value))
+        return None
+
+    def inferSubscript(self, node, context):
+        """ Returns the list of the values of an indexed list.
+
+        Keyword arguments:
+        self -- the Analysis instance
+        node -- the Subscript node
+        context -- the call whose arguments the function arguments have
+        """
+        values = []
+        for sequence in self.infer(node.value, context):
+            if sequence is UNKNOWN:
+                return values + [UNKNOWN]
+            for index in self.infer(node.slice, context):
+                if index is UNKNOWN:
+                    return values + [UNKNOWN]
+                if isinstance(sequence, Sequence) and sequence.kind in ORDERED_KINDS and isinstance(index, Constant):
+                    try:
+                        item = sequence.items[index.value]
+                    except (IndexError, TypeError):
+                        return values + [UNKNOWN]
+                    if item is UNKNOWN:
+                        return values + [UNKNOWN]
+                    values.extend(self.inferItem(sequence, item))
+                elif isinstance(sequence, Constant) and isinstance(sequence.value, str) and isinstance(index, Constant):
+                    try:
+                        values.append(Constant(sequence.value[index.value]))
+                    except (IndexError, TypeError):
+                        return values + [UNKNOWN]
+                else:
+                    return values + [UNKNOWN]
+        return values
+
+    def safeInfer(self, node, context=None):
+        """ Returns the value of an expression if all its possible values are of the same type,
+        otherwise None. The value is UNKNOWN if the first one could not be inferred.
+
+        Keyword arguments:
+        self -- the Analysis instance
+        node -- the expression node
+        context -- the call whose arguments the function arguments have
+        """
+        try:
+            values = self.infer(node, context)
+        except NameNotFound:
+            return None
+        first = values[0]
+        types = set() if first is UNKNOWN else {self.typeOf(first)}
+        for value in values[1:]:
+            if value is UNKNOWN or self.typeOf(value) not in types:
+                return None
+            if isinstance(value, Function) and isinstance(first, Function) and len(value.node.args.args) != len(first.node.args.args):
+                return None
+        return first
+
+    def typeOf(self, value):
+        """ Returns the name of the Python type of a known value.
+
+        Keyword arguments:
+        self -- the Analysis instance
+        value -- the value
+        """
+        if isinstance(value, Constant):
+            return type(value.value).__name__
+        if isinstance(value, Sequence):
+            return value.kind
+        if isinstance(value, Function):
+            return 'function'
+        if isinstance(value, Builtin):
+            return 'type' if value.is_class else 'builtin_function_or_method'
+        return value.name
+
+    def functionValue(self, node):
+        """ Returns the value of a function defined in the code.
+
+        Keyword arguments:
+        self -- the Analysis instance
+        node -- the FunctionDef node
+        """
+        if node not in self.__functions:
+            self.__functions[node] = Function(node)
+        return self.__functions[node]
+
+    def builtinValue(self, name):
+        """ Returns the value of a builtin.
+
+        Keyword arguments:
+        self -- the Analysis instance
+        name -- the name of the builtin
+        """
+        if name not in self.__builtins:
+            self.__builtins[name] = Builtin(name)
+        return self.__builtins[name]
+
+    # Checks
+
+    def visitFrame(self, frame):
+        """ Visits the statements of a function or the module and reports its unused variables.
+
+        Keyword arguments:
+        self -- the Analysis instance
+        frame -- the function or module node
+        """
+        consumer = Consumer(self.__scopes[frame])
+        self.__consumers.append(consumer)
+        for statement in frame.body:
+            self.visitStatement(statement)
+        self.__consumers.pop()
+        if isinstance(frame, ast.FunctionDef):
+            self.checkUnused(frame, consumer)
+
+    def visitStatement(self, statement):
+        """ Checks a statement and visits its expressions and blocks.
+
+        Keyword arguments:
+        self -- the Analysis instance
+        statement -- the statement node
+        """
+        if isinstance(statement, ast.FunctionDef):
+            self.checkFunctionDef(statement)
+            self.visitFrame(statement)
+            return
+        if isinstance(statement, (ast.Return, ast.Break, ast.Continue)):
+            self.checkUnreachable(statement)
+        elif isinstance(statement, ast.If):
+            self.checkIf(statement)
+        elif isinstance(statement, ast.For):
+            self.checkIterable(statement)
+        elif isinstance(statement, ast.Assign):
+            self.checkAssignment(statement)
+
+        for child in ast.iter_child_nodes(statement):
+            if isinstance(child, ast.stmt):
+                self.visitStatement(child)
+            elif isinstance(child, ast.expr):
+                self.visitExpression(child)
+
+    def visitExpression(self, expression):
+        """ Checks an expression and the expressions in it, in the order of the code.
+
+        Keyword arguments:
+        self -- the Analysis instance
+        expression -- the expression node
+        """
+        stack = [expression]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, ast.Name):
+                if isinstance(node.ctx, ast.Load):
+                    self.checkName(node)
+            elif isinstance(node, ast.Call):
+                self.checkCall(node)
+            elif isinstance(node, ast.Subscript):
+                self.checkSubscript(node)
+            stack.extend(reversed([child for child in ast.iter_child_nodes(node) if isinstance(child, ast.expr)]))
+
+    def checkName(self, node):
+        """ Checks that a used name is defined before and consumes its bindings (E0601, E0602),
+        and checks the use of loop variables after their loop (W0631).
+
+        Keyword arguments:
+        self -- the Analysis instance
+        node -- the name node
+        """
+        statement = self.statementOf(node)
+        frame = self.frameOf(statement)
+        for consumer in reversed(self.__consumers):
+            (done, consumed) = self.checkConsumer(node, statement, frame, consumer)
+            if consumed:
+                consumer.consume(node.id, consumed + consumer.uncertain.get(node.id, []))
+            if done:
+                break
+        else:
+            if node.id not in MODULE_NAMES and node.id not in BUILTIN_NAMES:
+                self.addMessage('E0602', node, node.id)
+        self.checkLoopVariable(node)
+
+    def checkConsumer(self, node, statement, frame, consumer):
+        """ Checks the use of a name against the bindings of one scope. Returns a tuple of
+        whether the name was found in the scope and the bindings it consumes.
+
+        Keyword arguments:
+        self -- the Analysis instance
+        node -- the name node
+        statement -- the statement of the name
+        frame -- the function the statement is in
+        consumer -- the Consumer of the scope
+        """
+        if node.id in consumer.consumed:
+            return (True, None)
+        found = self.nextToConsume(node, consumer)
+        if found is None:
+            return (False, None)
+        if not found:
+            self.addMessage('E0601', node, node.id)
+            return (True, list(consumer.uncertain.get(node.id, [])))
+
+        definition = self.statementOf(found[0])
+        definition_frame = self.frameOf(definition)
+        if frame is not definition_frame:
+            # names of other functions are used when the code runs, only a function defined later in the same block is missing
+            maybe_before = isinstance(frame, ast.FunctionDef) and self.isParentOf(frame, definition_frame) and node.lineno < definition_frame.lineno
+        elif frame is self.__tree:
+            maybe_before = node.id not in MODULE_NAMES and node.id not in BUILTIN_NAMES
+        elif node.id not in self.getAssigned(frame) and (node.id in self.__scopes[self.__tree].locals or node.id in BUILTIN_NAMES):
+            # a function hiding a builtin or global name is used before its definition
+            if statement is definition:
+                return (False, None)
+            maybe_before = False
+        else:
+            maybe_before = True
+
+        maybe_before = maybe_before and statement.lineno <= definition.lineno
+        if maybe_before and statement.lineno == definition.lineno and frame is definition_frame:
+            if isinstance(frame, ast.FunctionDef) and statement is not definition and self.isParentOf(frame, node):
+                maybe_before = False
+        if maybe_before and not self.isDefinedBefore(node):
+            self.addMessage('E0601', node, node.id)
+        return (True, found)
+
+    def nextToConsume(self, node, consumer):
+        """ Returns the bindings of a scope a name uses, None if the scope has none.
+        Bindings below an if statement whose test is always false are left out.
+
+        Keyword arguments:
+        self -- the Analysis instance
+        node -- the name node
+        consumer -- the Consumer of the scope
+        """
+        found = consumer.to_consume.get(node.id)
+        parent = self.parentOf(node)
+        if found and isinstance(parent, ast.Assign) and self.parentOf(found[0]) is parent:
+            target = parent.targets[0]
+            if isinstance(target, ast.Name) and target.id == node.id:
+                found = None # the name is assigned in the same statement
+        if found and isinstance(parent, ast.For) and parent.iter is node and any(binding is parent.target for binding in found):
+            found = None
+        if found:
+            uncertain = self.uncertainBindings(found, node, consumer)
+            consumer.uncertain.setdefault(node.id, []).extend(uncertain)
+            found = [binding for binding in found if not any(binding is other for other in uncertain)]
+        return found
+
+    def uncertainBindings(self, bindings, node, consumer):
+        """ Returns the bindings below an if statement whose test is always false, unless all
+        branches of the if statement bind the name.
+
+        Keyword arguments:
+        self -- the Analysis instance
+        bindings -- the bindings of the name
+        node -- the name node
+        consumer -- the Consumer of the scope
+        """
+        uncertain = []
+        for binding in bindings:
+            if not isinstance(binding, (ast.Name, ast.arg)):
+                continue
+            closest_if = next((ancestor for ancestor in self.ancestorsOf(binding) if isinstance(ancestor, ast.If)), None)
+            if closest_if is None or self.frameOf(node) is not self.frameOf(closest_if) or self.isParentOf(closest_if, node):
+                continue
+            name = binding.id if isinstance(binding, ast.Name) else binding.arg
+            if self.definesExhaustively(name, closest_if):
+                continue
+            if any(self.isParentOf(if_node, closest_if) for if_node in consumer.uncertain_ifs):
+                uncertain.append(binding)
+                continue
+            values = self.inferValue(closest_if.test)
+            if not all(isinstance(value, Constant) and not value.value for value in values):
+                continue
+            uncertain.append(binding)
+            consumer.uncertain_ifs.append(closest_if)
+        return uncertain
+
+    def definesExhaustively(self, name, statement):
+        """ Returns whether every branch of an if statement binds a name or returns, or
+        whether it contains a break.
+
+        Keyword arguments:
+        self -- the Analysis instance
+        name -- the name
+        statement -- the statement
+        """
+        if not isinstance(statement, ast.If):
+            return False
+        if any(isinstance(node, ast.Break) for node in self.iterTree(statement)):
+            return True
+        if not statement.orelse:
+            return False
+        return self.branchDefines(name, statement.body) and self.branchDefines(name, statement.orelse)
+
+    def branchDefines(self, name, body):
+        """ Returns whether a block binds a name or returns in all cases.
+
+        Keyword arguments:
+        self -- the Analysis instance
+        name -- the name
+        body -- the statements of the block
+        """
+        for statement in body:
+            if isinstance(statement, (ast.Return, ast.Raise, ast.Assert, ast.Continue)):
+                return True
+            if isinstance(statement, ast.Assign) and any(isinstance(target, ast.Name) and target.id == name for target in statement.targets):
+                return True
+            if isinstance(statement, (ast.If, ast.For, ast.While)) and self.definesExhaustively(name, statement):
+                return True
+        return False
+
+    def isDefinedBefore(self, node):
+        """ Returns whether an enclosing statement binds a used name: an if statement binding
+        it in its body, a loop binding it anywhere, or a function having it as argument or name.
+
+        Keyword arguments:
+        self -- the Analysis instance
+        node -- the name node
+        """
+        for ancestor in self.ancestorsOf(node):
+            definition = None
+            if isinstance(ancestor, ast.If):
+                definition = next((target for statement in ancestor.body if isinstance(statement, ast.Assign)
+                    for target in statement.targets if isinstance(target, ast.Name) and target.id == node.id), None)
+            elif isinstance(ancestor, ast.For):
+                definition = next((child for child in self.iterTree(ancestor) if (isinstance(child, ast.Name)
+                    and isinstance(child.ctx, ast.Store) and child.id == node.id) or (isinstance(child, ast.arg) and child.arg == node.id)), None)
+            elif isinstance(ancestor, ast.FunctionDef):
+                if ancestor.name == node.id or any(arg.arg == node.id for arg in ancestor.args.args):
+                    definition = ancestor
+            if definition is None:
+                continue
+            if isinstance(self.frameOf(definition), ast.FunctionDef):
+                return self.frameOf(node) is self.frameOf(definition)
+            if definition.lineno < node.lineno:
+                return True
+            break
+        return False
+
+    def checkLoopVariable(self, node):
+        """ Checks the use of a loop variable after the loop, which is only defined if the
+        loop ran at least once (W0631).
+
+        Keyword arguments:
+        self -- the Analysis instance
+        node -- the name node
+        """
+        bindings = self.lookup(node)
+        if not bindings:
+            return
+        frame = self.frameOf(node)
+        if isinstance(frame, ast.FunctionDef) and any(self.isParentOf(self.frameOf(binding), frame) for binding in bindings):
+            return # the variable of an enclosing function
+
+        first = bindings[0]
+        if isinstance(first, ast.FunctionDef) or self.isParentOf(self.statementOf(first), node) or self.parentOf(first) is self.__tree:
+            kept = []
+        else:
+            kept = [first]
+        for (previous, binding) in zip(bindings, bindings[1:]):
+            if not self.isParentOf(self.statementOf(previous), binding):
+                kept.append(binding)
+        if len(kept) != 1:
+            return
+        loop = self.assignTypeOf(kept[0])
+        if not isinstance(loop, ast.For) or loop is self.statementOf(node):
+            return
+
+        value = self.inferValue(loop.iter)[0]
+        if isinstance(value, Instance) and value.name == 'range':
+            return
+        if isinstance(value, Sequence) and value.items:
+            return
+        self.addMessage('W0631', node, node.id)
+
+    def checkUnused(self, frame, consumer):
+        """ Reports the variables and functions of a function that are never used (W0612).
+
+        Keyword arguments:
+        self -- the Analysis instance
+        frame -- the function node
+        consumer -- the Consumer of the function
+        """
+        for (name, bindings) in consumer.to_consume.items():
+            binding = bindings[0]
+            if isinstance(binding, ast.arg) or DUMMY_NAMES.match(name):
+                continue
+            self.addMessage('W0612', binding, name)
+
+    def checkFunctionDef(self, node):
+        """ Checks that a function does not hide an earlier binding of its name (E0102) and that
+        its arguments have different names (E0108).
+
+        Keyword arguments:
+        self -- the Analysis instance
+        node -- the FunctionDef node
+        """
+        first = self.__scopes[self.frameOf(self.parentOf(node))].locals[node.name][0]
+        if first is not node and not self.areExclusive(node, first) and not DUMMY_NAMES.match(node.name):
+            parent = self.parentOf(node)
+            test = parent.test if isinstance(parent, ast.If) else None
+            # 'if not f' tests whether the function is defined already
+            if not (isinstance(test, ast.UnaryOp) and isinstance(test.op, ast.Not) and isinstance(test.operand, ast.Name) and test.operand.id == node.name):
+                self.addMessage('E0102', node, first.lineno)
+
+        names = set()
+        for arg in node.args.args:
+            if arg.arg in names:
+                self.addMessage('E0108', arg, arg.arg)
+            names.add(arg.arg)
+
+    def checkUnreachable(self, node):
+        """ Reports the statement following a return or break in the same block (W0101).
+
+        Keyword arguments:
+        self -- the Analysis instance
+        node -- the return, break or continue statement
+        """
+        parent = self.parentOf(node)
+        for field in ('body', 'orelse'):
+            block = getattr(parent, field, [])
+            for (position, statement) in enumerate(block):
+                if statement is node:
+                    if position + 1 < len(block):
+                        self.addMessage('W0101', block[position + 1])
+                    return
+
+    def checkIf(self, node):
+        """ Checks for an 'else' after a body that returns (R1705) and for a test that is
+        always true or false (W0125).
+
+        Keyword arguments:
+        self -- the Analysis instance
+        node -- the If node
+        """
+        if node.orelse and any(isinstance(statement, ast.Return) for statement in node.body):
+            self.addMessage('R1705', node)
+
+        test = node.test
+        constant = isinstance(test, (ast.Constant, ast.List, ast.Set, ast.Tuple, ast.Dict, ast.Lambda, ast.GeneratorExp))
+        if not constant and not isinstance(test, (ast.Call, ast.BinOp, ast.BoolOp, ast.UnaryOp, ast.Subscript)):
+            constant = isinstance(self.safeInfer(test), (Function, Builtin))
+        if constant:
+            self.addMessage('W0125', test)
+
+    def checkIterable(self, node):
+        """ Checks that a loop iterates a value that can be iterated (E1133).
+
+        Keyword arguments:
+        self -- the Analysis instance
+        node -- the For node
+        """
+        value = self.safeInfer(node.iter)
+        if value is None or value is UNKNOWN:
+            return
+        if isinstance(value, Constant):
+            iterable = isinstance(value.value, (str, bytes))
+        elif isinstance(value, Instance):
+            kind = getattr(builtins, value.name)
+            iterable = hasattr(kind, '__iter__') or hasattr(kind, '__getitem__')
+        else:
+            iterable = isinstance(value, Sequence)
+        if not iterable:
+            self.addMessage('E1133', node.iter, ast.unparse(node.iter))
+
+    def checkAssignment(self, node):
+        """ Checks that the function whose result is assigned returns a value (E1111, E1128).
+
+        Keyword arguments:
+        self -- the Analysis instance
+        node -- the Assign node
+        """
+        if not isinstance(node.value, ast.Call):
+            return
+        function = self.safeInfer(node.value.func)
+        if not isinstance(function, Function):
+            return
+        returns = self.__scopes[function.node].returns
+        if not returns:
+            self.addMessage('E1111', node)
+        elif all(statement.value is None or (isinstance(statement.value, ast.Constant) and statement.value.value is None) for statement in returns):
+            self.addMessage('E1128', node)
+
+    def checkCall(self, node):
+        """ Checks for uses of exec (W0122) and that calls of the functions of the code pass
+        one value per argument (E1120, E1121).
+
+        Keyword arguments:
+        self -- the Analysis instance
+        node -- the Call node
+        """
+        if isinstance(node.func, ast.Name) and node.func.id == 'exec':
+            if 'exec' not in self.__scopes[self.frameOf(node)].locals and 'exec' not in self.__scopes[self.__tree].locals:
+                self.addMessage('W0122', node)
+
+        function = self.safeInfer(node.func)
+        if not isinstance(function, Function) or node.keywords or any(isinstance(arg, ast.Starred) for arg in node.args):
+            return
+        params = [arg.arg for arg in function.node.args.args]
+        if len(params) != len(set(params)):
+            return # the arguments the values are passed to are not clear
+        if len(node.args) > len(params):
+            self.addMessage('E1121', node)
+        for param in params[len(node.args):]:
+            self.addMessage('E1120', node, param)
+
+    def checkSubscript(self, node):
+        """ Checks that lists are only indexed with integers (E1126).
+
+        Keyword arguments:
+        self -- the Analysis instance
+        node -- the Subscript node
+        """
+        sequence = self.safeInfer(node.value)
+        load = isinstance(node.ctx, ast.Load)
+        if isinstance(sequence, Sequence):
+            indexed = sequence.kind == 'list' or (load and sequence.kind == 'tuple')
+        elif isinstance(sequence, Constant):
+            indexed = load and isinstance(sequence.value, (str, bytes))
+        elif isinstance(sequence, Instance):
+            indexed = sequence.name in SEQUENCE_TYPES and hasattr(getattr(builtins, sequence.name), '__getitem__' if load else '__setitem__')
+        else:
+            indexed = False
+        if not indexed:
+            return
+
+        index = self.safeInfer(node.slice)
+        if index is None or index is UNKNOWN or isinstance(node.slice, ast.Slice):
+            return
+        if isinstance(index, Constant) and isinstance(index.value, int):
+            return
+        if isinstance(index, Instance) and hasattr(getattr(builtins, index.name), '__index__'):
+            return
+        self.addMessage('E1126', node)
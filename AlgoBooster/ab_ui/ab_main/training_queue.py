@@ -0,0 +1,195 @@
+import os
+import socket
+import traceback
+from threading import Event, Lock, Thread
+
+from django.db import close_old_connections
+from django.utils import timezone
+
+from ab_ui.models import TrainingJob
+from ab_ui.ab_main import ab_controller
+
+
+POLL_INTERVAL = 30 # seconds between checks for jobs another process queued
+
+_worker = None
+_worker_pid = None
+_worker_lock = Lock()
+
+class TrainingWorker(Thread):
+    """ Class for the background thread processing the queued training jobs. All jobs
+    queued at the same time are processed as one batch with a single retraining. """
+
+    def __init__(self, poll_interval=POLL_INTERVAL):
+        """ Initializes the TrainingWorker instance.
+
+        Keyword arguments:
+        self -- the TrainingWorker instance
+        poll_interval -- the seconds between checks for queued jobs without notification (default POLL_INTERVAL)
+        """
+        Thread.__init__(self, daemon=True)
+        self.__poll_interval = poll_interval
+        self.__wake_up = Event()
+
+    def run(self):
+        """ Inherited from 'Thread'. Processes queued jobs until the process exits.
+
+        Keyword arguments:
+        self -- the TrainingWorker instance
+        """
+        try:
+            self.requeueOrphaned()
+        except Exception:
+            traceback.print_exc()
+        while True:
+            try:
+                while self.processBatch() > 0:
+                    pass # jobs queued in the meantime form the next batch
+            except Exception:
+                traceback.print_exc()
+            finally:
+                close_old_connections()
+            self.wake_up.wait(self.poll_interval)
+            self.wake_up.clear()
+
+    def notify(self):
+        """ Wakes the worker up to process a new job.
+
+        Keyword arguments:
+        self -- the TrainingWorker instance
+        """
+        self.wake_up.set()
+
+    def claimJobs(self):
+        """ Marks all queued jobs as running by the current process and returns them in order
+        of submission. Jobs claimed by the worker of another process at the same time are left out.
+
+        Keyword arguments:
+        self -- the TrainingWorker instance
+        """
+        claimed = []
+        for job in TrainingJob.objects.filter(status=TrainingJob.QUEUED).order_by('id'):
+            if TrainingJob.objects.filter(id=job.id, status=TrainingJob.QUEUED).update(status=TrainingJob.RUNNING, owner=getOwner(), updated=timezone.now()) == 1:
+                job.status = TrainingJob.RUNNING
+                job.owner = getOwner()
+                claimed += [job]
+        return claimed
+
+    def requeueOrphaned(self):
+        """ Queues the running jobs again whose process stopped, e.g. at a restart. Only the
+        processes of the current host can be checked, jobs of other hosts are left alone.
+        Returns the number of queued jobs.
+
+        Keyword arguments:
+        self -- the TrainingWorker instance
+        """
+        host = socket.gethostname()
+        requeued = 0
+        for job in TrainingJob.objects.filter(status=TrainingJob.RUNNING):
+            (job_host, _, pid) = job.owner.rpartition(":")
+            if job_host != host or not pid.isdigit() or isRunning(int(pid)):
+                continue
+            requeued += TrainingJob.objects.filter(id=job.id, status=TrainingJob.RUNNING, owner=job.owner).update(
+                status=TrainingJob.QUEUED, owner="", updated=timezone.now())
+        return requeued
+
+    def processBatch(self):
+        """ Saves the training sets of all queued jobs, then retrains the model once.
+        Returns the number of processed jobs.
+
+        Keyword arguments:
+        self -- the TrainingWorker instance
+        """
+        jobs = self.claimJobs()
+        if not jobs:
+            return 0
+
+        for job in jobs:
+            try:
+                job.result = ab_controller.trainAB(job.code, job.classification, False)
+            except Exception as exc:
+                job.result = "Training was not successful: " + str(exc)
+            job.status = TrainingJob.DONE if job.result.startswith(ab_controller.TRAIN_SAVED) else TrainingJob.FAILED
+            # saved right away, so the training set is not saved again if the process stops during the batch
+            job.save(update_fields=['status', 'result', 'updated'])
+
+        # Retrain once for the whole batch
+        update_result = ""
+        if any(job.status == TrainingJob.DONE for job in jobs):
+            try:
+                update_result = ab_controller.updateAB()
+            except Exception as exc:
+                update_result = "Model could not be retrained: " + str(exc)
+
+        for job in jobs:
+            if job.status == TrainingJob.DONE:
+                job.result += "\n" + update_result
+                job.save(update_fields=['result', 'updated'])
+        return len(jobs)
+
+    # Class helper methods
+
+    def getPollInterval(self):
+        """ Gets the seconds between checks for queued jobs.
+
+        Keyword arguments:
+        self -- the TrainingWorker instance
+        """
+        return self.__poll_interval
+
+    def getWakeUp(self):
+        """ Gets the event that is set when a new job was queued.
+
+        Keyword arguments:
+        self -- the TrainingWorker instance
+        """
+        return self.__wake_up
+
+    poll_interval = property(getPollInterval)
+    wake_up = property(getWakeUp)
+
+
+def getOwner():
+    """ Returns the owner of the jobs the current process runs, its host name and process id. """
+
+    return socket.gethostname() + ":" + str(os.getpid())
+
+def isRunning(pid):
+    """ Returns whether a process of the current host is running.
+
+    Keyword arguments:
+    pid -- the process id
+    """
+
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        pass # the process runs as another user
+    return True
+
+def getWorker():
+    """ Returns the training worker of the current process and starts it on first use. """
+
+    global _worker, _worker_pid
+    with _worker_lock:
+        # threads are not inherited by a forked child
+        if _worker is None or _worker_pid != os.getpid():
+            _worker_pid = os.getpid()
+            _worker = TrainingWorker()
+            _worker.start()
+    return _worker
+
+def enqueue(code, classification):
+    """ Saves a new training job and returns it. The job is processed in the background.
+
+    Keyword arguments:
+    code -- the input pseudo code to train
+    classification -- the class of the code
+    """
+
+    job = TrainingJob(code=code or "", classification=classification)
+    job.save()
+    getWorker().notify()
+    return job
@@ -0,0 +1,34 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+import ply.yacc as yacc
+
+from ab_ui.ab_main.ps2py_parser import ps2py_lex, ps2py_tables, ps2py_yacc
+
+
+class Command(BaseCommand):
+    """ Command building the precompiled tables of the pseudo code parser. """
+
+    help = ("Validates the lexer and grammar rules of the pseudo code parser and writes their tables, "
+            "which are loaded whenever the parser is imported. Run it after changing ps2py_lex or ps2py_yacc.")
+
+    def handle(self, *args, **options):
+        """ Runs the command.
+
+        Keyword arguments:
+        self -- the Command instance
+        args -- the positional arguments
+        options -- the parsed arguments
+        """
+        start = time.perf_counter()
+        try:
+            ps2py_tables.buildAll(ps2py_lex, ps2py_yacc)
+        except (SyntaxError, yacc.YaccError) as err:
+            raise CommandError("The parser rules are invalid: " + str(err))
+        except IOError as err:
+            raise CommandError("Could not write the parser tables: " + str(err))
+
+        for path in [ps2py_tables.LEXTAB_FILE, ps2py_tables.PARSETAB_FILE, ps2py_tables.DEBUG_FILE]:
+            self.stdout.write("Wrote " + path)
+        self.stdout.write("Built the parser tables in %.1f ms" % ((time.perf_counter() - start) * 1000))
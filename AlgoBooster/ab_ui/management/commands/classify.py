@@ -0,0 +1,175 @@
+import csv
+import json
+import os
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from ab_ui.ab_main import batch_runner
+
+
+RESULT_FIELDS = ['code', 'complexity', 'classification', 'probability', 'tips', 'error'] # CSV columns after the id
+PENDING_PER_WORKER = 4 # programs submitted per worker process at the same time
+PROGRESS_EVERY = 100 # programs between two progress outputs
+
+class Command(BaseCommand):
+    """ Command analysing many pseudo code submissions without the web interface. """
+
+    help = ("Analyses all pseudo code files of a directory, or all submissions of a JSONL file "
+            "with one {\"id\": ..., \"code\": ...} object per line, and writes the results as JSONL or CSV. "
+            "Submissions already in the output file are skipped, so an interrupted run can be continued.")
+
+    def add_arguments(self, parser):
+        """ Adds the arguments of the command.
+
+        Keyword arguments:
+        self -- the Command instance
+        parser -- the argument parser
+        """
+        parser.add_argument('input', help="directory of pseudo code files or JSONL file of submissions")
+        parser.add_argument('output', help="result file; written as CSV if it ends with .csv, as JSONL otherwise")
+        parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help="number of worker processes (default: number of CPUs)")
+
+    def handle(self, *args, **options):
+        """ Runs the command.
+
+        Keyword arguments:
+        self -- the Command instance
+        args -- the positional arguments
+        options -- the parsed arguments
+        """
+        input_path = options.get('input')
+        output_path = options.get('output')
+        workers = max(1, options.get('workers'))
+        as_csv = output_path.endswith(".csv")
+
+        if not os.path.exists(input_path):
+            raise CommandError("Input " + input_path + " does not exist.")
+
+        done = self.readDone(output_path, as_csv)
+        if done:
+            self.stdout.write("Skipping " + str(len(done)) + " submissions already in " + output_path)
+        submissions = (item for item in self.readSubmissions(input_path) if item[0] not in done)
+
+        count = 0
+        stage_times = {}
+        start = time.perf_counter()
+        executors = [] # the process pools created, a broken one is replaced by a new one
+
+        def getExecutor():
+            executors.append(batch_runner.createExecutor(workers))
+            return executors[-1]
+
+        new_file = not os.path.exists(output_path) or os.path.getsize(output_path) == 0
+        try:
+            with open(output_path, "a", newline="", encoding="utf-8") as out_file:
+                writer = csv.writer(out_file) if as_csv else None
+                if as_csv and new_file:
+                    writer.writerow(['id'] + RESULT_FIELDS)
+                if not new_file and not self.endsWithNewline(output_path):
+                    out_file.write("\n") # the last line of an interrupted run is incomplete
+
+                for (key, result, timings) in batch_runner.runAll(getExecutor, submissions, workers * PENDING_PER_WORKER):
+                    if as_csv:
+                        writer.writerow([key] + [result.get(field, "") for field in RESULT_FIELDS])
+                    else:
+                        out_file.write(json.dumps({'id': key, 'result': result}) + "\n")
+                    # written right away, so an interruption loses no finished results
+                    out_file.flush()
+
+                    count += 1
+                    for stage, seconds in timings.items():
+                        stage_times[stage] = stage_times.get(stage, 0) + seconds
+                    if count % PROGRESS_EVERY == 0:
+                        self.writeProgress(count, time.perf_counter() - start)
+        finally:
+            for executor in executors:
+                executor.shutdown(cancel_futures=True)
+
+        duration = time.perf_counter() - start
+        self.writeProgress(count, duration)
+        for stage, seconds in stage_times.items():
+            self.stdout.write("  %-12s %10.2f ms per program" % (stage, seconds * 1000 / max(count, 1)))
+
+    def readSubmissions(self, input_path):
+        """ Yields a tuple of id and pseudo code per submission. The id is the path
+        relative to the directory, or the 'id' of the JSONL line (default: the line number).
+
+        Keyword arguments:
+        self -- the Command instance
+        input_path -- the directory or JSONL file
+        """
+        if os.path.isdir(input_path):
+            for dir_path, dir_names, file_names in os.walk(input_path):
+                dir_names.sort()
+                for file_name in sorted(file_names):
+                    path = os.path.join(dir_path, file_name)
+                    try:
+                        with open(path, "r", encoding="utf-8") as code_file:
+                            code = code_file.read()
+                    except (IOError, UnicodeDecodeError) as err:
+                        self.stderr.write("Skipping " + path + ": " + str(err))
+                        continue
+                    yield (os.path.relpath(path, input_path), code)
+            return
+
+        with open(input_path, "r", encoding="utf-8") as input_file:
+            for line_number, line in enumerate(input_file, 1):
+                if line.strip() == "":
+                    continue
+                try:
+                    submission = json.loads(line)
+                    code = submission['code']
+                except (ValueError, KeyError, TypeError) as err:
+                    self.stderr.write("Skipping line " + str(line_number) + ": " + str(err))
+                    continue
+                yield (str(submission.get('id', line_number)), code)
+
+    def readDone(self, output_path, as_csv):
+        """ Returns the ids of the submissions already in the output file. Submissions whose
+        analysis failed are not taken as done, so they are analysed again.
+
+        Keyword arguments:
+        self -- the Command instance
+        output_path -- the result file
+        as_csv -- whether the result file is a CSV file
+        """
+        done = set()
+        if not os.path.exists(output_path):
+            return done
+        with open(output_path, "r", newline="", encoding="utf-8") as out_file:
+            if as_csv:
+                for row in csv.reader(out_file):
+                    # an incomplete last row of an interrupted run has less columns
+                    if len(row) == len(RESULT_FIELDS) + 1 and row[0] != 'id' and row[RESULT_FIELDS.index('error') + 1] == "":
+                        done.add(row[0])
+            else:
+                for line in out_file:
+                    try:
+                        entry = json.loads(line)
+                        if 'error' not in entry['result']:
+                            done.add(str(entry['id']))
+                    except (ValueError, KeyError, TypeError):
+                        pass # e.g. the last line of an interrupted run
+        return done
+
+    def endsWithNewline(self, output_path):
+        """ Returns whether the last line of the output file is complete.
+
+        Keyword arguments:
+        self -- the Command instance
+        output_path -- the result file
+        """
+        with open(output_path, "rb") as out_file:
+            out_file.seek(-1, os.SEEK_END)
+            return out_file.read(1) == b"\n"
+
+    def writeProgress(self, count, duration):
+        """ Prints the number of analysed programs and the throughput.
+
+        Keyword arguments:
+        self -- the Command instance
+        count -- the number of analysed programs
+        duration -- the seconds since the start
+        """
+        self.stdout.write("%d programs in %.1f s (%.2f programs/s)" % (count, duration, count / duration if duration > 0 else 0))
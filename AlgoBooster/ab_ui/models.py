@@ -103,3 +103,42 @@ class TrainData(AlgorithmData):
         return super().__str__() + ', Classification:' + str(self.classification)
 
 
+
+
+class TrainingJob(models.Model):
+    """ Class for a submitted training set that is processed in the background. """
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+
+    code = models.TextField()
+    classification = models.IntegerField(default=0)
+    status = models.CharField(max_length=10, default=QUEUED)
+    result = models.TextField(default="")
+    owner = models.CharField(max_length=100, default="") # host name and process id of the process running the job
+    created = models.DateTimeField(auto_now_add=True)
+    updated = models.DateTimeField(auto_now=True)
+
+    def getValues(self):
+        """ Returns the state of the job as dictionary.
+
+        Keyword arguments:
+        self -- the TrainingJob instance
+        """
+        job = {}
+        job['id'] = self.id
+        job['status'] = self.status
+        job['result'] = self.result
+        job['created'] = self.created.isoformat()
+        job['updated'] = self.updated.isoformat()
+        return job
+
+    def __str__(self):
+        """ Returns a string representing the instance.
+
+        Keyword arguments:
+        self -- the TrainingJob instance
+        """
+        return 'TrainingJob:' + str(self.id) + ', Status:' + self.status
@@ -1,10 +1,43 @@
 
+var PARSE_DELAY = 150; // milliseconds without typing before the code is parsed
+var parseTimer = null;
+var parseRequest = null;
+
 $(document).ready(function(){
     // Reset Button
     $('#resetBtn').on("click", function(){
         $("#build-frame").val("");
+        liveParse();
     });
 
+    // Parse the code while it is typed
+    $('#build-frame').on("input", function(){
+        clearTimeout(parseTimer);
+        parseTimer = setTimeout(liveParse, PARSE_DELAY);
+    });
 
 });
 
+function liveParse(){
+    var frame = $('#build-frame');
+    if (parseRequest !== null){
+        parseRequest.abort(); // only the result of the latest code is shown
+    }
+    parseRequest = $.ajax({
+        url: frame.data('parse-url'),
+        method: "POST",
+        contentType: "application/json",
+        data: JSON.stringify({code: frame.val()}),
+        headers: {"X-CSRFToken": $('input[name=csrfmiddlewaretoken]').val()},
+        success: function(result){
+            $('#parsed-code').html(toHtml(result.errors + result.code));
+        },
+        complete: function(){
+            parseRequest = null;
+        }
+    });
+}
+
+function toHtml(text){
+    return $('<div>').text(text).html().replace(/\n/g, "<br />").replace(/\t/g, "&nbsp;&nbsp;&nbsp;&nbsp;");
+}
@@ -6,8 +6,11 @@ urlpatterns = [
 	path('', views.index, name='index'),
 	path('algobooster/', views.algobooster, name='algobooster'),
 	path('algobooster/submit/', views.submit, name='submit'),
+	path('algobooster/parse/', views.live_parse, name='live_parse'),
 	path('training/', views.training, name='training'),
 	path('training/submit/', views.train, name='train'),
+	path('training/status/<int:job_id>/', views.training_status, name='training_status'),
+	path('api/batch/', views.batch, name='batch'),
 	path('about', views.about, name='about'),
 	path('imprint', views.imprint, name='imprint'),
 	path('disclaimer', views.disclaimer, name='disclaimer'),
@@ -1,8 +1,17 @@
+import json
+from django.conf import settings
 from django.shortcuts import render
-from django.http import HttpResponse
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
 from django.template import loader, RequestContext
+from django.urls import reverse
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_POST
 from django import forms
 from ab_ui.ab_main import ab_controller as main
+from ab_ui.ab_main import training_queue
+from ab_ui.ab_main import batch_runner
+from ab_ui.ab_main import incremental_parser
+from ab_ui.models import TrainingJob
 
 def index(request):
 	""" View function for the index page. """
@@ -35,24 +44,33 @@ def train(request):
 
 	# Read the classification
 	try:
-		classification = str(request.POST.get("classification"))
-	except TypeError:
+		classification = int(request.POST.get("classification"))
+	except (TypeError, ValueError):
 		context = {
 			'result': "Error while reading classification."
 		}
 		return render(request, "ab_ui/training.html", context)
 		
 
-	# Train machine learning system with the code and classification
-	result = main.trainAB(code, classification)
+	# Queue the training of the machine learning system with the code and classification
+	job = training_queue.enqueue(code, classification)
 
 	context = {
-		'result': result,
+		'result': "Training job " + str(job.id) + " was queued.",
+		'job_url': reverse('ab_ui:training_status', args=[job.id]),
 		'input': code,
-		'classification': classification
+		'classification': str(classification)
 	}
 	return render(request, "ab_ui/training.html", context)
 
+def training_status(request, job_id):
+	""" View function for the status of a queued training job as JSON. (GET) """
+	try:
+		job = TrainingJob.objects.get(id=job_id)
+	except TrainingJob.DoesNotExist:
+		return JsonResponse({'error': "Training job not found."}, status=404)
+	return JsonResponse(job.getValues())
+
 def submit(request):
 	""" View function for submitting code to the 'Use Algobooster' page. (POST) """
 	# Read the input pseudocode
@@ -84,3 +102,46 @@ def submit(request):
 	}
 	
 	return render(request, 'ab_ui/algobooster.html', context)
+
+@require_POST
+def live_parse(request):
+	""" View function for parsing the code of the 'Use Algobooster' page while it is typed. (POST, JSON)
+	Expects a JSON object with the pseudo code as 'code' and returns its Python code ('code'), the
+	syntax errors ('errors'), its number of blocks ('blocks') and the number of blocks that had to be
+	parsed ('parsed'), as only the blocks changed since the last request of the session are parsed. """
+	# Read the input pseudocode
+	try:
+		code = json.loads(request.body).get('code')
+	except (ValueError, AttributeError):
+		code = None
+	if not isinstance(code, str):
+		return JsonResponse({'error': "Expected a JSON object with the pseudo code as 'code'."}, status=400)
+
+	# the parsed blocks are kept per session, which is created on the first request
+	if request.session.session_key is None:
+		request.session.save()
+		request.session.modified = True # sends the session cookie
+
+	return JsonResponse(incremental_parser.getParser(request.session.session_key).parse(code))
+
+@csrf_exempt
+@require_POST
+def batch(request):
+	""" View function for analysing many pseudo codes at once. (POST, JSON)
+	Expects a JSON object with the list of pseudo codes as 'programs' and streams back one JSON
+	line per program, containing its 'index' in the list and its 'result', as soon as it was analysed. """
+	# Read the input pseudocodes
+	try:
+		programs = json.loads(request.body).get('programs')
+	except (ValueError, AttributeError):
+		programs = None
+	if not isinstance(programs, list) or not all(isinstance(code, str) for code in programs):
+		return JsonResponse({'error': "Expected a JSON object with a list of pseudo codes as 'programs'."}, status=400)
+
+	max_size = getattr(settings, 'BATCH_MAX_SIZE', batch_runner.MAX_SIZE)
+	if len(programs) > max_size:
+		return JsonResponse({'error': "At most " + str(max_size) + " programs can be analysed at once."}, status=400)
+
+	# forward the codes to Algobooster
+	lines = (json.dumps({'index': index, 'result': result}) + "\n" for (index, result) in batch_runner.runBatch(programs))
+	return StreamingHttpResponse(lines, content_type="application/x-ndjson")